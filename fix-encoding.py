@@ -1,135 +1,966 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import os
+import argparse
+import codecs
+import ctypes
+import ctypes.util
+import fnmatch
 import glob
+import hashlib
+import json
+import mmap
+import os
+import re
+import select
+import shutil
+import struct
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# numpy는 --discover 에서만 필요하므로 처음 쓸 때 가져온다 (import만 ~100ms)
+np = None
+
+# 재귀 모드 기본 대상/제외 패턴
+DEFAULT_INCLUDE = ['*.html', '*.js', '*.css', '*.sql', '*.md']
+DEFAULT_EXCLUDE = ['.git', 'node_modules', '__pycache__', '.venv', 'venv']
+
+# 증분 실행용 manifest (파일별 size/mtime/sha256 + 사용한 테이블 해시)
+DEFAULT_MANIFEST = '.fix-encoding-manifest.json'
+MANIFEST_VERSION = 1
+
+# 스트리밍 모드 기본 청크 크기 (1 MiB)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# --discover 결과 파일과 후보별 문맥 길이/예시 수
+DEFAULT_CANDIDATES = 'encoding-candidates.json'
+CONTEXT_CHARS = 20
+MAX_EXAMPLES = 3
+
+# --watch: inotify 이벤트 마스크 (linux/inotify.h)와 디바운스 기본값
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+INOTIFY_EVENT = struct.Struct('iIII')
+DEFAULT_DEBOUNCE = 0.3
+
+# 한글 매핑 테이블 (깨진 문자열 -> 올바른 문자열)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TABLE = os.path.join(SCRIPT_DIR, 'fix-encoding-table.json')
+
+
+def build_matcher(table):
+    """테이블의 키를 길이 내림차순 alternation 하나로 컴파일한다.
+
+    정규식 alternation은 같은 위치에서 앞쪽 후보부터 시도하므로, 긴 키를 앞에
+    두면 한 번의 왼쪽→오른쪽 스캔으로 leftmost-longest 매칭이 된다.
+    값이 키와 같은 항목은 바꿀 것이 없으므로 제외한다. str 키와 bytes 키 모두 지원.
+    """
+    keys = sorted((k for k, v in table.items() if k != v), key=len, reverse=True)
+    if not keys:
+        return re.compile(r'(?!)')
+    sep = b'|' if isinstance(keys[0], bytes) else '|'
+    return re.compile(sep.join(re.escape(k) for k in keys))
+
+
+def build_prefilter(table, markers=('?', '\ufffd')):
+    """모든 유효 키가 표지 문자(? 또는 U+FFFD) 중 하나를 포함하면 그 UTF-8 바이트를 반환.
+
+    표지가 없는 키가 하나라도 있으면 바이트 검사로 건너뛸 수 없으므로 None.
+    """
+    keys = [k for k, v in table.items() if k != v]
+    if all(any(m in k for m in markers) for k in keys):
+        return tuple(m.encode('utf-8') for m in markers)
+    return None
+
+
+def compile_table(table):
+    """테이블에서 매칭에 필요한 것들을 미리 계산한다 (키 100개 남짓이면 수 ms)"""
+    byte_table = {k.encode('utf-8'): v.encode('utf-8') for k, v in table.items() if k != v}
+    return {
+        'replacements': table,
+        'byte_replacements': byte_table,
+        'matcher': build_matcher(table),
+        'byte_matcher': build_matcher(byte_table),
+        'prefilter': build_prefilter(table),
+        'max_key_bytes': max(map(len, byte_table), default=1),
+    }
+
+
+def load_table(path=DEFAULT_TABLE):
+    """테이블 JSON 파일을 읽어 컴파일 결과를 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return compile_table(json.load(f))
+
+
+def use_table(path=DEFAULT_TABLE):
+    """테이블을 불러와 모듈 전역 매처를 교체한다. 워커 프로세스 initializer 로도 쓴다"""
+    global replacements, byte_replacements, matcher, byte_matcher, prefilter, max_key_bytes
+    global table_source
+    compiled = load_table(path)
+    table_source = (path,)
+    replacements = compiled['replacements']
+    byte_replacements = compiled['byte_replacements']
+    matcher = compiled['matcher']
+    byte_matcher = compiled['byte_matcher']
+    prefilter = compiled['prefilter']
+    max_key_bytes = compiled['max_key_bytes']
+
+
+use_table()
+
+# 비ASCII 바이트 구간. 유효성 검사는 이 짧은 구간들만 디코딩해서 확인한다
+NON_ASCII_RUN = re.compile(rb'[\x80-\xff]+')
+
+
+def may_contain_key(buf):
+    """원시 바이트(bytes/mmap)에 표지 바이트가 하나라도 있는지. 없으면 어떤 키도 매칭될 수 없다"""
+    if prefilter is None:
+        return True
+    return any(buf.find(marker) != -1 for marker in prefilter)
+
+
+def fix_text(content):
+    """한 번의 스캔으로 모든 키를 치환. (결과 문자열, 치환 횟수) 반환"""
+    return matcher.subn(lambda m: replacements[m.group()], content)
+
+
+def fix_bytes(buf):
+    """원시 바이트(bytes/mmap)에서 바이트 키를 직접 치환한다.
+
+    (첫 변경 오프셋, 그 오프셋부터 파일 끝까지의 새 바이트, 치환 횟수)를 반환하고,
+    바뀐 것이 없으면 (None, b'', 0). 첫 변경 앞부분은 복사하지 않는다.
+    """
+    pieces = []
+    first = None
+    last = 0
+    for m in byte_matcher.finditer(buf):
+        if first is None:
+            first = last = m.start()
+        pieces.append(buf[last:m.start()])
+        pieces.append(byte_replacements[m.group()])
+        last = m.end()
+    if first is None:
+        return None, b'', 0
+    pieces.append(buf[last:])
+    return first, b''.join(pieces), len(pieces) // 2
+
+
+def stream_fix(src, dst, chunk_size=DEFAULT_CHUNK_SIZE):
+    """src에서 청크 단위로 읽어 치환 결과를 dst에 쓴다. (치환 횟수, 출력 sha256) 반환.
+
+    각 버퍼는 이전 청크의 꼬리(가장 긴 키 길이 - 1 바이트)를 앞에 붙여 만든다.
+    시작 위치가 limit(버퍼 끝 - 겹침) 앞인 매칭은 가능한 가장 긴 키까지 버퍼 안에
+    들어오므로 leftmost-longest 판단이 전체 스캔과 같다. limit 이후는 다음 버퍼로
+    넘긴다. 메모리 사용량은 chunk_size + 겹침으로 파일 크기와 무관하다.
+    """
+    keep = max_key_bytes - 1
+    digest = hashlib.sha256()
+    hits = 0
+    carry = b''
+
+    def emit(data):
+        if data:
+            dst.write(data)
+            digest.update(data)
+
+    while True:
+        chunk = src.read(chunk_size)
+        eof = not chunk
+        buf = carry + chunk
+        limit = len(buf) if eof else max(0, len(buf) - keep)
+        pos = 0
+        for m in byte_matcher.finditer(buf):
+            if m.start() >= limit:
+                break
+            emit(buf[pos:m.start()])
+            emit(byte_replacements[m.group()])
+            pos = m.end()
+            hits += 1
+        end = max(pos, limit)
+        emit(buf[pos:end])
+        carry = buf[end:]
+        if eof:
+            return hits, digest.hexdigest()
+
+
+def undecodable_offsets(buf, block=1 << 16):
+    """UTF-8로 디코딩할 수 없는 바이트의 오프셋 목록 (버리지 않고 보고용).
 
-# 한글 매핑 테이블
-replacements = {
-    '?�주공업고등?�교': '전주공업고등학교',
-    '졸업???�트?�크': '졸업생 네트워크',
-    '로그??': '로그인',
-    '?�원가??': '회원가입',
-    '채용 ?�보': '채용 정보',
-    '?�문 ?�트?�킹': '동문 네트워킹',
-    '진로 ?�담': '진로 상담',
-    '로그?�웃': '로그아웃',
-    '?�?�보??': '대시보드',
-    '???�로??': '내 프로필',
-    '?�학??': '재학생',
-    '?�생??': '선생님',
-    '?�름': '이름',
-    '?�메??': '이메일',
-    '비�?번호': '비밀번호',
-    '?�력?�세??': '입력하세요',
-    '?�명???�력?�세??': '실명을 입력하세요',
-    '?�공?�인': '성공적인',
-    '지?�적??': '지속적인',
-    '?�장??': '성장을',
-    '지?�합?�다': '지원합니다',
-    '?��????�트?�크�??�해': '동문 네트워크를 통해',
-    '?�로??': '새로운',
-    '기회�?': '기회를',
-    '발견?�세??': '발견하세요',
-    '졸업???�록?�기': '졸업생 등록하기',
-    '?�사 ?�보 ?�록': '회사 정보 등록',
-    '?�재 주요 ?�황': '현재 주요 현황',
-    '?�시�??�데?�트': '실시간 업데이트',
-    '?�동 갱신': '자동 갱신',
-    '?�록 ?�생': '등록 학생',
-    '취업�?': '취업률',
-    '?�동 ?�원': '활동 회원',
-    '주요 ?�비??': '주요 서비스',
-    '?�양??': '다양한',
-    '지???�비?��?': '지원 서비스를',
-    '?�공?�니??': '제공합니다',
-    '취업 ?�보 ?�비??': '취업 정보 서비스',
-    '최신 채용 ?�보?�': '최신 채용 정보와',
-    '맞춤???�자�?': '맞춤형 일자리',
-    '추천??': '추천을',
-    '받아보세??': '받아보세요',
-    '?�후�?': '선후배',
-    '졸업?�들�?': '졸업생들과',
-    '?�결?�어': '연결되어',
-    '멘토�?': '멘토링',
-    '만들?�보?�요': '만들어보세요',
-    '?�문 ?�담?��?': '전문 상담교사와',
-    '?�담??': '상담을',
-    '?�생 교육 ?�로그램': '평생 교육 프로그램',
-    '기술 ?�렌?��?': '기술 트렌드와',
-    '?�무 ??��': '실무 역량',
-    '?�상 교육??': '향상 교육을',
-    '증명??': '증명서',
-    '발급': '발급',
-    '각종 증명?��?': '각종 증명서를',
-    '?�라?�으�?': '온라인으로',
-    '?�청?�고': '신청하고',
-    '발급받으?�요': '발급받으세요',
-    '경력 관�?': '경력 관리',
-    '개인 ?�력�?': '개인 이력과',
-    '경력 ?�황??': '경력 현황을',
-    '체계?�으�?': '체계적으로',
-    '관리합?�다': '관리합니다',
-    '?�공 ?�토�?': '성공 스토리',
-    '졸업?�들??': '졸업생들의',
-    '?�양???�공 ?��?�?': '다양한 성공 사례를',
-    '만나보세??': '만나보세요',
-    '?�주공고': '전주공고',
-    '?�자?�고': '이상 입력',
-    '8???�상 ?�력': '8자 이상 입력',
-    '?�문': '영문',
-    '?�자': '숫자',
-    '?�수문자': '특수문자',
-    '조합': '조합',
-    '비�?번호 ?�인': '비밀번호 확인',
-    '재입력': '재입력',
-    '?�화번호': '전화번호',
-    '?�번': '학번',
-    '?�공': '전공',
-    '?�공 ?�택': '전공 선택',
-    '기계�?': '기계과',
-    '?�기�?': '전기과',
-    '?�자�?': '전자과',
-    '?�동차과': '자동차과',
-    '건축�?': '건축과',
-    '졸업년도': '졸업년도',
-    '?�속 ?�과': '소속 학과',
-    '?�과 ?�택': '학과 선택',
-    '행정': '행정',
-    '직책': '직책',
-    '?�용?�관': '이용약관',
-    '개인?�보처리방침': '개인정보처리방침',
-    '?�의합?�다': '동의합니다',
-    '계정??': '계정이',
-    '?�으?�가??': '있으신가요',
-    '?�?': '예',
-}
-
-def fix_file(filepath):
+    대부분의 파일은 유효하므로 먼저 증분 디코더로 block 단위 검사만 한다 (사본은
+    블록 크기로 제한). 오류가 있을 때만 비ASCII 구간별로 위치를 찾는다.
+
+    오류가 있는 구간은 첫 오류 뒤를 memoryview 조각으로 한 번만 훑는다. 조각 끝에서
+    잘린 문자는 final=False 라 다음 조각으로 넘어가고, 조각 크기는 오류 직후 작게
+    시작해 성공할 때마다 두 배로 늘린다. 그래서 잘못된 바이트가 길게 이어져도 오류마다
+    조각 크기만큼만 디코딩·복사한다 (남은 구간 전체를 다시 디코딩하지 않음).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        original_content = content
-        for broken, correct in replacements.items():
-            content = content.replace(broken, correct)
-        
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"Fixed: {os.path.basename(filepath)}")
-            return True
+        for base in range(0, len(buf), block):
+            decoder.decode(buf[base:base + block], final=base + block >= len(buf))
+        return []
+    except UnicodeDecodeError:
+        pass
+
+    offsets = []
+    for run in NON_ASCII_RUN.finditer(buf):
+        chunk = run.group()
+        try:
+            chunk.decode('utf-8')           # 대부분의 구간은 한 번에 통과
+            continue
+        except UnicodeDecodeError as e:
+            offsets.append(run.start() + e.start)
+            pos = e.end
+        view = memoryview(chunk)
+        size, end = 16, len(view)
+        while pos < end:
+            try:
+                _, used = codecs.utf_8_decode(view[pos:pos + size], 'strict', pos + size >= end)
+                pos += used
+                size = min(size * 2, block)
+            except UnicodeDecodeError as e:
+                offsets.append(run.start() + pos + e.start)
+                pos += e.end
+                size = 16
+    return offsets
+
+
+def legacy_fix_text(content):
+    """기존 방식: 키마다 content.replace()를 한 번씩 (처리량 비교용)"""
+    for broken, correct in replacements.items():
+        content = content.replace(broken, correct)
+    return content
+
+
+def sha256_file(filepath):
+    """파일 내용의 sha256 (mmap으로 읽어 사본을 만들지 않음)"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b'').hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def fix_file(filepath, compare=False, known_sha256=None, mode='text',
+             chunk_size=DEFAULT_CHUNK_SIZE):
+    """파일 하나를 복구하고 처리 결과를 dict로 반환
+
+    known_sha256: manifest에 깨끗한 상태로 기록된 내용 해시. stat은 달라졌지만
+    내용이 같으면(touch, git checkout 등) 스캔 없이 깨끗한 것으로 처리한다.
+
+    파일은 먼저 mmap으로 열어 표지 바이트(EF BF BD, ?)를 찾는다. 표지가 없으면
+    디코딩된 사본을 만들지 않고 바로 깨끗한 것으로 반환한다.
+
+    mode:
+      'text'   errors='ignore'로 디코딩해 치환하고 파일 전체를 다시 쓴다 (기존 방식)
+      'bytes'  디코딩/재인코딩 없이 바이트 키로 직접 치환하고 첫 변경 지점부터만
+               다시 쓴다. 디코딩할 수 없는 바이트는 보존하고 'undecodable'에 보고한다.
+      'stream' chunk_size 단위로 읽어 임시 파일에 쓴 뒤 원자적으로 교체한다.
+               큰 파일용으로, 메모리 사용량이 파일 크기와 무관하다.
+    """
+    result = {'path': filepath, 'changed': False, 'bytes': 0, 'hits': 0,
+              'seconds': 0.0, 'legacy_seconds': 0.0, 'error': None,
+              'sha256': None, 'clean': False, 'scanned': False, 'prefiltered': False,
+              'undecodable': []}
+    try:
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            result['bytes'] = size
+            if size == 0:
+                result.update(sha256=hashlib.sha256(b'').hexdigest(), clean=True, prefiltered=True)
+                return result
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                result['sha256'] = hashlib.sha256(mm).hexdigest()
+                if known_sha256 and result['sha256'] == known_sha256:
+                    result['clean'] = True
+                    return result
+                # --compare는 두 엔진을 같은 입력으로 재야 하므로 prefilter를 쓰지 않는다
+                if not compare and not may_contain_key(mm):
+                    result.update(clean=True, prefiltered=True)
+                    return result
+                if mode == 'bytes':
+                    edit = _scan_bytes(mm, result, compare)
+                elif mode == 'text':
+                    raw = mm[:]
+        if mode == 'stream':
+            _repair_stream(filepath, result, chunk_size)
+        elif mode == 'bytes':
+            _apply_bytes(filepath, edit, result)
         else:
-            print(f"No changes: {os.path.basename(filepath)}")
-            return False
+            _repair_text(filepath, raw, result, compare)
     except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+        result['error'] = str(e)
+    return result
+
+
+def _repair_text(filepath, raw, result, compare):
+    """기존 텍스트 모드: errors='ignore'로 디코딩해 치환 후 파일 전체를 다시 쓴다"""
+    content = raw.decode('utf-8', errors='ignore')
+    result['scanned'] = True
+
+    start = time.perf_counter()
+    fixed, hits = fix_text(content)
+    result['seconds'] = time.perf_counter() - start
+    result['hits'] = hits
+
+    if compare:
+        start = time.perf_counter()
+        legacy_fix_text(content)
+        result['legacy_seconds'] = time.perf_counter() - start
+
+    if fixed != content:
+        data = fixed.encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        result['changed'] = True
+        result['sha256'] = hashlib.sha256(data).hexdigest()
+    # 치환 결과가 다시 키를 만들 수도 있으므로 바뀐 파일만 한 번 더 확인
+    result['clean'] = not hits or matcher.search(fixed) is None
+
+
+def _scan_bytes(mm, result, compare):
+    """원시 바이트 모드의 스캔 단계 (mmap이 열려 있는 동안 실행).
+
+    (첫 변경 오프셋, 새 꼬리 바이트, 재검사용 앞부분 일부)를 반환한다.
+    """
+    result['scanned'] = True
+    result['undecodable'] = undecodable_offsets(mm)
+
+    start = time.perf_counter()
+    first, tail, hits = fix_bytes(mm)
+    result['seconds'] = time.perf_counter() - start
+    result['hits'] = hits
+
+    if compare:
+        content = mm[:].decode('utf-8', errors='ignore')
+        start = time.perf_counter()
+        legacy_fix_text(content)
+        result['legacy_seconds'] = time.perf_counter() - start
+
+    lead = mm[max(0, first - max_key_bytes):first] if first is not None else b''
+    return first, tail, lead
+
+
+def _apply_bytes(filepath, edit, result):
+    """같은 디렉터리의 임시 파일에 (변경 없는 앞부분 + 새 꼬리)를 쓰고 rename으로 교체.
+
+    중간에 죽거나 디스크가 차도 원본은 그대로 남는다. 앞부분은 치환 없이 청크 단위로
+    복사만 하고, 쓰는 동안 sha256 을 함께 계산해 파일을 다시 읽지 않는다.
+    """
+    first, tail, lead = edit
+    if first is None:
+        result['clean'] = True
+        return
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp = tempfile.mkstemp(prefix='.fix-encoding-', dir=directory)
+    try:
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            remaining = first
+            while remaining:
+                block = src.read(min(DEFAULT_CHUNK_SIZE, remaining))
+                if not block:
+                    raise OSError(f'{filepath}: 스캔 중 파일이 줄어들었습니다')
+                digest.update(block)
+                dst.write(block)
+                remaining -= len(block)
+            digest.update(tail)
+            dst.write(tail)
+        shutil.copymode(filepath, tmp)
+        os.replace(tmp, filepath)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    result['changed'] = True
+    result['sha256'] = digest.hexdigest()
+    # 변경 앞부분에는 매칭이 없었으므로, 경계를 걸친 새 매칭만 확인하면 된다
+    result['clean'] = byte_matcher.search(lead + tail) is None
+
+
+def _repair_stream(filepath, result, chunk_size):
+    """스트리밍 모드: 같은 디렉터리의 임시 파일에 쓰고 바뀐 경우에만 rename으로 교체"""
+    result['scanned'] = True
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp = tempfile.mkstemp(prefix='.fix-encoding-', dir=directory)
+    try:
+        start = time.perf_counter()
+        with open(filepath, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            hits, digest = stream_fix(src, dst, chunk_size)
+        result['seconds'] = time.perf_counter() - start
+        result['hits'] = hits
+        clean = True
+        if hits:
+            # 치환 결과가 다시 키를 만들 수도 있으므로 교체 전에 출력을 한 번 훑는다
+            # (mmap 이라 메모리 사용량은 여전히 파일 크기와 무관)
+            with open(tmp, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                clean = byte_matcher.search(mm) is None
+            shutil.copymode(filepath, tmp)
+            os.replace(tmp, filepath)
+            result['changed'] = True
+            result['sha256'] = digest
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    result['clean'] = clean
+
+
+def table_hash(table):
+    """매핑 테이블 내용의 sha256 (키 순서와 무관)"""
+    data = json.dumps(sorted(table.items()), ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    """manifest 로드. 없거나 손상됐거나 버전이 다르면 빈 manifest"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'tables': {}, 'files': {}}
+
+
+def save_manifest(manifest, path):
+    """참조되지 않는 테이블 기록을 정리하고 임시 파일 + rename으로 원자적으로 저장"""
+    used = {entry['table'] for entry in manifest['files'].values()}
+    manifest['tables'] = {h: keys for h, keys in manifest['tables'].items() if h in used}
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _still_clean(entry, manifest, current_table, active_keys):
+    """entry가 현재 테이블 기준으로도 깨끗한지.
+
+    깨끗한 파일에는 예전 테이블의 키가 하나도 없으므로, 새로 추가된 키가 없다면
+    (키 삭제나 값 변경뿐이라면) 다시 스캔할 필요가 없다.
+    """
+    if entry['table'] == current_table:
+        return True
+    old_keys = manifest['tables'].get(entry['table'])
+    return old_keys is not None and not (active_keys - set(old_keys))
+
+
+def plan_files(files, manifest):
+    """manifest로 작업 대상을 고른다. (처리할 [(path, known_sha256)], 건너뛴 파일 수)
+
+    size와 mtime이 기록과 같고 현재 테이블 기준으로 깨끗한 파일은 열지 않는다.
+    stat만 달라진 파일은 내용 해시를 넘겨 워커가 스캔을 생략할 수 있게 한다.
+    """
+    current = table_hash(replacements)
+    active_keys = {k for k, v in replacements.items() if k != v}
+    pending = []
+    skipped = 0
+    for path in files:
+        entry = manifest['files'].get(os.path.abspath(path))
+        if not entry or not entry['clean'] or not _still_clean(entry, manifest, current, active_keys):
+            pending.append((path, None))
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            pending.append((path, None))
+            continue
+        if st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']:
+            skipped += 1
+        else:
+            pending.append((path, entry['sha256']))
+    return pending, skipped
+
+
+def update_manifest(manifest, results):
+    """처리 결과의 최종 stat/해시를 현재 테이블 해시와 함께 기록"""
+    current = table_hash(replacements)
+    manifest['tables'][current] = sorted(k for k, v in replacements.items() if k != v)
+    for result in results:
+        key = os.path.abspath(result['path'])
+        if result['error']:
+            manifest['files'].pop(key, None)
+            continue
+        try:
+            st = os.stat(result['path'])
+        except OSError:
+            manifest['files'].pop(key, None)
+            continue
+        manifest['files'][key] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': result['sha256'],
+            'clean': result['clean'],
+            'table': current,
+        }
+
+
+# 한글 음절/?/U+FFFD 로만 이루어진 구간 중 U+FFFD 이거나 뒤에 같은 종류가 붙은 ?를 포함하는 것
+SUSPECT_RUN = re.compile('[\uac00-\ud7a3?\ufffd]*(?:\ufffd|\\?[\uac00-\ud7a3?\ufffd])[\uac00-\ud7a3?\ufffd]*')
+
+
+def _import_numpy():
+    """numpy 모듈 (없으면 None)"""
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # numpy가 없으면 정규식 스캔으로 대체
+            np = False
+    return np or None
+
+
+def _suspect_runs_numpy(text):
+    """코드 포인트 배열에 대한 벡터 연산으로 의심 구간 (start, end) 목록을 구한다"""
+    cp = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+    hangul = (cp >= 0xAC00) & (cp <= 0xD7A3)
+    fffd = cp == 0xFFFD
+    qmark = cp == 0x3F
+    member = hangul | fffd | qmark
+    next_member = np.zeros_like(member)
+    next_member[:-1] = member[1:]
+    suspect = fffd | (qmark & next_member)
+
+    edges = np.diff(member.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    suspect_cum = np.concatenate(([0], np.cumsum(suspect)))
+    strong_cum = np.concatenate(([0], np.cumsum(hangul | fffd)))
+    keep = ((suspect_cum[ends] > suspect_cum[starts])
+            & (strong_cum[ends] > strong_cum[starts]))
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+def _suspect_runs_regex(text):
+    """numpy가 없을 때의 같은 결과를 내는 정규식 스캔"""
+    return [m.span() for m in SUSPECT_RUN.finditer(text)
+            if any(c == '\ufffd' or '\uac00' <= c <= '\ud7a3' for c in m.group())]
+
+
+def suspect_runs(text):
+    """한글 문맥 안에서 U+FFFD / ? 가 섞인 구간 (start, end) 목록.
+
+    한글·?·U+FFFD 로만 된 최대 구간 중 U+FFFD 나 '?+한글' 같은 깨짐 흔적이 있고,
+    한글이나 U+FFFD 가 하나 이상 들어 있는 것만 고른다 ('a ?? b', '요?' 는 제외).
+    """
+    if _import_numpy() is not None:
+        return _suspect_runs_numpy(text)
+    return _suspect_runs_regex(text)
+
+
+def _pool(workers):
+    """현재 테이블을 워커에서도 쓰도록 initializer 를 건 프로세스 풀 (spawn 방식 대비)"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=use_table, initargs=table_source)
+
+
+def discover_file(filepath):
+    """테이블로 고친 뒤에도 남는 의심 구간을 [(구간, 문맥), ...] 으로 반환"""
+    try:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return []
+    if b'\xef\xbf\xbd' not in raw and b'?' not in raw:
+        return []
+    # errors='replace': 디코딩 불가 바이트도 U+FFFD 로 드러나게 한다
+    text, _ = fix_text(raw.decode('utf-8', errors='replace'))
+    found = []
+    for start, end in suspect_runs(text):
+        left = text[max(0, start - CONTEXT_CHARS):start].rsplit('\n', 1)[-1]
+        right = text[end:end + CONTEXT_CHARS].split('\n', 1)[0]
+        found.append((text[start:end], f'{left}⟦{text[start:end]}⟧{right}'))
+    return found
+
+
+def discover(files, jobs=1):
+    """파일들에서 알려지지 않은 깨짐 구간을 모아 빈도순 후보 목록으로 반환"""
+    if jobs > 1 and len(files) > 1:
+        with _pool(min(jobs, len(files))) as pool:
+            per_file = list(pool.map(discover_file, files, chunksize=8))
+    else:
+        per_file = [discover_file(path) for path in files]
+
+    counts = Counter()
+    where = {}
+    examples = {}
+    for path, found in zip(files, per_file):
+        for broken, context in found:
+            counts[broken] += 1
+            where.setdefault(broken, set()).add(os.path.normpath(path))
+            ctx = examples.setdefault(broken, [])
+            if len(ctx) < MAX_EXAMPLES and context not in ctx:
+                ctx.append(context)
+    return [{'broken': broken, 'count': count, 'files': sorted(where[broken]),
+             'contexts': examples[broken]}
+            for broken, count in counts.most_common()]
+
+
+def write_candidates(candidates, path):
+    """후보를 JSON으로 저장. proposed_entries 는 값을 채워 테이블에 옮길 수 있는 형태"""
+    data = {
+        'table': table_hash(replacements),
+        'proposed_entries': {c['broken']: '' for c in candidates},
+        'candidates': candidates,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _matches(relpath, patterns):
+    """상대 경로 전체나 파일/디렉터리 이름이 패턴 중 하나와 맞으면 True"""
+    name = os.path.basename(relpath)
+    return any(fnmatch.fnmatch(relpath, pat) or fnmatch.fnmatch(name, pat)
+               for pat in patterns)
+
+
+def collect_files(roots, include, exclude):
+    """roots 아래를 재귀 탐색해 include에 맞고 exclude에 걸리지 않는 파일 목록 반환"""
+    files = []
+    for root in roots:
+        if os.path.isfile(root):
+            files.append(os.path.normpath(root))
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root)
+            dirnames[:] = sorted(d for d in dirnames
+                                 if not _matches(os.path.normpath(os.path.join(rel_dir, d)), exclude))
+            for name in sorted(filenames):
+                rel = os.path.normpath(os.path.join(rel_dir, name))
+                if _matches(rel, include) and not _matches(rel, exclude):
+                    files.append(os.path.normpath(os.path.join(dirpath, name)))
+    return files
+
+
+def run_files(tasks, jobs=1, compare=False, mode='text', chunk_size=DEFAULT_CHUNK_SIZE,
+              stream_above=None):
+    """(path, known_sha256) 작업들을 처리하고 결과 목록을 반환.
+
+    jobs > 1 이면 프로세스 풀에 분배한다. 가장 큰 파일부터 제출해 전체 소요
+    시간이 가장 느린 파일 하나에 가깝게 맞춘다. stream_above(바이트)보다 큰
+    파일은 mode와 관계없이 스트리밍 모드로 처리한다.
+    """
+    def size_of(path):
+        # 없거나 읽을 수 없는 파일은 0 으로 보고 fix_file 이 다른 잘못된 경로처럼 오류를 보고하게 둔다
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def mode_for(path):
+        if stream_above is not None and size_of(path) > stream_above:
+            return 'stream'
+        return mode
+
+    def options(path, known):
+        return {'compare': compare, 'known_sha256': known,
+                'mode': mode_for(path), 'chunk_size': chunk_size}
+
+    if jobs <= 1 or len(tasks) <= 1:
+        return [fix_file(path, **options(path, known)) for path, known in tasks]
+
+    ordered = sorted(tasks, key=lambda task: size_of(task[0]), reverse=True)
+    results = []
+    with _pool(min(jobs, len(tasks))) as pool:
+        futures = [pool.submit(fix_file, path, **options(path, known))
+                   for path, known in ordered]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda r: r['path'])
+    return results
+
+
+def _inotify_init():
+    """libc inotify 를 연다. (libc, fd) 를 반환하고, Linux가 아니거나 실패하면 (None, None)"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None, None
+    return (libc, fd) if fd >= 0 else (None, None)
+
+
+def _inotify_events(fd):
+    """읽을 수 있는 inotify 이벤트를 모두 읽어 [(wd, mask, name), ...] 으로 반환"""
+    events = []
+    while True:
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class Watcher:
+    """--watch: 저장된 파일 하나만 메모리에 올라와 있는 매처로 바로 복구한다.
+
+    Linux에서는 inotify(ctypes)로 디렉터리를 감시하고, 그 외 환경에서는 stat 폴링으로
+    대체한다. 같은 파일에 대한 연속 쓰기는 debounce 초 동안 모았다가 한 번만 처리하고,
+    직접 쓴 결과의 (size, mtime)을 기억해 자기 쓰기로 생긴 이벤트는 무시한다.
+    """
+
+    def __init__(self, roots, include, exclude, debounce=DEFAULT_DEBOUNCE, mode='text',
+                 manifest=None, manifest_path=None):
+        self.roots = roots
+        self.include = include
+        self.exclude = exclude
+        self.debounce = debounce
+        self.mode = mode
+        self.manifest = manifest
+        self.manifest_path = manifest_path
+        self.own_writes = {}
+
+    def wanted(self, root, path):
+        rel = os.path.normpath(os.path.relpath(path, root))
+        return _matches(rel, self.include) and not _matches(rel, self.exclude)
+
+    def handle(self, path):
+        """디바운스가 끝난 파일 하나를 복구"""
+        key = _stat_key(path)
+        if key is None or self.own_writes.get(path) == key:
+            return
+        result = fix_file(path, mode=self.mode)
+        if result['error']:
+            print(f"Error processing {path}: {result['error']}", flush=True)
+            return
+        if result['changed']:
+            self.own_writes[path] = _stat_key(path)
+            print(f"Fixed: {path} ({result['hits']} replacements, "
+                  f"{result['seconds'] * 1e6:.0f} µs)", flush=True)
+        if self.manifest is not None:
+            update_manifest(self.manifest, [result])
+            save_manifest(self.manifest, self.manifest_path)
+
+    def run(self):
+        libc, fd = _inotify_init()
+        if fd is None:
+            print('inotify unavailable, falling back to polling', flush=True)
+            return self._run_polling()
+        try:
+            return self._run_inotify(libc, fd)
+        finally:
+            os.close(fd)
+
+    def _run_inotify(self, libc, fd):
+        watches = {}
+
+        def add_tree(root, top):
+            for dirpath, dirnames, _ in os.walk(top):
+                rel_dir = os.path.relpath(dirpath, root)
+                dirnames[:] = [d for d in dirnames
+                               if not _matches(os.path.normpath(os.path.join(rel_dir, d)), self.exclude)]
+                wd = libc.inotify_add_watch(fd, os.fsencode(dirpath), WATCH_MASK)
+                if wd >= 0:
+                    watches[wd] = (root, dirpath)
+
+        for root in self.roots:
+            add_tree(root, root)
+        print(f"Watching {len(watches)} directories (inotify, debounce {self.debounce}s)", flush=True)
+
+        pending = {}
+        while True:
+            now = time.monotonic()
+            timeout = max(0.0, min(pending.values()) - now) if pending else None
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if ready:
+                for wd, mask, name in _inotify_events(fd):
+                    if mask & IN_Q_OVERFLOW:
+                        # 이벤트 유실: 감시 대상 전체를 다시 확인
+                        for path in collect_files(self.roots, self.include, self.exclude):
+                            pending[path] = time.monotonic() + self.debounce
+                        continue
+                    if wd not in watches or not name:
+                        continue
+                    root, dirpath = watches[wd]
+                    path = os.path.normpath(os.path.join(dirpath, name))
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            add_tree(root, path)
+                    elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and self.wanted(root, path):
+                        pending[path] = time.monotonic() + self.debounce
+            now = time.monotonic()
+            for path in [p for p, due in pending.items() if due <= now]:
+                del pending[path]
+                self.handle(path)
+
+    def _run_polling(self):
+        seen = {path: _stat_key(path)
+                for path in collect_files(self.roots, self.include, self.exclude)}
+        print(f"Watching {len(seen)} files (polling every {self.debounce}s)", flush=True)
+        while True:
+            time.sleep(self.debounce)
+            for path in collect_files(self.roots, self.include, self.exclude):
+                key = _stat_key(path)
+                if key is not None and seen.get(path) != key:
+                    self.handle(path)
+                    seen[path] = _stat_key(path)
+
+
+def throughput(nbytes, seconds):
+    """MB/s (측정 시간이 0이면 inf)"""
+    return nbytes / seconds / 1e6 if seconds > 0 else float('inf')
+
+
+def report(results, elapsed, jobs, compare=False, skipped=0):
+    """파일별 결과와 전체 요약 출력. 복구된 파일 수를 반환"""
+    fixed_count = 0
+    error_count = 0
+    prefiltered = 0
+    total_bytes = 0
+    total_seconds = 0.0
+    legacy_seconds = 0.0
+    for result in results:
+        path = result['path']
+        if result['error']:
+            error_count += 1
+            print(f"Error processing {path}: {result['error']}")
+            continue
+        if result['changed']:
+            fixed_count += 1
+            print(f"Fixed: {path} ({result['hits']} replacements)")
+        else:
+            print(f"No changes: {path}")
+        if result['undecodable']:
+            offsets = ', '.join(str(o) for o in result['undecodable'][:5])
+            more = ' ...' if len(result['undecodable']) > 5 else ''
+            print(f"  Undecodable bytes: {len(result['undecodable'])} (offsets {offsets}{more}), left untouched")
+        if result['prefiltered']:
+            prefiltered += 1
+        if not result['scanned']:
+            continue
+        total_bytes += result['bytes']
+        total_seconds += result['seconds']
+        legacy_seconds += result['legacy_seconds']
+
+    print(f"\nTotal files fixed: {fixed_count} / {len(results) + skipped}"
+          + (f" ({error_count} errors)" if error_count else ''))
+    if skipped:
+        print(f"Skipped (unchanged, clean per manifest): {skipped}")
+    if prefiltered:
+        print(f"Prefiltered (no marker bytes, not decoded): {prefiltered}")
+    if total_bytes:
+        print(f"Throughput: {throughput(total_bytes, total_seconds):.1f} MB/s "
+              f"({total_bytes / 1e6:.2f} MB, single-pass matcher)")
+    if compare and legacy_seconds:
+        print(f"Legacy loop: {throughput(total_bytes, legacy_seconds):.1f} MB/s "
+              f"({len(replacements)} x str.replace)")
+    print(f"Elapsed: {elapsed:.2f}s ({jobs} worker{'s' if jobs > 1 else ''})")
+    return fixed_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='깨진 한글(mojibake) 복구')
+    parser.add_argument('paths', nargs='*',
+                        help='처리할 파일 (기본값: 현재 디렉터리의 *.html). '
+                             '-r 사용 시 탐색할 디렉터리 (기본값: .)')
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help='디렉터리를 재귀 탐색하고 프로세스 풀로 병렬 처리')
+    parser.add_argument('--include', action='append', metavar='GLOB',
+                        help=f'재귀 모드 대상 패턴 (반복 가능, 기본값: {" ".join(DEFAULT_INCLUDE)})')
+    parser.add_argument('--exclude', action='append', metavar='GLOB',
+                        help=f'재귀 모드 제외 패턴 (반복 가능, 기본값: {" ".join(DEFAULT_EXCLUDE)})')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='워커 프로세스 수 (기본값: -r 이면 CPU 코어 수, 아니면 1)')
+    parser.add_argument('--table', default=DEFAULT_TABLE, metavar='PATH',
+                        help='매핑 테이블 JSON 파일 (기본값: 스크립트 옆 fix-encoding-table.json)')
+    parser.add_argument('--compare', action='store_true',
+                        help='기존 str.replace 루프와 처리량(MB/s) 비교')
+    parser.add_argument('--bytes', dest='mode', action='store_const', const='bytes', default='text',
+                        help='디코딩 없이 원시 바이트에서 치환하고 임시 파일에 써서 원자적으로 교체 '
+                             '(디코딩 불가 바이트는 보존하고 보고)')
+    parser.add_argument('--stream', dest='mode', action='store_const', const='stream',
+                        help='청크 단위로 읽어 임시 파일에 쓰고 원자적으로 교체 (큰 파일용)')
+    parser.add_argument('--stream-above', type=float, metavar='MB',
+                        help='이 크기(MB)보다 큰 파일만 스트리밍 모드로 처리')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, metavar='BYTES',
+                        help=f'스트리밍 모드 청크 크기 (기본값: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--watch', action='store_true',
+                        help='종료하지 않고 경로(기본값: .)를 감시하며 저장된 파일만 바로 복구 '
+                             '(Linux: inotify, 그 외: 폴링)')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE, metavar='SECONDS',
+                        help=f'--watch 에서 연속 쓰기를 모으는 시간 (기본값: {DEFAULT_DEBOUNCE})')
+    parser.add_argument('--discover', action='store_true',
+                        help='파일을 고치지 않고 테이블에 없는 깨진 구간을 찾아 후보 파일로 저장 '
+                             '(후보가 있으면 종료 코드 1)')
+    parser.add_argument('--candidates', default=DEFAULT_CANDIDATES, metavar='PATH',
+                        help=f'--discover 결과 파일 (기본값: {DEFAULT_CANDIDATES})')
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST, metavar='PATH',
+                        help=f'증분 실행용 manifest 파일 (기본값: {DEFAULT_MANIFEST})')
+    parser.add_argument('--no-manifest', action='store_true',
+                        help='manifest를 읽거나 쓰지 않고 모든 파일을 스캔')
+    args = parser.parse_args(argv)
+
+    if args.table != DEFAULT_TABLE:
+        use_table(args.table)
+
+    if args.recursive:
+        files = collect_files(args.paths or ['.'],
+                              args.include or DEFAULT_INCLUDE,
+                              args.exclude or DEFAULT_EXCLUDE)
+        jobs = args.jobs or os.cpu_count() or 1
+    else:
+        files = args.paths or glob.glob('*.html')
+        jobs = args.jobs or 1
+
+    if args.watch:
+        manifest = None if args.no_manifest else load_manifest(args.manifest)
+        watcher = Watcher(args.paths or ['.'], args.include or DEFAULT_INCLUDE,
+                          args.exclude or DEFAULT_EXCLUDE, debounce=args.debounce,
+                          mode=args.mode,
+                          manifest=manifest, manifest_path=args.manifest)
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    start = time.perf_counter()
+    if args.discover:
+        candidates = discover(files, jobs=jobs)
+        write_candidates(candidates, args.candidates)
+        for c in candidates[:20]:
+            print(f"{c['count']:5d}  {c['broken']!r}  {c['contexts'][0]}")
+        print(f"\nUnknown broken runs: {len(candidates)} in {len(files)} files "
+              f"({time.perf_counter() - start:.2f}s, "
+              f"{'numpy' if _import_numpy() is not None else 'regex'} scan) -> {args.candidates}")
+        return 1 if candidates else 0
+
+    # --compare는 모든 파일을 재야 하므로 manifest로 건너뛰지 않는다
+    use_manifest = not args.no_manifest
+    manifest = load_manifest(args.manifest) if use_manifest else None
+    if manifest and not args.compare:
+        tasks, skipped = plan_files(files, manifest)
+    else:
+        tasks, skipped = [(path, None) for path in files], 0
+
+    stream_above = int(args.stream_above * 1e6) if args.stream_above is not None else None
+    results = run_files(tasks, jobs=jobs, compare=args.compare, mode=args.mode,
+                        chunk_size=args.chunk_size, stream_above=stream_above)
+    if manifest is not None:
+        update_manifest(manifest, results)
+        save_manifest(manifest, args.manifest)
+    report(results, time.perf_counter() - start, jobs,
+           compare=args.compare, skipped=skipped)
+    return 0
 
-# Process all HTML files
-html_files = glob.glob('*.html')
-fixed_count = 0
-for html_file in html_files:
-    if fix_file(html_file):
-        fixed_count += 1
 
-print(f"\nTotal files fixed: {fixed_count}")
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""
+fix-encoding.py 벤치마크 - 합성 코퍼스 생성 + 모드별 처리량 측정
+실행: python3 scripts/bench-fix-encoding.py [--files 200] [--size-kb 64] [--density 2]
+결과: bench-fix-encoding.json 에 커밋별로 누적 (같은 파라미터의 직전 기록과 비교 출력)
+     peak_rss_self_kb 는 케이스를 돌린 프로세스, peak_rss_workers_kb 는 그 프로세스가 띄운
+     워커 중 가장 큰 것 (parallel 만 해당), peak_rss_kb 는 둘 중 큰 값 (단일 프로세스 최대 RSS)
+"""
+
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FILE = os.path.join(BASE_DIR, 'bench-fix-encoding.json')
+
+# 하이픈이 들어간 파일명이라 import 문 대신 경로로 불러온다.
+# sys.modules 에 등록해 두어야 워커 프로세스로 함수를 넘길 때 pickle 이 찾을 수 있다
+_spec = importlib.util.spec_from_file_location('fix_encoding', os.path.join(BASE_DIR, 'fix-encoding.py'))
+fe = importlib.util.module_from_spec(_spec)
+sys.modules['fix_encoding'] = fe
+_spec.loader.exec_module(fe)
+
+CASES = ['legacy', 'text', 'bytes', 'stream', 'parallel']
+
+
+# ─────────────────────────── 코퍼스 ────────────────────────────
+
+def build_corpus(out_dir, files, size_kb, density, seed):
+    """실제 *.html 페이지를 잘라 붙이고 테이블 키를 섞어 넣은 합성 파일을 만든다.
+
+    density: 1 KB 당 삽입할 깨진 키 개수 (0 이면 깨끗한 파일만)
+    """
+    rng = random.Random(seed)
+    pages = []
+    for path in sorted(glob.glob(os.path.join(BASE_DIR, '*.html'))):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            pages.append(f.read())
+    base = '\n'.join(pages)
+    keys = [k for k, v in fe.replacements.items() if k != v]
+    target = size_kb * 1024
+
+    os.makedirs(out_dir, exist_ok=True)
+    for i in range(files):
+        parts = []
+        size = 0
+        while size < target:
+            start = rng.randrange(0, max(1, len(base) - 4096))
+            piece = base[start:start + rng.randint(512, 4096)]
+            parts.append(piece)
+            size += len(piece.encode('utf-8'))
+        text = ''.join(parts)
+        n_keys = int(len(text.encode('utf-8')) / 1024 * density)
+        if n_keys and keys:
+            cuts = sorted(rng.randrange(len(text)) for _ in range(n_keys))
+            pieces, last = [], 0
+            for cut in cuts:
+                pieces.append(text[last:cut])
+                pieces.append(rng.choice(keys))
+                last = cut
+            pieces.append(text[last:])
+            text = ''.join(pieces)
+        with open(os.path.join(out_dir, f'page_{i:05d}.html'), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+# ─────────────────────────── 측정 ────────────────────────────
+
+def legacy_fix_file(filepath):
+    """기존 fix_file(): errors='ignore' 디코딩 + 키마다 str.replace + 전체 다시 쓰기"""
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    fixed = fe.legacy_fix_text(content)
+    if fixed != content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(fixed)
+        return True
+    return False
+
+
+def peak_rss_kb(who=resource.RUSAGE_SELF):
+    """최대 RSS (KB). macOS 의 ru_maxrss 는 바이트 단위.
+    RUSAGE_CHILDREN 은 종료·회수된 자식 프로세스 중 가장 큰 값이다 (합계가 아님)."""
+    rss = resource.getrusage(who).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def run_case(case, work_dir):
+    """새 프로세스에서 한 케이스를 실행 (최대 RSS 를 케이스별로 분리하기 위해)"""
+    files = sorted(glob.glob(os.path.join(work_dir, '*.html')))
+    total_bytes = sum(os.path.getsize(p) for p in files)
+    start = time.perf_counter()
+    if case == 'legacy':
+        changed = sum(legacy_fix_file(p) for p in files)
+    elif case == 'parallel':
+        results = fe.run_files([(p, None) for p in files], jobs=os.cpu_count() or 1)
+        changed = sum(r['changed'] for r in results)
+    else:
+        changed = sum(fe.fix_file(p, mode=case)['changed'] for p in files)
+    seconds = time.perf_counter() - start
+    return {
+        'seconds': round(seconds, 4),
+        'files_per_s': round(len(files) / seconds, 1) if seconds else None,
+        'mb_per_s': round(total_bytes / seconds / 1e6, 2) if seconds else None,
+        'peak_rss_kb': max(peak_rss_kb(), peak_rss_kb(resource.RUSAGE_CHILDREN)),
+        'peak_rss_self_kb': peak_rss_kb(),
+        # run_files 의 프로세스 풀은 반환 전에 닫혀 워커가 회수되므로 여기서 잡힌다
+        'peak_rss_workers_kb': peak_rss_kb(resource.RUSAGE_CHILDREN),
+        'changed': changed,
+    }
+
+
+def measure(case, template_dir, repeat):
+    """코퍼스 사본에서 repeat 번 실행해 가장 빠른 결과를 반환 (사본 복사 시간 제외)"""
+    best = None
+    for _ in range(repeat):
+        work_dir = tempfile.mkdtemp(prefix=f'bench-{case}-')
+        try:
+            shutil.rmtree(work_dir)
+            shutil.copytree(template_dir, work_dir)
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result = pool.submit(run_case, case, work_dir).result()
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_results(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+# ─────────────────────────── 메인 ────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description='fix-encoding.py 처리량 벤치마크')
+    parser.add_argument('--files', type=int, default=200, help='합성 파일 수')
+    parser.add_argument('--size-kb', type=int, default=64, help='파일당 크기 (KB)')
+    parser.add_argument('--density', type=float, default=2.0, help='KB 당 깨진 키 개수')
+    parser.add_argument('--seed', type=int, default=1, help='코퍼스 난수 시드')
+    parser.add_argument('--repeat', type=int, default=3, help='케이스별 반복 횟수 (최소값 기록)')
+    parser.add_argument('--cases', default=','.join(CASES), help=f'측정할 케이스 ({",".join(CASES)})')
+    parser.add_argument('--output', default=RESULTS_FILE, help='결과 JSON 파일')
+    args = parser.parse_args()
+
+    cases = [c for c in args.cases.split(',') if c]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f'알 수 없는 케이스: {", ".join(sorted(unknown))}')
+
+    params = {'files': args.files, 'size_kb': args.size_kb,
+              'density': args.density, 'seed': args.seed}
+    template_dir = tempfile.mkdtemp(prefix='bench-corpus-')
+    try:
+        build_corpus(template_dir, args.files, args.size_kb, args.density, args.seed)
+        corpus_mb = sum(os.path.getsize(p) for p in glob.glob(os.path.join(template_dir, '*'))) / 1e6
+        print(f'코퍼스: {args.files}개 파일, {corpus_mb:.1f} MB, 밀도 {args.density}/KB')
+        results = {}
+        for case in cases:
+            results[case] = r = measure(case, template_dir, args.repeat)
+            print(f'  {case:9s} {r["files_per_s"]:>9} files/s  {r["mb_per_s"]:>8} MB/s  '
+                  f'RSS {r["peak_rss_self_kb"] / 1024:.1f} MB'
+                  + (f' / 워커 {r["peak_rss_workers_kb"] / 1024:.1f} MB' if r['peak_rss_workers_kb'] else '')
+                  + f'  (변경 {r["changed"]})')
+    finally:
+        shutil.rmtree(template_dir, ignore_errors=True)
+
+    history = load_results(args.output)
+    previous = next((rec for rec in reversed(history) if rec['params'] == params), None)
+    if previous:
+        print(f'\n직전 기록 ({previous["commit"]}) 대비 MB/s:')
+        for case, r in results.items():
+            old = previous['cases'].get(case)
+            if old and old['mb_per_s'] and r['mb_per_s']:
+                print(f'  {case:9s} {r["mb_per_s"] / old["mb_per_s"] - 1:+.1%}')
+
+    history.append({
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'cpus': os.cpu_count(),
+        'params': params,
+        'cases': results,
+    })
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+    print(f'\n✅ 결과 저장: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+"""
+라우트 SQL 인덱스 커버리지 검사
+backend/routes/*.js 의 쿼리를 정적으로 재구성하고(db_routes), schema.sql + 마이그레이션으로 만든
+스키마 모델(db_schema)과 대조해 쓸 수 있는 인덱스가 없는 조건을 찾는다. DB 접속 없이 돌아가므로
+머지 전에 실행해 새 검색 조건이 인덱스 없이 들어오는 것을 막는 용도로 쓴다.
+
+규칙 (심각도)
+  search-no-trgm   (error) ILIKE / 앞이 % 인 LIKE 인데 pg_trgm GIN/GiST 인덱스가 없음
+  like-prefix      (warn)  LIKE 'abc%' 인데 text_pattern_ops 인덱스(또는 trgm)가 없음
+  function-wrapped (warn)  COALESCE(col, ..) = .. / DATE(col) = .. 처럼 컬럼을 함수로 감쌌는데 식 인덱스가 없음
+  filter-no-index  (warn)  테이블에 걸린 조건 중 인덱스를 탈 수 있는 것이 하나도 없음 (순차 스캔)
+  join-no-index    (warn)  JOIN 대상 테이블의 ON 컬럼에 선두 인덱스가 없음 (FK 는 인덱스를 만들지 않는다)
+  order-no-index   (info)  ORDER BY .. LIMIT 의 첫 정렬 컬럼에 인덱스가 없음 (전체 정렬 후 자름)
+
+인덱스는 B-tree 선두 컬럼 기준으로 본다 (복합 인덱스의 두 번째 컬럼만으로는 쓰지 않는다).
+부분 인덱스는 쿼리 WHERE 에 인덱스 조건이 그대로 들어 있을 때만 쓸 수 있는 것으로 친다.
+
+실행: python3 scripts/check-index-coverage.py                       # 보고서 + error 가 있으면 종료 코드 1
+      python3 scripts/check-index-coverage.py --fail-on warn         # warn 이상이면 실패
+      python3 scripts/check-index-coverage.py --write-baseline FILE  # 현재 발견 사항을 기준선으로 저장
+      python3 scripts/check-index-coverage.py --baseline FILE        # 기준선에 없는 새 발견 사항만 실패 처리
+"""
+
+import argparse
+import json
+import re
+import sys
+
+import db_routes
+import db_schema
+
+SEVERITIES = ['info', 'warn', 'error']
+COMPARE_OPS = {'=', '<', '>', '<=', '>='}
+LIKE_OPS = {'like': 'like', '~~': 'like', 'ilike': 'ilike', '~~*': 'ilike'}
+TRGM_OPCLASSES = {'gin_trgm_ops', 'gist_trgm_ops'}
+PATTERN_OPCLASSES = {'text_pattern_ops', 'varchar_pattern_ops', 'bpchar_pattern_ops'}
+SKIP_SQL_RE = re.compile(r'^\s*(CREATE|ALTER|DROP|BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE)\b', re.I)
+
+
+class Finding:
+    def __init__(self, rule, severity, call, table, column, message, suggestion=None):
+        self.rule = rule
+        self.severity = severity
+        self.call = call
+        self.table = table
+        self.column = column
+        self.message = message
+        self.suggestion = suggestion
+
+    @property
+    def fingerprint(self):
+        """기준선 비교용 (줄 번호는 빼고 라우트와 호출 순번으로 식별)"""
+        return f'{self.rule}|{self.table}.{self.column}|{self.call.key}'
+
+    def as_dict(self):
+        return {
+            'rule': self.rule, 'severity': self.severity,
+            'file': self.call.file, 'line': self.call.line, 'route': self.call.route,
+            'table': self.table, 'column': self.column,
+            'message': self.message, 'suggestion': self.suggestion,
+            'fingerprint': self.fingerprint,
+        }
+
+
+# ── 패턴 판정 ─────────────────────────────────────────────────
+
+def pattern_shape(token, call):
+    """LIKE 오른쪽 값의 모양: 'contains' / 'suffix' / 'prefix' / 'exact' / None(알 수 없음)"""
+    if token.kind == 'string':
+        text = token.text.strip("'")
+    elif token.kind == 'param':
+        text = call.params.get(int(token.text[1:]), '')
+        # JS 템플릿 `%${x}%` / 문자열 연결 '%' + x + '%'
+        text = re.sub(r'\$\{[^}]*\}', 'x', text.strip('`\'"'))
+        text = re.sub(r"['\"`]\s*\+\s*\w[\w.]*\s*\+\s*['\"`]", 'x', text)
+        if not text or text == call.params.get(int(token.text[1:]), ''):
+            return None
+    else:
+        return None
+    if text.startswith(('%', '_')):
+        return 'contains' if text.endswith('%') else 'suffix'
+    return 'prefix' if '%' in text or '_' in text else 'exact'
+
+
+# ── 인덱스 판정 ─────────────────────────────────────────────────
+
+def _partial_ok(index, query_text):
+    return index.where is None or index.where in query_text
+
+
+def leading_index(schema, table, column, query_text, methods=('btree',), opclasses=None):
+    """table.column 을 선두 키로 쓰는 인덱스 (없으면 None)"""
+    for ix in schema.table_indexes(table):
+        if ix.method not in methods or not ix.keys or ix.keys[0].column != column:
+            continue
+        if opclasses is not None and ix.keys[0].opclass not in opclasses:
+            continue
+        if _partial_ok(ix, query_text):
+            return ix
+    return None
+
+
+def trgm_index(schema, table, column, expr=None):
+    """column (또는 lower(column) 같은 식) 에 걸린 pg_trgm 인덱스"""
+    for ix in schema.table_indexes(table):
+        if ix.method not in ('gin', 'gist'):
+            continue
+        for key in ix.keys:
+            if key.opclass in TRGM_OPCLASSES and (key.column == column or (expr and key.expr == expr)
+                                                  or (key.column is None and re.fullmatch(
+                                                      rf'(lower|upper)\({column}\)', key.expr))):
+                return ix
+    return None
+
+
+def expr_index(schema, table, expr):
+    for ix in schema.table_indexes(table):
+        if ix.keys and ix.keys[0].column is None and ix.keys[0].expr == expr:
+            return ix
+    return None
+
+
+def index_name(table, columns, suffix='idx'):
+    return f'idx_{table}_{"_".join(columns)}' + ('' if suffix == 'idx' else f'_{suffix}')
+
+
+# ── 검사 ─────────────────────────────────────────────────────
+
+def check_call(call, schema):
+    if SKIP_SQL_RE.match(call.sql):
+        return []
+    q = db_schema.Query(call.sql, schema)
+    toks = q.tokens
+    findings = []
+    # 별칭을 뗀 정규화 텍스트 (부분 인덱스 조건 비교용)
+    stripped = db_schema.normalize(re.sub(r'\b\w+\.(?=[A-Za-z_])', '', call.sql))
+    predicates = {}      # (범위, 별칭, 테이블) -> [(컬럼, 인덱스 사용 가능 여부)]
+    join_keys = {}       # (범위, 별칭, 테이블) -> [(컬럼, 인덱스 사용 가능 여부)]
+    seen = set()
+
+    def add(rule, severity, table, column, message, suggestion=None):
+        key = (rule, table, column)
+        if key not in seen:
+            seen.add(key)
+            findings.append(Finding(rule, severity, call, table, column, message, suggestion))
+
+    i = 0
+    while i < len(toks):
+        clause = q.clause[i]
+        tok = toks[i]
+
+        # 함수로 감싼 컬럼: f(col, ...) <op> ...
+        if (clause in ('where', 'on') and tok.kind in ('ident', 'keyword') and tok.value not in ('in', 'exists', 'any', 'not')
+                and i + 1 < len(toks) and toks[i + 1].text == '(' and (i == 0 or toks[i - 1].text != '.')):
+            close = db_schema.close_paren(toks, i + 1)
+            after = toks[close + 1] if close + 1 < len(toks) else None
+            inner = [q.resolve(k) for k in range(i + 2, close)]
+            inner = [r for r in inner if r]
+            if after is not None and (after.text in COMPARE_OPS or after.value in LIKE_OPS or after.value in ('in', 'between')) and inner:
+                alias, table, column, _ = inner[0]
+                expr = _expr_text(toks[i:close + 1], q)
+                if expr_index(schema, table, expr) is None:
+                    add('function-wrapped', 'warn', table, column,
+                        f'{alias}.{column} 을 {tok.text.upper()}() 로 감싸 인덱스를 쓸 수 없음',
+                        _function_hint(tok.value, table, column, expr))
+                predicates.setdefault((q.scope[i], alias, table), []).append((column, expr_index(schema, table, expr) is not None))
+                i = close + 1
+                continue
+
+        ref = q.resolve(i) if clause in ('where', 'on', 'order') else None
+        if ref is None:
+            i += 1
+            continue
+        alias, table, column, end = ref
+        scope = q.scope[i]
+        nxt = toks[end] if end < len(toks) else None
+        prev = toks[i - 1] if i > 0 else None
+
+        if clause == 'order':
+            if scope in q.limited and (prev is None or prev.value == 'by'):
+                if leading_index(schema, table, column, stripped) is None:
+                    add('order-no-index', 'info', table, column,
+                        f'ORDER BY {alias}.{column} ... LIMIT: 정렬 컬럼 인덱스 없음 (조건에 맞는 행 전체를 정렬)',
+                        f'CREATE INDEX {index_name(table, [column])} ON {table} ({column});')
+            i = end
+            continue
+
+        op = nxt.value if nxt is not None else None
+        other = None
+        if op in COMPARE_OPS or op in ('in', 'between', 'is'):
+            other = q.resolve(end + 1) if end + 1 < len(toks) else None
+            kind = 'eq'
+        elif op in LIKE_OPS:
+            kind = LIKE_OPS[op]
+        elif op == 'not':
+            kind = None
+        elif prev is not None and prev.text in COMPARE_OPS:
+            # 왼쪽이 alias.col 이면 별칭 위치부터 해석
+            start = i - 4 if i >= 4 and toks[i - 3].text == '.' else i - 2
+            other = q.resolve(start) if start >= 0 else None
+            kind = 'eq'
+        else:
+            kind = None
+
+        if kind == 'eq':
+            usable = leading_index(schema, table, column, stripped, ('btree', 'hash')) is not None
+            if other is not None and other[0] != alias:
+                # 두 테이블 컬럼 비교 = 조인 키
+                join_keys.setdefault((scope, alias, table), []).append((column, usable))
+            elif other is None:
+                predicates.setdefault((scope, alias, table), []).append((column, usable))
+        elif kind in ('like', 'ilike'):
+            shape = pattern_shape(toks[end + 1], call) if end + 1 < len(toks) else None
+            usable = _check_like(add, schema, alias, table, column, kind, shape, stripped)
+            predicates.setdefault((scope, alias, table), []).append((column, usable))
+        i = end
+
+    # 조인 대상 테이블의 ON 키
+    for (scope, alias, table), keys in join_keys.items():
+        if q.joined.get((scope, alias)) and not any(u for _, u in keys):
+            for column, _ in keys:
+                add('join-no-index', 'warn', table, column,
+                    f'JOIN {table} {alias} ON {alias}.{column}: 조인 키 인덱스 없음 (중첩 루프마다 {table} 순차 스캔)',
+                    f'CREATE INDEX {index_name(table, [column])} ON {table} ({column});')
+
+    # 테이블마다 인덱스를 탈 수 있는 조건이 하나라도 있는지
+    for (scope, alias, table), preds in predicates.items():
+        if any(u for _, u in preds) or any(u for _, u in join_keys.get((scope, alias, table), [])):
+            continue
+        if q.joined.get((scope, alias)) and join_keys.get((scope, alias, table)):
+            continue     # 조인 키 쪽 규칙에서 이미 보고
+        columns = list(dict.fromkeys(c for c, _ in preds))
+        if any(f.table == table and f.column in columns for f in findings):
+            continue     # 같은 컬럼을 더 구체적인 규칙이 이미 보고
+        # boolean 컬럼만 걸린 조건은 선택도가 낮아 인덱스가 있어도 대개 순차 스캔이 낫다
+        booleans = all((schema.column_type(table, c) or '').startswith('bool') for c in columns)
+        add('filter-no-index', 'info' if booleans else 'warn', table, ','.join(columns),
+            f'{table} 조건 ({", ".join(f"{alias}.{c}" for c in columns)}) 중 인덱스를 쓸 수 있는 것이 없음 (순차 스캔)',
+            f'CREATE INDEX {index_name(table, columns[:2])} ON {table} ({", ".join(columns[:2])});')
+    return findings
+
+
+def _check_like(add, schema, alias, table, column, kind, shape, stripped):
+    """LIKE/ILIKE 조건 판정. 인덱스를 쓸 수 있으면 True"""
+    if trgm_index(schema, table, column) is not None:
+        return True
+    trgm_hint = (f'CREATE INDEX {index_name(table, [column], "trgm")} ON {table} USING gin ({column} gin_trgm_ops);'
+                 + ('' if 'pg_trgm' in schema.extensions else '  -- 먼저 CREATE EXTENSION IF NOT EXISTS pg_trgm;'))
+    op = kind.upper()
+    if kind == 'ilike' or shape in ('contains', 'suffix', None):
+        wildcard = shape in ('contains', 'suffix')
+        desc = "'%...%'" if shape == 'contains' else "'%...'" if shape == 'suffix' else '(패턴 알 수 없음)'
+        severity = 'error' if wildcard or kind == 'ilike' else 'warn'
+        add('search-no-trgm', severity, table, column,
+            f'{alias}.{column} {op} {desc}: B-tree 로 찾을 수 없는 패턴인데 trigram 인덱스 없음', trgm_hint)
+        return False
+    if shape == 'prefix':
+        if leading_index(schema, table, column, stripped, opclasses=PATTERN_OPCLASSES) is not None:
+            return True
+        add('like-prefix', 'warn', table, column,
+            f"{alias}.{column} LIKE 'abc%': pattern_ops 인덱스 없음 (C 가 아닌 정렬 규칙의 기본 B-tree 는 LIKE 에 못 씀)",
+            f'CREATE INDEX {index_name(table, [column], "pattern")} ON {table} ({column} text_pattern_ops);')
+        return False
+    return leading_index(schema, table, column, stripped) is not None     # 와일드카드 없는 LIKE = 등호
+
+
+def _expr_text(toks, q):
+    """함수 호출 토큰 -> 별칭을 뗀 정규화 식 (식 인덱스 키와 비교)"""
+    out = []
+    skip = False
+    for k, tok in enumerate(toks):
+        if skip:
+            skip = False
+            continue
+        if tok.kind == 'ident' and k + 1 < len(toks) and toks[k + 1].text == '.':
+            skip = True     # 별칭과 점을 뗀다
+            continue
+        out.append(tok.text.lower() if tok.kind in ('ident', 'keyword') else tok.text)
+    return db_schema.normalize(''.join(out))
+
+
+def _function_hint(func, table, column, expr):
+    if func == 'coalesce':
+        return (f'{column} 에 NOT NULL DEFAULT 를 주고 COALESCE 를 빼거나, '
+                f'CREATE INDEX {index_name(table, [column], "expr")} ON {table} (({expr}));')
+    if func in ('lower', 'upper'):
+        return f'CREATE INDEX {index_name(table, [column], func)} ON {table} (({expr}));'
+    if func == 'date':
+        return f'{column} >= $1::date AND {column} < $1::date + 1 로 바꾸고 {column} 에 인덱스'
+    return f'CREATE INDEX {index_name(table, [column], "expr")} ON {table} (({expr}));'
+
+
+def check(calls, schema):
+    findings = []
+    for call in calls:
+        findings.extend(check_call(call, schema))
+    order = {s: n for n, s in enumerate(reversed(SEVERITIES))}
+    findings.sort(key=lambda f: (order[f.severity], f.call.file, f.call.line, f.rule))
+    return findings
+
+
+# ── 보고서 ─────────────────────────────────────────────────────
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return set(json.load(f)['findings'])
+    except (OSError, ValueError, KeyError):
+        print(f'⚠️  기준선 파일을 읽을 수 없음: {path} (모든 발견 사항을 새 것으로 봅니다)')
+        return set()
+
+
+def write_baseline(path, findings):
+    data = {'version': 1, 'findings': sorted({f.fingerprint for f in findings})}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+        f.write('\n')
+
+
+def print_report(findings, known, calls, fail_on):
+    icons = {'error': '❌', 'warn': '⚠️ ', 'info': 'ℹ️ '}
+    for f in findings:
+        mark = ' (기준선)' if f.fingerprint in known else ''
+        print(f'{icons[f.severity]} {f.call.file}:{f.call.line} {f.call.route or ""} [{f.rule}]{mark}')
+        print(f'     {f.message}')
+        if f.suggestion:
+            print(f'     → {f.suggestion}')
+    counts = {s: sum(1 for f in findings if f.severity == s) for s in SEVERITIES}
+    dynamic = sum(1 for c in calls if c.dynamic)
+    print(f'\n쿼리 {len(calls)}개 검사 (동적 조각 포함 {dynamic}개): '
+          f'error {counts["error"]} / warn {counts["warn"]} / info {counts["info"]}'
+          + (f' (기준선 {sum(1 for f in findings if f.fingerprint in known)}개 제외 대상)' if known else '')
+          + (f', 실패 기준: {fail_on} 이상' if fail_on != 'never' else ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라우트 SQL 조건의 인덱스 커버리지 검사 (DB 접속 없음)')
+    parser.add_argument('--fail-on', choices=[*SEVERITIES, 'never'], default='error',
+                        help='이 심각도 이상의 새 발견 사항이 있으면 종료 코드 1 (기본값: error)')
+    parser.add_argument('--baseline', metavar='FILE',
+                        help='기준선 JSON. 여기 있는 발견 사항은 실패로 치지 않는다')
+    parser.add_argument('--write-baseline', metavar='FILE',
+                        help='현재 발견 사항 전체를 기준선으로 저장하고 종료 코드 0')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='출력 형식')
+    args = parser.parse_args()
+
+    schema = db_schema.load()
+    calls = db_routes.extract_all()
+    findings = check(calls, schema)
+
+    if args.write_baseline:
+        write_baseline(args.write_baseline, findings)
+        print(f'기준선 저장: {args.write_baseline} ({len(findings)}개)')
+        return 0
+
+    known = load_baseline(args.baseline) if args.baseline else set()
+    if args.format == 'json':
+        json.dump({'findings': [{**f.as_dict(), 'baseline': f.fingerprint in known} for f in findings],
+                   'queries': len(calls)}, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        print_report(findings, known, calls, args.fail_on)
+
+    if args.fail_on == 'never':
+        return 0
+    threshold = SEVERITIES.index(args.fail_on)
+    failed = [f for f in findings if SEVERITIES.index(f.severity) >= threshold and f.fingerprint not in known]
+    if failed and args.format == 'text':
+        print(f'❌ 새 발견 사항 {len(failed)}개 ({args.fail_on} 이상) - 인덱스를 추가하거나 '
+              f'의도한 것이면 --write-baseline 으로 기준선을 갱신하세요.')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
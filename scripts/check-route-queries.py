@@ -0,0 +1,376 @@
+"""
+라우트 쿼리 지연 위험 검사 (N+1 / 무제한 조회)
+backend/routes/*.js 의 query() / client.query() 호출을 정적으로 훑어(db_routes, db_schema)
+운영에서 데이터가 늘면 느려질 패턴을 위험도 순으로 보여 준다. DB 접속 없이 돌아간다.
+
+규칙 (기본 위험도)
+  query-in-loop       (high)   for / while / .forEach / .map 안의 쿼리 호출 (항목마다 왕복)
+  unbounded-list      (high)   WHERE 도 LIMIT 도 없는 목록 조회 (테이블 전체)
+                      (medium) WHERE 는 있지만 LIMIT 없이 여러 행을 돌려줄 수 있는 조회
+                               (PK·UNIQUE 키를 고정한 조회, SELECT 1 / EXISTS 확인, 결과를
+                               rows.length / rows[0] 로만 쓰는 단건 조회는 제외)
+  correlated-subquery (medium) 바깥 행마다 다시 실행되는 상관 서브쿼리 (SELECT 목록·SET 절이면 high)
+  derived-aggregate   (high)   FROM/JOIN 의 (SELECT .. GROUP BY) 파생 테이블이 WHERE 없이 테이블 전체를 집계
+  count-query         (medium) 목록 쿼리와 같은 조건으로 COUNT(*) 를 따로 한 번 더 실행
+                               (조건이 서로 다르면 페이지 합계가 틀리므로 high)
+  schema-probe        (medium) 요청마다 information_schema / pg_catalog 를 조회
+  select-star         (low)    SELECT * / alias.* / RETURNING * (필요 없는 컬럼까지 전송)
+  offset-pagination   (low)    LIMIT .. OFFSET 페이지 (뒤 페이지일수록 앞 행을 모두 읽고 버림)
+
+GET 라우트는 호출 빈도가 높다고 보고 같은 위험도 안에서 앞에 둔다.
+
+실행: python3 scripts/check-route-queries.py                 # 위험도 순 보고서
+      python3 scripts/check-route-queries.py --min-risk medium
+      python3 scripts/check-route-queries.py --fail-on high  # high 가 있으면 종료 코드 1
+"""
+
+import argparse
+import json
+import re
+import sys
+
+import db_routes
+import db_schema
+
+RISKS = ['low', 'medium', 'high']
+AGGREGATES = {'count', 'sum', 'avg', 'min', 'max', 'bool_and', 'bool_or', 'array_agg', 'string_agg', 'json_agg'}
+SKIP_SQL_RE = re.compile(r'^\s*(CREATE|ALTER|DROP|BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE)\b', re.I)
+CATALOG_RE = re.compile(r'\b(information_schema|pg_catalog)\.|\bpg_(constraint|class|attribute|indexes|tables)\b', re.I)
+
+
+class Finding:
+    def __init__(self, rule, risk, call, message, hint=None):
+        self.rule = rule
+        self.risk = risk
+        self.call = call
+        self.message = message
+        self.hint = hint
+
+    @property
+    def score(self):
+        """정렬 점수: 위험도 > GET 라우트 > 반복문 안"""
+        route = self.call.route or ''
+        return (RISKS.index(self.risk), route.startswith('GET'), self.call.loop is not None)
+
+    def as_dict(self):
+        return {
+            'rule': self.rule, 'risk': self.risk,
+            'file': self.call.file, 'line': self.call.line, 'route': self.call.route,
+            'message': self.message, 'hint': self.hint, 'sql': self.call.sql,
+        }
+
+
+# ── 문장 모양 ─────────────────────────────────────────────────
+
+class Shape:
+    """최상위 문장의 모양 (검사 규칙들이 공유)"""
+
+    def __init__(self, call, schema):
+        self.call = call
+        self.q = q = db_schema.Query(call.sql, schema)
+        toks = q.tokens
+        self.kind = toks[0].value if toks else ''
+        top = [i for i in range(len(toks)) if q.scope[i] == 0]
+        self.has_where = any(toks[i].value == 'where' for i in top)
+        self.has_group = any(toks[i].value == 'group' and q.clause[i] == 'group' for i in top)
+        self.limited = 0 in q.limited
+        self.offset = any(toks[i].value == 'offset' for i in top)
+        self.main = next((t for a, t in q.aliases[0].items() if t and not q.joined.get((0, a))), None)
+        self.where_columns = self._where_columns()
+
+    def select_items(self):
+        """최상위 SELECT 목록 항목별 토큰 목록"""
+        q, toks = self.q, self.q.tokens
+        items, cur, depth = [], [], None
+        for i, tok in enumerate(toks):
+            if q.scope[i] == 0 and q.clause[i] != 'select':
+                if depth is not None:
+                    break
+                continue
+            if depth is None:
+                if tok.value == 'select':
+                    depth = tok.depth
+                continue
+            if tok.text == ',' and q.scope[i] == 0 and tok.depth == depth:
+                items.append(cur)
+                cur = []
+                continue
+            cur.append(tok)
+        if cur:
+            items.append(cur)
+        return items
+
+    @property
+    def aggregate_only(self):
+        items = self.select_items()
+        return bool(items) and not self.has_group and all(
+            len(item) > 1 and item[0].value in AGGREGATES and item[1].text == '(' for item in items)
+
+    def _where_columns(self):
+        """최상위 WHERE 의 (테이블, 컬럼) -> 연산자 (= 이면 상수와 비교하는 등호)"""
+        q, toks = self.q, self.q.tokens
+        found = {}
+        i = 0
+        while i < len(toks):
+            if q.clause[i] != 'where' or q.scope[i] != 0:
+                i += 1
+                continue
+            ref = q.resolve(i)
+            if ref is None:
+                i += 1
+                continue
+            alias, table, column, end = ref
+            op = toks[end].text if end < len(toks) else None
+            other = q.resolve(end + 1) if end + 1 < len(toks) else None
+            found.setdefault((table, column), '=' if op == '=' and other is None else (op or '?'))
+            i = end
+        return found
+
+    @property
+    def single_row(self):
+        """주 테이블의 UNIQUE 인덱스 컬럼을 모두 상수 등호로 묶었으면 한 행.
+        최상위 OR 로 나뉘면 갈래마다 묶여 있어야 한다 (갈래 수만큼의 행)"""
+        if self.main is None:
+            return False
+        q = self.q
+        where = [i for i, tok in enumerate(q.tokens)
+                 if q.scope[i] == 0 and q.clause[i] == 'where' and tok.value != 'where']
+        return self._pins(where)
+
+    def _pins(self, idxs):
+        q, toks = self.q, self.q.tokens
+        # 조건 전체를 감싼 괄호는 벗긴다
+        while (len(idxs) > 1 and toks[idxs[0]].text == '(' and toks[idxs[-1]].text == ')'
+               and all(toks[i].depth > toks[idxs[0]].depth for i in idxs[1:-1])):
+            idxs = idxs[1:-1]
+        if not idxs:
+            return False
+        depth = min(toks[i].depth for i in idxs)
+        branches = [[]]
+        for i in idxs:
+            if toks[i].value == 'or' and toks[i].depth == depth:
+                branches.append([])
+            else:
+                branches[-1].append(i)
+        if len(branches) > 1:
+            return all(self._pins(b) for b in branches)
+        # AND 로 이어진 같은 깊이의 "컬럼 = 상수" 만 센다 (괄호 안 OR 의 조건은 고정이 아님)
+        eq = set()
+        for i in idxs:
+            if toks[i].depth != depth or (i and toks[i - 1].text == '.'):
+                continue
+            ref = q.resolve(i)
+            if ref is None:
+                continue
+            _, table, column, end = ref
+            if (table == self.main and end < len(toks) and toks[end].text == '='
+                    and (end + 1 >= len(toks) or q.resolve(end + 1) is None)):
+                eq.add(column)
+        for ix in q.schema.table_indexes(self.main):
+            if ix.unique and ix.where is None and ix.columns and set(ix.columns) <= eq:
+                return True
+        return False
+
+    @property
+    def probe(self):
+        """SELECT 1 / SELECT EXISTS (..) 처럼 행 내용이 아니라 존재 여부만 보는 조회"""
+        items = self.select_items()
+        return bool(items) and all(
+            (len(item) == 1 and (item[0].kind == 'number' or item[0].value == 'true'))
+            or (item[0].value == 'exists' and len(item) > 1 and item[1].text == '(')
+            for item in items)
+
+
+# ── 규칙 ─────────────────────────────────────────────────────
+
+def check_call(call, schema):
+    if SKIP_SQL_RE.match(call.sql):
+        if call.loop:
+            return [_loop_finding(call)]
+        return []
+    findings = []
+    if call.loop:
+        findings.append(_loop_finding(call))
+    if CATALOG_RE.search(call.sql):
+        findings.append(Finding('schema-probe', 'medium', call,
+                                '요청마다 시스템 카탈로그를 조회 (컬럼·제약 존재 여부 확인)',
+                                '서버 시작 시 한 번 조회해 모듈 변수에 캐시하거나 마이그레이션으로 스키마를 고정'))
+        return findings
+
+    shape = Shape(call, schema)
+    q, toks = shape.q, shape.q.tokens
+
+    if shape.kind == 'select' and shape.main and not shape.limited \
+            and not shape.aggregate_only and not shape.single_row:
+        if not shape.has_where:
+            findings.append(Finding('unbounded-list', 'high', call,
+                                    f'{shape.main} 전체를 WHERE·LIMIT 없이 조회',
+                                    'LIMIT 을 붙이거나, 정말 작은 코드 테이블이면 결과를 메모리에 캐시'))
+        elif not (shape.probe or call.first_row_only):
+            # 존재 확인(SELECT 1 / EXISTS)·결과에서 rows.length / rows[0] 만 쓰는 단건 조회는 목록이 아님
+            cols = ', '.join(f'{c}' for (t, c) in shape.where_columns if t == shape.main) or '조인 조건'
+            findings.append(Finding('unbounded-list', 'medium', call,
+                                    f'{shape.main} 목록을 LIMIT 없이 조회 (조건: {cols}) - 행 수만큼 응답이 커짐',
+                                    'LIMIT $n OFFSET $m (또는 키셋 페이지) 을 붙이고 프런트에서 페이지 단위로 요청'))
+
+    for i, tok in enumerate(toks):
+        if tok.text != '*':
+            continue
+        prev = toks[i - 1] if i else None
+        if prev is None or prev.text == '(':
+            continue      # COUNT(*)
+        if prev.value in ('select', 'returning', 'distinct') or prev.text in (',', '.'):
+            what = 'RETURNING *' if q.clause[i] == 'returning' else \
+                f'{toks[i - 2].text}.*' if prev.text == '.' else 'SELECT *'
+            findings.append(Finding('select-star', 'low', call,
+                                    f'{what}: 화면에서 쓰지 않는 컬럼까지 읽고 전송',
+                                    '필요한 컬럼만 나열 (TEXT/배열 컬럼이 많은 테이블일수록 효과가 큼)'))
+            break
+
+    findings.extend(_correlated(call, shape))
+    findings.extend(_derived_aggregates(call, shape))
+
+    if shape.limited and shape.offset:
+        findings.append(Finding('offset-pagination', 'low', call,
+                                'LIMIT/OFFSET 페이지: 뒤 페이지일수록 앞의 행을 모두 읽고 버림',
+                                '정렬 키 기준 키셋 페이지 (WHERE (created_at, id) < ($1, $2) ... LIMIT n)'))
+    return findings
+
+
+def _loop_finding(call):
+    kind, line = call.loop
+    return Finding('query-in-loop', 'high', call,
+                   f'{kind} 반복문({call.file}:{line}) 안에서 항목마다 쿼리 실행 (N+1 왕복)',
+                   '한 번에 처리: UPDATE .. FROM (SELECT unnest($1::text[]), ..) / WHERE id = ANY($1) 로 묶기')
+
+
+def _correlated(call, shape):
+    """바깥 범위의 별칭을 참조하는 서브쿼리"""
+    q, toks = shape.q, shape.q.tokens
+    findings = []
+    for scope in q.aliases:
+        if scope == 0:
+            continue
+        outer = {}
+        for parent in list(q.chain(q.parent[scope])):
+            for alias in q.aliases[parent]:
+                outer.setdefault(alias, parent)
+        refs = []
+        for i in range(scope, len(toks)):
+            if q.scope[i] != scope:
+                continue
+            if (toks[i].kind == 'ident' and i + 2 < len(toks) and toks[i + 1].text == '.'
+                    and toks[i].value not in q.aliases[scope] and toks[i].value in outer):
+                refs.append(f'{toks[i].text}.{toks[i + 2].text}')
+        if not refs:
+            continue
+        where = q.clause[scope - 1]      # 서브쿼리 여는 괄호가 놓인 절
+        per_row = where in ('select', 'set')
+        risk = 'high' if per_row and not shape.single_row else 'medium'
+        place = {'select': 'SELECT 목록', 'set': 'UPDATE SET 절'}.get(where, f'{(where or "").upper()} 절')
+        findings.append(Finding('correlated-subquery', risk, call,
+                                f'{place}의 상관 서브쿼리가 바깥 행마다 실행됨 ({", ".join(dict.fromkeys(refs))})',
+                                'GROUP BY 한 파생 테이블을 한 번만 JOIN 하거나, 집계 컬럼을 트리거/증분 UPDATE 로 유지'))
+    return findings
+
+
+def _derived_aggregates(call, shape):
+    """FROM / JOIN 자리의 GROUP BY 파생 테이블 중 자체 WHERE 가 없는 것 (요청마다 전체 집계)"""
+    q, toks = shape.q, shape.q.tokens
+    findings = []
+    for scope in q.aliases:
+        if scope == 0 or q.clause[scope - 1] != 'from':
+            continue
+        inner = [i for i in range(scope, len(toks)) if q.scope[i] == scope]
+        if any(toks[i].value == 'where' for i in inner) or not any(q.clause[i] == 'group' for i in inner):
+            continue
+        tables = [t for t in q.aliases[scope].values() if t]
+        if not tables:
+            continue
+        outer = f'{shape.main} 조회마다 ' if shape.main else ''
+        findings.append(Finding('derived-aggregate', 'high', call,
+                                f'{outer}{tables[0]} 전체를 GROUP BY 로 집계한 뒤 조인 (LIMIT 은 집계 뒤에 적용)',
+                                'LEFT JOIN LATERAL (SELECT COUNT(*) .. WHERE fk = 바깥.id) 로 페이지 행만 세거나 '
+                                '집계 컬럼을 증분 UPDATE 로 유지'))
+    return findings
+
+
+def check_routes(calls, schema):
+    """라우트 단위 규칙: 목록 쿼리와 별도로 실행하는 COUNT(*)"""
+    findings = []
+    by_route = {}
+    for call in calls:
+        if call.route and not SKIP_SQL_RE.match(call.sql) and not CATALOG_RE.search(call.sql):
+            by_route.setdefault((call.file, call.route), []).append(Shape(call, schema))
+    for shapes in by_route.values():
+        lists = [s for s in shapes if s.kind == 'select' and s.limited and not s.aggregate_only]
+        counts = [s for s in shapes if s.kind == 'select' and s.aggregate_only and s.main
+                  and re.match(r'\s*SELECT\s+COUNT\s*\(', s.call.sql, re.I)]
+        for count in counts:
+            match = next((s for s in lists if s.main == count.main), None)
+            if match is None:
+                continue
+            missing = sorted(f'{t}.{c}' for t, c in set(match.where_columns) - set(count.where_columns))
+            extra = sorted(f'{t}.{c}' for t, c in set(count.where_columns) - set(match.where_columns))
+            if missing or extra:
+                detail = '; '.join(filter(None, [f'COUNT 에 없는 조건: {", ".join(missing)}' if missing else '',
+                                                  f'목록에 없는 조건: {", ".join(extra)}' if extra else '']))
+                findings.append(Finding('count-query', 'high', count.call,
+                                        f'목록 쿼리({match.call.line}행)와 조건이 다른 COUNT(*) - 페이지 합계가 틀림 ({detail})',
+                                        '목록 쿼리에 COUNT(*) OVER() AS total_count 를 더해 한 번에 조회'))
+            else:
+                findings.append(Finding('count-query', 'medium', count.call,
+                                        f'목록 쿼리({match.call.line}행)와 같은 조건으로 COUNT(*) 를 한 번 더 실행',
+                                        '목록 쿼리에 COUNT(*) OVER() AS total_count 를 더해 왕복 1회로'))
+    return findings
+
+
+def check(calls, schema):
+    findings = []
+    for call in calls:
+        findings.extend(check_call(call, schema))
+    findings.extend(check_routes(calls, schema))
+    findings.sort(key=lambda f: (tuple(-x for x in f.score), f.call.file, f.call.line, f.rule))
+    return findings
+
+
+# ── 보고서 ─────────────────────────────────────────────────────
+
+def print_report(findings, calls):
+    icons = {'high': '🔴', 'medium': '🟠', 'low': '🟡'}
+    for rank, f in enumerate(findings, 1):
+        print(f'{rank:3d}. {icons[f.risk]} {f.risk:6s} {f.call.file}:{f.call.line} {f.call.route or ""} [{f.rule}]')
+        print(f'       {f.message}')
+        if f.hint:
+            print(f'       → {f.hint}')
+    counts = {r: sum(1 for f in findings if f.risk == r) for r in RISKS}
+    print(f'\n쿼리 {len(calls)}개 / 발견 {len(findings)}개: '
+          f'high {counts["high"]} / medium {counts["medium"]} / low {counts["low"]}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라우트 쿼리 N+1 / 무제한 조회 위험 검사 (DB 접속 없음)')
+    parser.add_argument('--min-risk', choices=RISKS, default='low', help='이 위험도 이상만 출력 (기본값: low)')
+    parser.add_argument('--fail-on', choices=[*RISKS, 'never'], default='never',
+                        help='이 위험도 이상이 있으면 종료 코드 1 (기본값: never)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='출력 형식')
+    args = parser.parse_args()
+
+    schema = db_schema.load()
+    calls = db_routes.extract_all()
+    findings = [f for f in check(calls, schema) if RISKS.index(f.risk) >= RISKS.index(args.min_risk)]
+
+    if args.format == 'json':
+        json.dump({'findings': [f.as_dict() for f in findings], 'queries': len(calls)},
+                  sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        print_report(findings, calls)
+
+    if args.fail_on != 'never' and any(RISKS.index(f.risk) >= RISKS.index(args.fail_on) for f in findings):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
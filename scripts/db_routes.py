@@ -0,0 +1,594 @@
+"""
+backend/routes/*.js 의 SQL 추출기 (정적 분석 도구 공용)
+query(...) / client.query(...) 호출마다 실제로 실행될 SQL 을 재구성한다.
+
+- 첫 인자가 문자열 리터럴이면 그대로, 변수(queryText, sql, countQuery 등)면 선언 리터럴과
+  호출 전까지의 `+=` 조각을 모두 이어 붙인다 (조건부 필터가 전부 켜진 쿼리)
+- $${paramCount} 처럼 JS 로 번호를 매기는 자리표시자는 등장 순서대로 $1, $2 ... 로 다시 매기고
+  같은 조각 안의 같은 식은 같은 번호를 쓴다
+- ${cond ? 'a' : 'b'} 는 긴 쪽 가지를, 같은 핸들러에서 문자열로 정해지는 변수는 그 값을 넣고
+  알 수 없는 식은 NULL 로 바꾼 뒤 dynamic=True 로 표시한다
+- 바인드 값은 params.push(...) / 인자 배열에서 자리표시자 번호별 JS 식으로 모은다
+
+JS 전체를 파싱하지는 않는다. 문자열·주석·정규식 리터럴만 구분해 괄호 짝을 맞추는
+수준이라, 이 저장소 라우트 파일의 관용구(위 목록)를 벗어나면 dynamic 으로 남는다.
+"""
+
+import glob
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES_DIR = os.path.join(BASE_DIR, 'backend', 'routes')
+
+ROUTE_RE = re.compile(r'\brouter\.(get|post|put|patch|delete)\s*\(')
+CALL_RE = re.compile(r'(?<![\w$])((?:\w+\.)?query)\s*\(')
+LOOP_RE = re.compile(r'\b(for|while)\s*(?:await\s*)?\(|\.(forEach|map|flatMap|filter|reduce|some|every)\s*\(')
+ASSIGN_RE = re.compile(r'\b(?:let|const|var)\s+(\w+)\s*=\s*|(?<![\w$.])(\w+)\s*(\+?=)(?!=)\s*')
+PUSH_RE = re.compile(r'\b(\w+)\.push\s*\(')
+PLACEHOLDER_RE = re.compile(r'\$\{([^{}]*)\}')
+REGEX_PREV = set('(,=:[!&|?{};+-*%<>~^') | {''}
+REGEX_PREV_WORDS = {'return', 'typeof', 'case', 'in', 'of', 'delete', 'void', 'throw', 'new'}
+NOT_QUERY_TARGETS = {'req.query'}     # Express 쿼리 문자열 객체
+RESULT_RE = re.compile(r'(?<![\w$.])(\w+)\s*=\s*await\s*$')
+FIRST_ROW_USE_RE = re.compile(r'\s*\.\s*(?:rows\s*(?:\.\s*length\b|\[\s*0\s*\])|rowCount\b)')
+
+
+# ── JS 스캐너 ─────────────────────────────────────────────────
+
+class Source:
+    """JS 소스 하나. 문자열·주석을 공백으로 지운 code 와 괄호 짝, 문자열 리터럴 위치를 갖는다.
+    템플릿 리터럴의 ${...} 안은 코드로 남겨 두므로 그 안의 문자열·괄호도 똑같이 잡힌다."""
+
+    def __init__(self, path, text=None):
+        self.path = path
+        if text is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        self.text = text
+        self.strings = {}    # 시작 위치 -> (끝 위치, 따옴표)
+        self.pairs = {}      # 여는 괄호 위치 <-> 닫는 괄호 위치 (템플릿 ${ } 포함)
+        self.comments = []   # (시작, 끝) 주석 범위
+        self.code = self._scan()
+        self._lines = [m.start() for m in re.finditer(r'^', text, re.M)]
+
+    def _scan(self):
+        text = self.text
+        code = list(text)
+        brackets = []        # (여는 괄호 위치, 템플릿 ${ 여부)
+        templates = []       # 열려 있는 템플릿 리터럴 시작 위치
+        i, n = 0, len(text)
+        prev = ''
+        while i < n:
+            c = text[i]
+            if c == '`' or (c == '}' and brackets and brackets[-1][1]):
+                if c == '`':
+                    templates.append(i)
+                else:
+                    start, _ = brackets.pop()
+                    self.pairs[start], self.pairs[i] = i, start
+                i += 1
+                while i < n:
+                    ch = text[i]
+                    if ch == '\\':
+                        code[i:i + 2] = [x if x == '\n' else ' ' for x in text[i:i + 2]]
+                        i += 2
+                        continue
+                    if ch == '`':
+                        start = templates.pop()
+                        self.strings[start] = (i + 1, '`')
+                        i += 1
+                        break
+                    if text.startswith('${', i):
+                        brackets.append((i + 1, True))
+                        i += 2
+                        break
+                    if ch != '\n':
+                        code[i] = ' '
+                    i += 1
+                prev = 'str'
+                continue
+            if c in '\'"':
+                end = self._string_end(i)
+                self.strings[i] = (end, c)
+                code[i + 1:end - 1] = ' ' * (end - i - 2)
+                i, prev = end, 'str'
+                continue
+            if text.startswith('//', i):
+                end = text.find('\n', i)
+                end = n if end < 0 else end
+                code[i:end] = ' ' * (end - i)
+                self.comments.append((i, end))
+                i = end
+                continue
+            if text.startswith('/*', i):
+                end = text.find('*/', i + 2)
+                end = n if end < 0 else end + 2
+                code[i:end] = [ch if ch == '\n' else ' ' for ch in text[i:end]]
+                self.comments.append((i, end))
+                i = end
+                continue
+            if c == '/' and (prev in REGEX_PREV or prev in REGEX_PREV_WORDS):
+                end = self._regex_end(i)
+                code[i + 1:end - 1] = ' ' * (end - i - 2)
+                i, prev = end, 'regex'
+                continue
+            if c in '([{':
+                brackets.append((i, False))
+            elif c in ')]}' and brackets:
+                start, _ = brackets.pop()
+                self.pairs[start], self.pairs[i] = i, start
+            if not c.isspace():
+                if c.isalnum() or c in '_$':
+                    m = re.match(r'[\w$]+', text[i:i + 64])
+                    prev = m.group(0)
+                    i += len(prev)
+                    continue
+                prev = c
+            i += 1
+        return ''.join(code)
+
+    def _string_end(self, start):
+        """start 의 따옴표(' 또는 ")로 시작한 문자열의 끝(닫는 따옴표 다음) 위치"""
+        text, quote = self.text, self.text[start]
+        i = start + 1
+        while i < len(text):
+            c = text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote:
+                return i + 1
+            if c == '\n':
+                return i
+            i += 1
+        return len(text)
+
+    def clean(self, start, end):
+        """start~end 원문에서 주석을 뺀 텍스트"""
+        out, i = [], start
+        for cs, ce in self.comments:
+            if ce <= start or cs >= end:
+                continue
+            out.append(self.text[i:max(cs, i)])
+            i = max(i, ce)
+        out.append(self.text[i:end])
+        return ''.join(out).strip()
+
+    def _regex_end(self, start):
+        text, i, in_class = self.text, start + 1, False
+        while i < len(text) and text[i] != '\n':
+            c = text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                i += 1
+                while i < len(text) and text[i].isalpha():
+                    i += 1
+                return i
+            i += 1
+        return i
+
+    def line(self, pos):
+        lo, hi = 0, len(self._lines)
+        while lo + 1 < hi:
+            mid = (lo + hi) // 2
+            if self._lines[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid
+        return lo + 1
+
+    def close(self, pos):
+        return self.pairs.get(pos, len(self.text))
+
+    def block(self, pos):
+        """pos 를 감싸는 가장 안쪽 { } 의 (시작, 끝) 위치"""
+        best = (0, len(self.text))
+        for start, end in self.pairs.items():
+            if self.text[start] == '{' and start < pos < end and start > best[0]:
+                best = (start, end)
+        return best
+
+    def split_args(self, open_pos):
+        """open_pos 의 여는 괄호 안 인자를 최상위 쉼표로 나눈 (시작, 끝) 목록"""
+        end = self.close(open_pos)
+        args, start, i = [], open_pos + 1, open_pos + 1
+        while i < end:
+            if i in self.strings:
+                i = self.strings[i][0]
+                continue
+            c = self.code[i]
+            if c in '([{' and i in self.pairs:
+                i = self.pairs[i] + 1
+                continue
+            if c == ',':
+                args.append((start, i))
+                start = i + 1
+            i += 1
+        if self.text[start:end].strip():
+            args.append((start, end))
+        return [(s, e) for s, e in args]
+
+    def expr_end(self, pos):
+        """pos 에서 시작하는 식이 끝나는 위치 (최상위 ; 또는 줄바꿈 뒤 새 문장)"""
+        i = pos
+        while i < len(self.text):
+            if i in self.strings:
+                i = self.strings[i][0]
+                continue
+            c = self.code[i]
+            if c in '([{' and i in self.pairs:
+                i = self.pairs[i] + 1
+                continue
+            if c in ';)}]':
+                return i
+            i += 1
+        return i
+
+
+# ── 식 해석 ─────────────────────────────────────────────────
+
+def _strip(src, start, end):
+    while start < end and src.text[start].isspace():
+        start += 1
+    while end > start and src.text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _ternary(src, start, end):
+    """최상위 `cond ? a : b` 면 (a, b) 위치 쌍, 아니면 None"""
+    q = colon = None
+    depth_q = 0
+    i = start
+    while i < end:
+        if i in src.strings:
+            i = src.strings[i][0]
+            continue
+        c = src.code[i]
+        if c in '([{' and i in src.pairs:
+            i = src.pairs[i] + 1
+            continue
+        if c == '?' and src.code[i + 1:i + 2] not in ('.', '?') and src.code[i - 1:i] != '?':
+            if q is None:
+                q = i
+            depth_q += 1
+        elif c == ':' and q is not None:
+            depth_q -= 1
+            if depth_q == 0:
+                colon = i
+                break
+        i += 1
+    if q is None or colon is None:
+        return None
+    return _strip(src, q + 1, colon), _strip(src, colon + 1, end)
+
+
+class Resolver:
+    """핸들러 범위 안에서 JS 식을 SQL 문자열로 바꾼다"""
+
+    def __init__(self, src, scope):
+        self.src = src
+        self.scope = scope
+        self.dynamic = False
+        self._values = None
+
+    def values(self):
+        """범위 안에서 문자열 리터럴(또는 리터럴 삼항식)로 정해지는 const 변수"""
+        if self._values is None:
+            self._values = {}
+            text = self.src.code[self.scope[0]:self.scope[1]]
+            for m in re.finditer(r'\bconst\s+(\w+)\s*=\s*', text):
+                start = self.scope[0] + m.end()
+                end = self.src.expr_end(start)
+                self._values[m.group(1)] = (start, end)
+        return self._values
+
+    def literal(self, start, end, numbering):
+        """문자열 리터럴 / 삼항식 / 변수 / + 연결을 SQL 로. 알 수 없으면 None"""
+        src = self.src
+        start, end = _strip(src, start, end)
+        if start >= end:
+            return None
+        branches = _ternary(src, start, end)
+        if branches is not None:
+            # 두 가지 중 긴 쪽 (조건부 필터가 켜진 쪽) 을 쓴다
+            options = []
+            for s, e in branches:
+                local = dict(numbering)
+                value = self.literal(s, e, local)
+                if value is not None:
+                    options.append((len(value), value, local))
+            if not options:
+                return None
+            _, value, local = max(options, key=lambda o: o[0])
+            numbering.update(local)
+            return value
+        parts = self._concat(start, end)
+        if len(parts) > 1:
+            pieces = [self.literal(s, e, numbering) for s, e in parts]
+            return None if any(p is None for p in pieces) else ''.join(pieces)
+        if src.text[start] == '(' and src.pairs.get(start) == end - 1:
+            return self.literal(start + 1, end - 1, numbering)
+        if start in src.strings and src.strings[start][0] == end:
+            return self._string(start, end, numbering)
+        name = src.text[start:end]
+        if re.fullmatch(r'\w+', name) and name in self.values():
+            return self.literal(*self.values()[name], numbering)
+        return None
+
+    def _concat(self, start, end):
+        parts, s, i = [], start, start
+        src = self.src
+        while i < end:
+            if i in src.strings:
+                i = src.strings[i][0]
+                continue
+            c = src.code[i]
+            if c in '([{' and i in src.pairs:
+                i = src.pairs[i] + 1
+                continue
+            if c == '+' and src.code[i + 1:i + 2] not in '+=' and src.code[i - 1:i] != '+':
+                parts.append((s, i))
+                s = i + 1
+            i += 1
+        parts.append((s, end))
+        return parts
+
+    def _string(self, start, end, numbering):
+        src = self.src
+        if src.text[start] != '`':
+            return src.text[start + 1:end - 1].replace("\\'", "'").replace('\\"', '"')
+        out, i = [], start + 1
+        while i < end - 1:
+            if src.text.startswith('${', i) and i + 1 in src.pairs:
+                close = src.pairs[i + 1]
+                expr = src.text[i + 2:close].strip()
+                if out and out[-1] == '$':
+                    # $${n} -> 자리표시자. 같은 조각의 같은 식은 같은 번호
+                    out.pop()
+                    if expr not in numbering:
+                        numbering[expr] = numbering['#next']
+                        numbering['#next'] += 1
+                    out.append(f'${numbering[expr]}')
+                else:
+                    value = self.literal(i + 2, close, numbering)
+                    if value is None:
+                        self.dynamic = True
+                        value = 'NULL'
+                    out.append(value)
+                i = close + 1
+                continue
+            out.append(src.text[i])
+            i += 1
+        return ''.join(out)
+
+
+class QueryCall:
+    """라우트 파일 안의 query() 호출 하나"""
+
+    def __init__(self, path, line, route, func, sql, dynamic, built, params, loop):
+        self.path = path            # 라우트 파일 경로
+        self.line = line            # 호출 줄 번호
+        self.route = route          # 'GET /:id' 등 (라우트 핸들러 밖이면 None)
+        self.func = func            # 'query' 또는 'client.query'
+        self.sql = sql              # 재구성한 SQL (조건부 조각 모두 포함)
+        self.dynamic = dynamic      # 알 수 없는 ${...} 를 NULL 로 바꿨는지
+        self.built = built          # 변수에 조각을 이어 붙여 만든 쿼리인지
+        self.params = params        # {자리표시자 번호: 바인드 값 JS 식}
+        self.loop = loop            # 반복문 안이면 (종류, 줄 번호), 아니면 None
+        self.ordinal = 1            # 같은 라우트 안에서 몇 번째 호출인지
+        self.first_row_only = False  # 결과를 rows.length / rows[0] / rowCount 로만 쓰는지
+
+    @property
+    def file(self):
+        return os.path.relpath(self.path, BASE_DIR)
+
+    @property
+    def key(self):
+        """보고서·기준선에서 쿼리를 가리키는 이름 (줄 번호가 바뀌어도 유지)"""
+        name = os.path.basename(self.path)
+        return f'{name} {self.route or "(module)"} #{self.ordinal}'
+
+    def __repr__(self):
+        return f'<QueryCall {self.file}:{self.line} {self.route}>'
+
+
+def _routes(src):
+    spans = []
+    for m in ROUTE_RE.finditer(src.code):
+        open_pos = m.end() - 1
+        args = src.split_args(open_pos)
+        path = src.text[args[0][0]:args[0][1]].strip().strip('\'"`') if args else '?'
+        spans.append((open_pos, src.close(open_pos), f'{m.group(1).upper()} {path}'))
+    return spans
+
+
+def _loops(src):
+    spans = []
+    for m in LOOP_RE.finditer(src.code):
+        open_pos = m.end() - 1
+        close = src.close(open_pos)
+        if m.group(1):
+            # for / while: 조건 괄호 뒤 본문 블록(또는 한 문장)까지
+            i = close + 1
+            while i < len(src.code) and src.code[i].isspace():
+                i += 1
+            end = src.close(i) if src.code[i:i + 1] == '{' else src.expr_end(i)
+            spans.append((m.start(), end, m.group(1)))
+        else:
+            spans.append((open_pos, close, f'.{m.group(2)}()'))
+    return spans
+
+
+def _fragments(src, scope, name, before):
+    """변수 name 의 선언 리터럴과 `+=` 조각 위치 목록 (before 이전, 문서 순서)"""
+    found = []
+    for m in ASSIGN_RE.finditer(src.code, scope[0], before):
+        var = m.group(1) or m.group(2)
+        if var != name:
+            continue
+        op = '=' if m.group(1) else m.group(3)
+        start = m.end()
+        end = src.expr_end(start)
+        if op == '=':
+            found = []     # 다시 대입하면 앞 조각은 버린다
+        found.append((start, end))
+    return found
+
+
+def _pushes(src, start, end, target):
+    """target.push(...) 인자 JS 식 목록 (start~end 범위, 순서대로)"""
+    values = []
+    for m in PUSH_RE.finditer(src.code, start, end):
+        if m.group(1) != target:
+            continue
+        for s, e in src.split_args(m.end() - 1):
+            values.append(src.clean(s, e))
+    return values
+
+
+def _array_items(src, start, end):
+    """배열 리터럴 [a, b] 의 항목 JS 식 목록. 삼항식이면 항목이 많은 쪽"""
+    start, end = _strip(src, start, end)
+    branches = _ternary(src, start, end)
+    if branches is not None:
+        options = [_array_items(src, s, e) for s, e in branches]
+        options = [o for o in options if o is not None]
+        return max(options, key=len) if options else None
+    if src.text[start:start + 1] != '[':
+        return None
+    return [src.clean(s, e) for s, e in src.split_args(start)]
+
+
+def extract(path, text=None):
+    """파일 하나의 QueryCall 목록"""
+    src = Source(path, text)
+    routes = _routes(src)
+    loops = _loops(src)
+    calls = []
+    ordinals = {}
+    for m in CALL_RE.finditer(src.code):
+        func = m.group(1)
+        if func in NOT_QUERY_TARGETS or (func != 'query' and not func.endswith('.query')):
+            continue
+        open_pos = m.end() - 1
+        args = src.split_args(open_pos)
+        if not args:
+            continue
+        route = None
+        scope = (0, len(src.text))
+        for start, end, name in routes:
+            if start < m.start() < end:
+                route, scope = name, (start, end)
+        resolver = Resolver(src, scope)
+        numbering = {'#next': 1}
+        arg_start, arg_end = _strip(src, *args[0])
+        first = src.text[arg_start:arg_end]
+        params = {}
+        built = False
+
+        if re.fullmatch(r'\w+', first) and first not in resolver.values():
+            # 조각을 이어 붙여 만든 쿼리: 조각마다 번호를 매기고 그 조각의 push 를 짝지어 둔다
+            frags = _fragments(src, scope, first, m.start())
+            if not frags:
+                continue
+            built = len(frags) > 1
+            target = None
+            if len(args) > 1:
+                target = src.text[args[1][0]:args[1][1]].strip()
+                # 배열 선언에 처음부터 들어 있는 값 ([status] 등) 이 앞 번호를 차지한다
+                items = _array_items(src, *_declaration(src, scope, target, m.start()))
+                params = {i: v for i, v in enumerate(items or [], 1)}
+            decl_block = src.block(frags[0][0])
+            sql_parts = []
+            for k, (fs, fe) in enumerate(frags):
+                numbering = {'#next': numbering['#next']}
+                first_new = numbering['#next']
+                part = resolver.literal(fs, fe, numbering)
+                if part is None:
+                    resolver.dynamic = True
+                    part = ' NULL '
+                sql_parts.append(part)
+                if target and re.fullmatch(r'\w+', target):
+                    block = src.block(fs)
+                    if block == decl_block:
+                        stop = frags[k + 1][0] if k + 1 < len(frags) else m.start()
+                        window = (fe, stop)
+                    else:
+                        window = block
+                    values = _pushes(src, window[0], window[1], target)
+                    for n, value in zip(range(first_new, numbering['#next']), values):
+                        params[n] = value
+                # 고정 번호($1 등)를 쓰는 조각이면 그 다음 번호부터 이어 간다
+                fixed = [int(x) for x in re.findall(r'\$(\d+)', part)]
+                numbering['#next'] = max([numbering['#next'], *[x + 1 for x in fixed]])
+            sql = ''.join(sql_parts)
+        else:
+            sql = resolver.literal(arg_start, arg_end, numbering)
+            if sql is None:
+                continue
+            if len(args) > 1:
+                items = _array_items(src, *args[1])
+                if items is None and re.fullmatch(r'\w+', src.text[args[1][0]:args[1][1]].strip()):
+                    items = _array_items(src, *_declaration(
+                        src, scope, src.text[args[1][0]:args[1][1]].strip(), m.start()))
+                if items:
+                    params = {i: v for i, v in enumerate(items, 1)}
+
+        loop = None
+        for start, end, kind in loops:
+            if start < m.start() < end:
+                loop = (kind, src.line(start))
+        call = QueryCall(path, src.line(m.start()), route, func, ' '.join(sql.split()),
+                         resolver.dynamic, built, params, loop)
+        call.first_row_only = _first_row_only(src, scope, m.start(), src.close(open_pos))
+        ordinals[route] = ordinals.get(route, 0) + 1
+        call.ordinal = ordinals[route]
+        calls.append(call)
+    return calls
+
+
+def _first_row_only(src, scope, start, end):
+    """`x = await query(..)` 의 x 를 다음 대입 전까지 rows.length / rows[0] / rowCount 로만 쓰면 True"""
+    m = RESULT_RE.search(src.code[scope[0]:start])
+    if not m:
+        return False
+    name = m.group(1)
+    stop = re.search(rf'(?<![\w$.]){name}\s*=(?!=)', src.code[end:scope[1]])
+    window = src.code[end:end + stop.start() if stop else scope[1]]
+    uses = [u.end() for u in re.finditer(rf'(?<![\w$.]){name}\b', window)]
+    return bool(uses) and all(FIRST_ROW_USE_RE.match(window, pos) for pos in uses)
+
+
+def _declaration(src, scope, name, before):
+    """name 의 마지막 선언식 (시작, 끝) 위치. 없으면 빈 범위"""
+    found = (0, 0)
+    for m in re.finditer(rf'\b(?:let|const|var)\s+{re.escape(name)}\s*=\s*', src.code[:before]):
+        if m.start() >= scope[0]:
+            found = (m.end(), src.expr_end(m.end()))
+    return found
+
+
+def route_files(routes_dir=ROUTES_DIR):
+    return sorted(glob.glob(os.path.join(routes_dir, '*.js')))
+
+
+def extract_all(routes_dir=ROUTES_DIR):
+    calls = []
+    for path in route_files(routes_dir):
+        calls.extend(extract(path))
+    return calls
+
+
+if __name__ == '__main__':
+    for call in extract_all():
+        flags = ''.join([' [dynamic]' if call.dynamic else '', ' [built]' if call.built else '',
+                         f' [loop {call.loop[0]}]' if call.loop else ''])
+        print(f'{call.file}:{call.line} {call.route}{flags}\n    {call.sql}\n    params={call.params}')
@@ -0,0 +1,507 @@
+"""
+데이터베이스 스키마 모델 (정적 분석 도구 공용)
+database/schema.sql 위에 다른 database/*.sql 과 migrations/*.sql 을 순서대로 적용하고,
+라우트 파일이 실행 시점에 만드는 테이블·인덱스(CREATE TABLE IF NOT EXISTS 등)까지 더해
+운영 DB 에 있을 테이블·컬럼·인덱스를 재구성한다. DB 에 접속하지 않는다.
+
+- 인덱스: 컬럼 / 식, 연산자 클래스(gin_trgm_ops, text_pattern_ops 등), 접근 방식(btree/gin/gist),
+  UNIQUE, 부분 인덱스 WHERE 조건
+- PRIMARY KEY / UNIQUE 제약은 PostgreSQL 처럼 btree 인덱스로 친다 (FOREIGN KEY 는 인덱스를 만들지 않는다)
+- DO $$ ... $$ 블록 안의 ALTER TABLE / CREATE INDEX 도 적용한다 (조건 없이 실행된 것으로 본다)
+
+seed.sql / test-accounts.sql 은 데이터만 넣으므로 읽지 않는다.
+SQL 토큰화(tokenize)와 문장 구조 분석(Query: 서브쿼리 범위, 절, 별칭 -> 테이블)도 여기 둔다.
+"""
+
+import glob
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_DIR = os.path.join(BASE_DIR, 'database')
+SKIP_FILES = {'seed.sql', 'test-accounts.sql'}
+CLAUSE_KEYWORDS = {'select', 'from', 'where', 'on', 'having', 'set', 'values', 'returning', 'limit', 'offset'}
+
+KEYWORDS = {
+    'select', 'from', 'where', 'and', 'or', 'not', 'join', 'left', 'right', 'inner', 'outer', 'full',
+    'cross', 'on', 'using', 'group', 'by', 'order', 'having', 'limit', 'offset', 'as', 'in', 'is',
+    'null', 'true', 'false', 'like', 'ilike', 'between', 'exists', 'case', 'when', 'then', 'else',
+    'end', 'distinct', 'union', 'all', 'any', 'some', 'asc', 'desc', 'nulls', 'first', 'last',
+    'insert', 'into', 'values', 'update', 'set', 'delete', 'returning', 'with', 'filter', 'over',
+    'partition', 'similar', 'to', 'lateral', 'interval', 'cast', 'default', 'conflict', 'do', 'nothing',
+}
+
+TOKEN_RE = re.compile(r"""
+      (?P<ws>\s+)
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>(?:[eE])?'(?:[^']|'')*')
+    | (?P<dollar>\$(?P<tag>[A-Za-z_]\w*)?\$.*?\$(?P=tag)?\$)
+    | (?P<param>\$\d+)
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<qident>"(?:[^"]|"")+")
+    | (?P<ident>[A-Za-z_][\w$]*)
+    | (?P<op>::|<>|!=|<=|>=|~~\*|!~~\*|~~|!~~|!~\*|~\*|\|\||[-+*/%=<>~!@#^&|`?(),.;\[\]:])
+""", re.VERBOSE | re.DOTALL)
+
+DDL_RE = re.compile(r"""
+      (?P<table>\bCREATE\s+TABLE\s+(?P<t_ine>IF\s+NOT\s+EXISTS\s+)?(?P<t_name>[\w."]+)\s*\()
+    | (?P<index>\bCREATE\s+(?P<i_unique>UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?P<i_ine>IF\s+NOT\s+EXISTS\s+)?
+        (?P<i_name>[\w"]+)\s+ON\s+(?:ONLY\s+)?(?P<i_table>[\w."]+)\s*(?:USING\s+(?P<i_method>\w+)\s*)?\()
+    | (?P<alter>\bALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?(?P<a_name>[\w."]+)\s+)
+    | (?P<dropindex>\bDROP\s+INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?(?P<d_name>[\w"]+))
+    | (?P<extension>\bCREATE\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<e_name>[\w"]+))
+""", re.VERBOSE | re.IGNORECASE)
+
+
+# ── SQL 토큰 ─────────────────────────────────────────────────
+
+class Token:
+    __slots__ = ('kind', 'text', 'value', 'depth')
+
+    def __init__(self, kind, text, depth):
+        self.kind = kind        # ident / keyword / string / param / number / op
+        self.text = text
+        self.value = text.lower() if kind in ('ident', 'keyword') else text
+        self.depth = depth      # 괄호 깊이
+
+    def __repr__(self):
+        return f'{self.kind}:{self.text}'
+
+
+def tokenize(sql):
+    """SQL -> Token 목록 (공백·주석 제외). 따옴표 식별자는 ident, 예약어는 keyword 로 구분"""
+    tokens = []
+    depth = 0
+    pos = 0
+    while pos < len(sql):
+        m = TOKEN_RE.match(sql, pos)
+        if m is None:
+            pos += 1
+            continue
+        pos = m.end()
+        kind = m.lastgroup
+        text = m.group(0)
+        if kind in ('ws', 'comment'):
+            continue
+        if kind == 'tag':
+            kind = 'dollar'
+        if kind == 'qident':
+            kind, text = 'ident', text[1:-1].replace('""', '"')
+        elif kind == 'ident' and text.lower() in KEYWORDS:
+            kind = 'keyword'
+        elif kind == 'dollar':
+            kind = 'string'
+        if text == ')':
+            depth -= 1
+        tokens.append(Token(kind, text, depth))
+        if text == '(':
+            depth += 1
+    return tokens
+
+
+def strip_comments(sql):
+    return ''.join(t.group(0) if t.lastgroup != 'comment' else ' '
+                   for t in TOKEN_RE.finditer(sql))
+
+
+def split_top(text, sep=','):
+    """괄호·따옴표 밖의 sep 로 text 를 나눈다"""
+    parts, depth, start, i = [], 0, 0, 0
+    while i < len(text):
+        c = text[i]
+        if c == "'":
+            end = text.find("'", i + 1)
+            while end >= 0 and text[end + 1:end + 2] == "'":
+                end = text.find("'", end + 2)
+            i = len(text) if end < 0 else end + 1
+            continue
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif depth == 0 and text.startswith(sep, i):
+            parts.append(text[start:i])
+            start = i + len(sep)
+        i += 1
+    parts.append(text[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def matching_paren(text, open_pos):
+    depth = 0
+    for i in range(open_pos, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(text)
+
+
+def normalize(expr):
+    """식 비교용 정규화: 소문자, 공백 제거, 바깥 괄호 제거"""
+    expr = re.sub(r'\s+', '', expr.lower())
+    while expr.startswith('(') and matching_paren(expr, 0) == len(expr) - 1:
+        expr = expr[1:-1]
+    return expr
+
+
+# ── 스키마 모델 ─────────────────────────────────────────────────
+
+class IndexKey:
+    """인덱스 키 하나. column 이 None 이면 식 인덱스 (expr 로 비교)"""
+
+    def __init__(self, column, expr, opclass=None, descending=False):
+        self.column = column
+        self.expr = expr
+        self.opclass = opclass
+        self.descending = descending
+
+    def __repr__(self):
+        return ' '.join(filter(None, [self.column or f'({self.expr})', self.opclass,
+                                      'DESC' if self.descending else None]))
+
+
+class Index:
+    def __init__(self, name, table, keys, method='btree', unique=False, where=None,
+                 source=None, constraint=False):
+        self.name = name
+        self.table = table
+        self.keys = keys            # [IndexKey]
+        self.method = method        # btree / gin / gist / hash / brin
+        self.unique = unique
+        self.where = where          # 부분 인덱스 조건 (정규화한 텍스트) 또는 None
+        self.source = source        # 정의한 파일 (BASE_DIR 기준 상대 경로)
+        self.constraint = constraint  # PRIMARY KEY / UNIQUE 제약에서 생긴 인덱스
+
+    @property
+    def columns(self):
+        return [k.column for k in self.keys]
+
+    def __repr__(self):
+        where = f' WHERE {self.where}' if self.where else ''
+        return f'{self.name} ON {self.table} USING {self.method} ({", ".join(map(repr, self.keys))}){where}'
+
+
+class Table:
+    def __init__(self, name, source=None):
+        self.name = name
+        self.columns = {}       # 컬럼 이름 -> 타입 텍스트 (소문자)
+        self.foreign_keys = []  # (컬럼, 참조 테이블, 참조 컬럼)
+        self.source = source
+
+    def __repr__(self):
+        return f'<Table {self.name} ({len(self.columns)} columns)>'
+
+
+class Schema:
+    """테이블·인덱스 모음. load() 로 저장소의 SQL 을 모두 적용한 스키마를 만든다"""
+
+    def __init__(self):
+        self.tables = {}
+        self.indexes = {}       # 인덱스 이름 -> Index
+        self.extensions = set()
+        self.sources = []
+
+    def table_indexes(self, table):
+        return [ix for ix in self.indexes.values() if ix.table == table]
+
+    def column_type(self, table, column):
+        t = self.tables.get(table)
+        return t.columns.get(column) if t else None
+
+    # ── DDL 적용 ────────────────────────────────────────────
+
+    def apply(self, sql, source=None):
+        """DDL 텍스트를 문서 순서대로 적용. 데이터 문(INSERT 등)과 모르는 문은 무시한다"""
+        sql = strip_comments(sql)
+        for m in DDL_RE.finditer(sql):
+            kind = m.lastgroup
+            if kind == 'table':
+                close = matching_paren(sql, m.end() - 1)
+                self._create_table(_name(m.group('t_name')), sql[m.end():close], m.group('t_ine'), source)
+            elif kind == 'index':
+                close = matching_paren(sql, m.end() - 1)
+                rest = sql[close + 1:]
+                end = rest.find(';')
+                rest = rest if end < 0 else rest[:end]
+                where = re.search(r'\bWHERE\b(.*)$', rest, re.I | re.S)
+                self._create_index(_name(m.group('i_name')), _name(m.group('i_table')), sql[m.end():close],
+                                   (m.group('i_method') or 'btree').lower(), bool(m.group('i_unique')),
+                                   normalize(where.group(1)) if where else None, bool(m.group('i_ine')), source)
+            elif kind == 'alter':
+                rest = sql[m.end():]
+                end = re.search(r';|\$\$', rest)
+                self._alter_table(_name(m.group('a_name')), rest[:end.start() if end else len(rest)], source)
+            elif kind == 'dropindex':
+                self.indexes.pop(_name(m.group('d_name')), None)
+            elif kind == 'extension':
+                self.extensions.add(_name(m.group('e_name')))
+        if source:
+            self.sources.append(source)
+
+    def _create_table(self, name, body, if_not_exists, source):
+        if name in self.tables:
+            if if_not_exists:
+                return
+        table = self.tables[name] = Table(name, source)
+        for item in split_top(body):
+            head = re.match(r'\w*', item).group(0).upper()
+            if head in ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK', 'EXCLUDE'):
+                self._table_constraint(name, item, source)
+                continue
+            col, _, rest = item.partition(' ')
+            col = _name(col)
+            rest_upper = rest.upper()
+            table.columns[col] = re.split(r'\s+(?:NOT|NULL|DEFAULT|PRIMARY|UNIQUE|REFERENCES|CHECK|'
+                                          r'CONSTRAINT|GENERATED|COLLATE)\b', rest.strip(), 1,
+                                          flags=re.I)[0].lower()
+            if re.search(r'\bPRIMARY\s+KEY\b', rest_upper):
+                self._add_constraint_index(f'{name}_pkey', name, [col], source)
+            if re.search(r'\bUNIQUE\b', rest_upper):
+                self._add_constraint_index(f'{name}_{col}_key', name, [col], source)
+            ref = re.search(r'\bREFERENCES\s+([\w."]+)\s*(?:\(\s*([\w"]+)\s*\))?', rest, re.I)
+            if ref:
+                table.foreign_keys.append((col, _name(ref.group(1)), _name(ref.group(2) or 'id')))
+
+    def _table_constraint(self, table, item, source):
+        named = re.match(r'CONSTRAINT\s+([\w"]+)\s+(.*)$', item, re.I | re.S)
+        cname, item = (_name(named.group(1)), named.group(2)) if named else (None, item)
+        m = re.match(r'(PRIMARY\s+KEY|UNIQUE)\s*\(([^)]*)\)', item, re.I)
+        if m:
+            cols = [_name(c) for c in split_top(m.group(2))]
+            primary = m.group(1).upper().startswith('PRIMARY')
+            cname = cname or (f'{table}_pkey' if primary else f'{table}_{"_".join(cols)}_key')
+            self._add_constraint_index(cname, table, cols, source)
+            return
+        m = re.match(r'FOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+([\w."]+)\s*(?:\(([^)]*)\))?', item, re.I)
+        if m and table in self.tables:
+            cols = [_name(c) for c in split_top(m.group(1))]
+            refs = [_name(c) for c in split_top(m.group(3) or 'id')]
+            for col, ref in zip(cols, refs):
+                self.tables[table].foreign_keys.append((col, _name(m.group(2)), ref))
+
+    def _add_constraint_index(self, name, table, cols, source):
+        self.indexes[name] = Index(name, table, [IndexKey(c, c) for c in cols], unique=True,
+                                   source=source, constraint=True)
+
+    def _create_index(self, name, table, body, method, unique, where, if_not_exists, source):
+        if name in self.indexes and if_not_exists:
+            return
+        keys = []
+        for item in split_top(body):
+            descending = bool(re.search(r'\bDESC\b', item, re.I))
+            item = re.sub(r'\s+(ASC|DESC)\b|\s+NULLS\s+(FIRST|LAST)\b|\s+COLLATE\s+\S+', '', item, flags=re.I)
+            m = re.fullmatch(r'([\w"]+)(?:\s+([\w.]+))?', item.strip())
+            if m:
+                keys.append(IndexKey(_name(m.group(1)), _name(m.group(1)),
+                                     m.group(2).lower() if m.group(2) else None, descending))
+                continue
+            opclass = re.search(r'\)\s*([\w.]+)$', item.strip())
+            expr = item.strip()[:opclass.start() + 1] if opclass else item.strip()
+            keys.append(IndexKey(None, normalize(expr), opclass.group(1).lower() if opclass else None,
+                                 descending))
+        self.indexes[name] = Index(name, table, keys, method, unique, where, source)
+
+    def _alter_table(self, name, actions, source):
+        table = self.tables.get(name)
+        for action in split_top(actions):
+            m = re.match(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?([\w"]+)\s+(.*)$', action, re.I | re.S)
+            if m and m.group(1).upper() not in ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK'):
+                if table is not None:
+                    table.columns.setdefault(_name(m.group(1)), m.group(2).split()[0].lower())
+                continue
+            m = re.match(r'ADD\s+(.*)$', action, re.I | re.S)
+            if m:
+                self._table_constraint(name, m.group(1).strip(), source)
+                continue
+            m = re.match(r'DROP\s+CONSTRAINT\s+(?:IF\s+EXISTS\s+)?([\w"]+)', action, re.I)
+            if m:
+                self.indexes.pop(_name(m.group(1)), None)
+                continue
+            m = re.match(r'DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?([\w"]+)', action, re.I)
+            if m and table is not None:
+                table.columns.pop(_name(m.group(1)), None)
+
+
+# ── 쿼리 구조 ─────────────────────────────────────────────────
+
+class Query:
+    """토큰 목록에 범위(서브쿼리)·절·별칭 정보를 붙인다"""
+
+    def __init__(self, sql, schema):
+        self.sql = sql
+        self.schema = schema
+        self.tokens = tokenize(sql)
+        n = len(self.tokens)
+        self.scope = [0] * n          # 토큰이 속한 범위 (서브쿼리 여는 괄호 위치 + 1, 최상위 0)
+        self.clause = [None] * n      # where / on / order / ...
+        self.parent = {0: None}
+        self.aliases = {0: {}}        # 범위 -> {별칭: 테이블 (파생 테이블이면 None)}
+        self.joined = {}              # (범위, 별칭) -> JOIN 으로 붙은 테이블인지
+        self.limited = set()          # LIMIT 이 있는 범위
+        self._analyze()
+
+    def _analyze(self):
+        toks = self.tokens
+        stack = [0]                   # 괄호마다 그 안의 범위
+        clause = {0: None}
+        expect_table = None           # 다음 식별자를 테이블로 읽을 범위
+        for i, tok in enumerate(toks):
+            scope = stack[-1]
+            if tok.text == '(':
+                nxt = toks[i + 1] if i + 1 < len(toks) else None
+                if nxt is not None and nxt.value in ('select', 'with'):
+                    new = i + 1
+                    self.parent[new] = scope
+                    self.aliases[new] = {}
+                    clause[new] = None
+                    stack.append(new)
+                else:
+                    stack.append(scope)
+                self.scope[i] = scope
+                self.clause[i] = clause[scope]
+                continue
+            if tok.text == ')':
+                inner = stack.pop() if len(stack) > 1 else 0
+                scope = stack[-1]
+                self.scope[i] = scope
+                self.clause[i] = clause[scope]
+                if inner != scope:
+                    # 파생 테이블 (SELECT ..) alias
+                    j = i + 1
+                    if j < len(toks) and toks[j].value == 'as':
+                        j += 1
+                    if clause[scope] == 'from' and j < len(toks) and toks[j].kind == 'ident':
+                        self.aliases[scope][toks[j].value] = None
+                        expect_table = None
+                continue
+
+            v = tok.value
+            if tok.kind == 'keyword':
+                if v in ('group', 'order') and i + 1 < len(toks) and toks[i + 1].value == 'by':
+                    clause[scope] = v
+                elif v in CLAUSE_KEYWORDS:
+                    clause[scope] = v
+                    if v == 'limit':
+                        self.limited.add(scope)
+                if v in ('from', 'join', 'update', 'into'):
+                    if v == 'join':
+                        clause[scope] = 'from'
+                    expect_table = (scope, v == 'join')
+            elif tok.text == ',' and clause[scope] == 'from':
+                expect_table = (scope, False)
+            elif tok.kind == 'ident' and expect_table is not None and expect_table[0] == scope:
+                if toks[i + 1].text == '.' if i + 1 < len(toks) else False:
+                    pass      # schema.table
+                else:
+                    table = v
+                    alias = table
+                    j = i + 1
+                    if j < len(toks) and toks[j].value == 'as':
+                        j += 1
+                    if j < len(toks) and toks[j].kind == 'ident':
+                        alias = toks[j].value
+                    self.aliases[scope][alias] = table
+                    self.aliases[scope].setdefault(table, table)
+                    self.joined[(scope, alias)] = expect_table[1]
+                    expect_table = None
+            self.scope[i] = scope
+            self.clause[i] = clause[scope]
+
+    def chain(self, scope):
+        while scope is not None:
+            yield scope
+            scope = self.parent.get(scope)
+
+    def resolve(self, i):
+        """i 번 토큰에서 시작하는 컬럼 참조 -> (별칭, 테이블, 컬럼, 끝 위치 + 1) 또는 None"""
+        toks = self.tokens
+        tok = toks[i]
+        if tok.kind != 'ident':
+            return None
+        prev = toks[i - 1] if i > 0 else None
+        if prev is not None and (prev.text in ('.', '::') or prev.value == 'as'):
+            return None
+        nxt = toks[i + 1] if i + 1 < len(toks) else None
+        if nxt is not None and nxt.text == '(':
+            return None       # 함수 호출
+        if nxt is not None and nxt.text == '.' and i + 2 < len(toks) and toks[i + 2].kind in ('ident', 'keyword'):
+            qualifier, column, end = tok.value, toks[i + 2].value, i + 3
+            for scope in self.chain(self.scope[i]):
+                if qualifier in self.aliases[scope]:
+                    table = self.aliases[scope][qualifier]
+                    if table and column in self._columns(table):
+                        return qualifier, table, column, end
+                    return None
+            return None
+        for scope in self.chain(self.scope[i]):
+            found = {}
+            for alias, table in self.aliases[scope].items():
+                if table and tok.value in self._columns(table):
+                    if table not in found or found[table] == table:
+                        found[table] = alias
+            if len(found) == 1:
+                table, alias = next(iter(found.items()))
+                return alias, table, tok.value, i + 1
+            if found:
+                return None     # 모호한 컬럼
+        return None
+
+    def _columns(self, table):
+        t = self.schema.tables.get(table)
+        return t.columns if t else {}
+
+
+def close_paren(toks, open_index):
+    """토큰 목록에서 open_index 의 ( 와 짝이 되는 ) 위치"""
+    depth = 0
+    for k in range(open_index, len(toks)):
+        if toks[k].text == '(':
+            depth += 1
+        elif toks[k].text == ')':
+            depth -= 1
+            if depth == 0:
+                return k
+    return len(toks) - 1
+
+
+def _name(ident):
+    """스키마 접두어와 따옴표를 뗀 소문자 이름"""
+    ident = ident.split('.')[-1]
+    return ident[1:-1] if ident.startswith('"') else ident.lower()
+
+
+def sql_files(database_dir=DATABASE_DIR):
+    """적용 순서: schema.sql -> 나머지 database/*.sql (이름순) -> migrations/*.sql (이름순)"""
+    files = [os.path.join(database_dir, 'schema.sql')]
+    files += sorted(p for p in glob.glob(os.path.join(database_dir, '*.sql'))
+                    if os.path.basename(p) not in SKIP_FILES | {'schema.sql'})
+    files += sorted(glob.glob(os.path.join(database_dir, 'migrations', '*.sql')))
+    return [p for p in files if os.path.exists(p)]
+
+
+def load(database_dir=DATABASE_DIR, routes=True):
+    """저장소의 스키마. routes=True 면 라우트 파일이 실행 시점에 만드는 DDL 도 적용"""
+    schema = Schema()
+    for path in sql_files(database_dir):
+        with open(path, 'r', encoding='utf-8') as f:
+            schema.apply(f.read(), os.path.relpath(path, BASE_DIR))
+    if routes:
+        import db_routes
+        for call in db_routes.extract_all():
+            if re.match(r'\s*(CREATE|ALTER|DROP)\b', call.sql, re.I):
+                schema.apply(call.sql, f'{call.file}:{call.line}')
+    return schema
+
+
+if __name__ == '__main__':
+    schema = load()
+    for name, table in sorted(schema.tables.items()):
+        print(f'{name} ({len(table.columns)} 컬럼, {table.source})')
+        for ix in sorted(schema.table_indexes(name), key=lambda i: i.name):
+            print(f'    {"UNIQUE " if ix.unique else ""}{ix!r}')
+        for col, ref_table, ref_col in table.foreign_keys:
+            if not any(ix.columns[:1] == [col] for ix in schema.table_indexes(name)):
+                print(f'    (FK {col} -> {ref_table}.{ref_col} 인덱스 없음)')
@@ -3,12 +3,21 @@
 실행: python3 scripts/generate-dev-manual.py
 """
 
+import argparse
 import os
+from xml.sax.saxutils import escape
+
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import parse_xml
+
+import manual_cache
+import manual_pack
+import manual_profile
+import manual_stream
+from manual_styles import register_styles, style_id
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_FILE = os.path.join(BASE_DIR, '전북지역_졸업생네트워크_개발자매뉴얼.docx')
@@ -19,6 +28,39 @@ GRAY        = RGBColor(0x6b, 0x72, 0x80)
 GREEN       = RGBColor(0x06, 0x60, 0x2f)
 RED_DARK    = RGBColor(0x7f, 0x1d, 0x1d)
 CODE_BG     = RGBColor(0xf1, 0xf5, 0xf9)
+CODE_FG     = RGBColor(0x0f, 0x17, 0x2a)
+
+SIZE_BUDGET = 512 * 1024   # 결과 DOCX 용량 예산 (--max-size 로 변경, 0 이면 검사 안 함)
+
+# 본문 헬퍼와 표가 참조하는 스타일 (build_manual 시작 시 한 번 등록)
+MANUAL_STYLES = {
+    'Heading 1':          {'color': BRAND_BLUE, 'size': Pt(16), 'space_before': Pt(18), 'space_after': Pt(6)},
+    'Heading 2':          {'color': DARK, 'size': Pt(13), 'space_before': Pt(12), 'space_after': Pt(4)},
+    'Heading 3':          {'color': DARK, 'size': Pt(11), 'space_before': Pt(8), 'space_after': Pt(2)},
+    'Manual Body':        {'size': Pt(10.5)},
+    'List Bullet':        {'size': Pt(10.5), 'left_indent': Cm(0.5)},
+    'Code Block':         {'font': 'Courier New', 'size': Pt(9.5), 'color': CODE_FG, 'shading': str(CODE_BG),
+                           'left_indent': Cm(0.8), 'space_before': Pt(4), 'space_after': Pt(4)},
+    'Inline Code':        {'type': 'character', 'font': 'Courier New', 'size': Pt(9.5), 'color': CODE_FG},
+    'Note Info':          {'size': Pt(10), 'color': RGBColor(0x1e, 0x56, 0xa0), 'left_indent': Cm(0.8),
+                           'space_before': Pt(4), 'space_after': Pt(4)},
+    'Note Warning':       {'base': 'Note Info', 'color': RGBColor(0x92, 0x40, 0x0e)},
+    'Note Danger':        {'base': 'Note Info', 'color': RED_DARK},
+    # 표 셀 run 에 붙이는 문자 스타일
+    'Table Header':       {'type': 'character', 'bold': True},
+    'Table Cell':         {'type': 'character', 'size': Pt(10)},
+    'Small Table Header': {'type': 'character', 'base': 'Table Header', 'size': Pt(9.5)},
+    'Small Table Cell':   {'type': 'character', 'size': Pt(9.5)},
+    'API Header':         {'type': 'character', 'base': 'Table Header', 'size': Pt(10)},
+    'DB Column':          {'type': 'character', 'base': 'Small Table Cell', 'font': 'Courier New'},
+    'Method GET':         {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': RGBColor(0x05, 0x78, 0x03)},
+    'Method POST':        {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': RGBColor(0x00, 0x4e, 0xc7)},
+    'Method PUT':         {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': RGBColor(0x92, 0x40, 0x0e)},
+    'Method DELETE':      {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': RED_DARK},
+    'Method PATCH':       {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': RGBColor(0x5b, 0x21, 0xb6)},
+    'Method Other':       {'type': 'character', 'base': 'Table Cell', 'bold': True, 'color': GRAY},
+}
+NOTE_STYLES = {'info': 'Note Info', 'warning': 'Note Warning'}
 
 
 # ─────────────────────────── 헬퍼 ────────────────────────────
@@ -28,113 +70,108 @@ def add_page_break(doc):
 
 
 def h1(doc, text):
-    p = doc.add_heading(text, level=1)
-    p.runs[0].font.color.rgb = BRAND_BLUE
-    p.runs[0].font.size = Pt(16)
-    p.paragraph_format.space_before = Pt(18)
-    p.paragraph_format.space_after = Pt(6)
-    return p
+    return doc.add_heading(text, level=1)
 
 
 def h2(doc, text):
-    p = doc.add_heading(text, level=2)
-    p.runs[0].font.color.rgb = DARK
-    p.runs[0].font.size = Pt(13)
-    p.paragraph_format.space_before = Pt(12)
-    p.paragraph_format.space_after = Pt(4)
-    return p
+    return doc.add_heading(text, level=2)
 
 
 def h3(doc, text):
-    p = doc.add_heading(text, level=3)
-    p.runs[0].font.color.rgb = DARK
-    p.runs[0].font.size = Pt(11)
-    p.paragraph_format.space_before = Pt(8)
-    p.paragraph_format.space_after = Pt(2)
-    return p
+    return doc.add_heading(text, level=3)
 
 
 def body(doc, text):
-    p = doc.add_paragraph(text)
-    p.runs[0].font.size = Pt(10.5)
-    return p
+    return doc.add_paragraph(text, style='Manual Body')
 
 
 def code_block(doc, text):
-    """코드 블록 스타일의 단락"""
-    p = doc.add_paragraph()
-    p.paragraph_format.left_indent = Cm(0.8)
-    p.paragraph_format.space_before = Pt(4)
-    p.paragraph_format.space_after = Pt(4)
-    # 배경 음영 효과를 위해 shading XML 추가
-    pPr = p._p.get_or_add_pPr()
-    shd = OxmlElement('w:shd')
-    shd.set(qn('w:val'), 'clear')
-    shd.set(qn('w:color'), 'auto')
-    shd.set(qn('w:fill'), 'F1F5F9')
-    pPr.append(shd)
-    run = p.add_run(text)
-    run.font.name = 'Courier New'
-    run.font.size = Pt(9.5)
-    run.font.color.rgb = RGBColor(0x0f, 0x17, 0x2a)
-    return p
+    """코드 블록 스타일의 단락 (음영·글꼴은 Code Block 스타일에 정의)"""
+    return doc.add_paragraph(text, style='Code Block')
 
 
 def inline_code(paragraph, text):
     """인라인 코드"""
-    run = paragraph.add_run(f' {text} ')
-    run.font.name = 'Courier New'
-    run.font.size = Pt(9.5)
-    run.font.color.rgb = RGBColor(0x0f, 0x17, 0x2a)
-    return run
+    return paragraph.add_run(f' {text} ', style='Inline Code')
 
 
 def add_bullets(doc, items, indent=0):
     for item in items:
         p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Cm(0.5 + indent * 0.5)
-        p.runs[0].font.size = Pt(10.5)
+        if indent:
+            p.paragraph_format.left_indent = Cm(0.5 + indent * 0.5)
 
 
 def add_note(doc, text, kind='info'):
     prefix = '💡 ' if kind == 'info' else ('⚠️ ' if kind == 'warning' else '🔴 ')
-    color  = RGBColor(0x1e,0x56,0xa0) if kind=='info' else (RGBColor(0x92,0x40,0x0e) if kind=='warning' else RGBColor(0x7f,0x1d,0x1d))
-    p = doc.add_paragraph()
-    run = p.add_run(f'{prefix}{text}')
-    run.font.size = Pt(10)
-    run.font.color.rgb = color
-    p.paragraph_format.left_indent = Cm(0.8)
-    p.paragraph_format.space_before = Pt(4)
-    p.paragraph_format.space_after  = Pt(4)
+    doc.add_paragraph(f'{prefix}{text}', style=NOTE_STYLES.get(kind, 'Note Danger'))
+
+
+def _run_xml(text, rstyle=None):
+    """w:r XML 문자열. rstyle 은 문자 스타일 ID (w:rStyle)"""
+    content = ''
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            content += '<w:br/>'
+        for j, part in enumerate(line.split('\t')):
+            if j:
+                content += '<w:tab/>'
+            if part:
+                space = ' xml:space="preserve"' if part != part.strip() else ''
+                content += f'<w:t{space}>{escape(part)}</w:t>'
+    rpr = f'<w:rPr><w:rStyle w:val="{rstyle}"/></w:rPr>' if rstyle else ''
+    return f'<w:r>{rpr}{content}</w:r>'
+
+
+def add_bulk_table(doc, headers, rows, header_style='Table Header', cell_style=None, cell_format=None):
+    """
+    행 튜플 목록으로 표를 한 번에 생성한다.
+    tbl.cell() 은 호출마다 표 전체 셀 격자를 다시 훑어 행 수에 대해 이차 시간이 되므로,
+    모든 행의 XML 을 문자열로 만든 뒤 한 번 파싱해 붙인다.
+    header_style / cell_style: 셀 run 에 붙일 문자 스타일 이름
+    cell_format(ci, value) -> 문자 스타일 이름 또는 None (데이터 셀별 스타일, 선택)
+    """
+    tbl = doc.add_table(rows=0, cols=len(headers))
+    tbl.style = 'Light Shading Accent 1'
+    widths = [col.get(qn('w:w')) for col in tbl._tbl.tblGrid.iterchildren(qn('w:gridCol'))]
+
+    def row_xml(cells):
+        tcs = ''.join(
+            f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{w}"/></w:tcPr><w:p>{run}</w:p></w:tc>'
+            for w, run in zip(widths, cells))
+        return f'<w:tr>{tcs}</w:tr>'
+
+    ids = {}
+
+    def rstyle(name):
+        if name and name not in ids:
+            ids[name] = style_id(doc, name)
+        return ids.get(name)
+
+    parts = [row_xml(_run_xml(h, rstyle(header_style)) for h in headers)]
+    for row in rows:
+        parts.append(row_xml(
+            _run_xml(val, rstyle((cell_format(ci, val) if cell_format else None) or cell_style))
+            for ci, val in enumerate(row)))
+    fragment = parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(parts)}</w:tbl>')
+    tbl._tbl.extend(list(fragment))
+    return tbl
 
 
 def add_api_table(doc, rows):
     """
     rows = [(method, endpoint, auth, description), ...]
     """
-    tbl = doc.add_table(rows=1 + len(rows), cols=4)
-    tbl.style = 'Light Shading Accent 1'
-    # 헤더
-    hdrs = ['Method', 'Endpoint', 'Auth', '설명']
-    method_colors = {'GET': RGBColor(0x05,0x78,0x03), 'POST': RGBColor(0x00,0x4e,0xc7),
-                     'PUT': RGBColor(0x92,0x40,0x0e), 'DELETE': RGBColor(0x7f,0x1d,0x1d), 'PATCH': RGBColor(0x5b,0x21,0xb6)}
-    for i, h in enumerate(hdrs):
-        cell = tbl.cell(0, i)
-        cell.text = h
-        cell.paragraphs[0].runs[0].font.bold = True
-        cell.paragraphs[0].runs[0].font.size = Pt(10)
-    # 데이터
-    for ri, (method, endpoint, auth, desc) in enumerate(rows, 1):
-        tbl.cell(ri, 0).text = method
-        tbl.cell(ri, 1).text = endpoint
-        tbl.cell(ri, 2).text = auth
-        tbl.cell(ri, 3).text = desc
+    methods = {'GET', 'POST', 'PUT', 'DELETE', 'PATCH'}
+
+    def fmt(ci, val):
         # method 색상
-        color = method_colors.get(method, GRAY)
-        tbl.cell(ri, 0).paragraphs[0].runs[0].font.color.rgb = color
-        tbl.cell(ri, 0).paragraphs[0].runs[0].font.bold = True
-        for ci in range(4):
-            tbl.cell(ri, ci).paragraphs[0].runs[0].font.size = Pt(10)
+        if ci == 0:
+            return f'Method {val}' if val in methods else 'Method Other'
+        return None
+
+    add_bulk_table(doc, ['Method', 'Endpoint', 'Auth', '설명'], rows,
+                   header_style='API Header', cell_style='Table Cell', cell_format=fmt)
     doc.add_paragraph()  # 여백
 
 
@@ -143,27 +180,22 @@ def add_db_table(doc, table_name, columns):
     columns = [(col_name, type, nullable, description), ...]
     """
     h3(doc, f'▸ {table_name}')
-    tbl = doc.add_table(rows=1 + len(columns), cols=4)
-    tbl.style = 'Light Shading Accent 1'
-    for i, h in enumerate(['컬럼명', '타입', 'Nullable', '설명']):
-        cell = tbl.cell(0, i)
-        cell.text = h
-        cell.paragraphs[0].runs[0].font.bold = True
-        cell.paragraphs[0].runs[0].font.size = Pt(9.5)
-    for ri, (col, dtype, nullable, desc) in enumerate(columns, 1):
-        for ci, val in enumerate([col, dtype, nullable, desc]):
-            tbl.cell(ri, ci).text = val
-            r = tbl.cell(ri, ci).paragraphs[0].runs[0]
-            r.font.size = Pt(9.5)
-            if ci == 0:
-                r.font.name = 'Courier New'
+    add_bulk_table(doc, ['컬럼명', '타입', 'Nullable', '설명'], columns,
+                   header_style='Small Table Header', cell_style='Small Table Cell',
+                   cell_format=lambda ci, val: 'DB Column' if ci == 0 else None)
     doc.add_paragraph()
 
 
 # ─────────────────────────── 본문 ────────────────────────────
 
-def build_manual():
+def build_manual(use_cache=True, stream=False, profile=False, max_size=SIZE_BUDGET,
+                 zip_level=manual_pack.DEFAULT_LEVEL):
+    """매뉴얼을 생성하고 용량 예산 안이면 True 를 반환. zip_level=None 이면 재압축 생략"""
+    profiler = manual_profile.Profiler(profile)
+    profiler.instrument(globals())
+    sections = manual_cache.SectionCache('dev', __file__, SECTIONS, enabled=use_cache)
     doc = Document()
+    register_styles(doc, MANUAL_STYLES)
 
     # 여백
     for section in doc.sections:
@@ -172,6 +204,29 @@ def build_manual():
         section.left_margin   = Cm(3.0)
         section.right_margin  = Cm(2.5)
 
+    if stream:
+        with profiler.phase('섹션 조립 + 스트리밍 저장'):
+            with manual_stream.StreamingDocx(doc, OUTPUT_FILE) as writer:
+                sections.render(doc, flush=writer.write)
+    else:
+        with profiler.phase('섹션 조립'):
+            sections.render(doc)
+        with profiler.phase('섹션 캐시 저장'):
+            sections.store(doc)
+        with profiler.phase('DOCX 저장'):
+            if zip_level is not None:
+                manual_pack.prune_document(doc)
+            doc.save(OUTPUT_FILE)
+    if zip_level is not None:
+        with profiler.phase('ZIP 재압축'):
+            manual_pack.repack(OUTPUT_FILE, zip_level, prune=stream)
+    print(sections.summary())
+    print(f'✅ 개발자 매뉴얼 저장 완료: {OUTPUT_FILE}')
+    profiler.report(sections, OUTPUT_FILE)
+    return manual_profile.check_budget(OUTPUT_FILE, max_size)
+
+
+def section_cover(doc):
     # ── 표지 ──────────────────────────────────────────────────
     for _ in range(3):
         doc.add_paragraph()
@@ -202,6 +257,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_toc(doc):
     # ── 목차 ──────────────────────────────────────────────────
     h1(doc, '목   차')
     toc = [
@@ -225,6 +282,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_architecture(doc):
     # ╔═══════════════════════════════════╗
     # ║ 1장. 아키텍처 개요               ║
     # ╚═══════════════════════════════════╝
@@ -241,11 +300,6 @@ def build_manual():
     ])
 
     h2(doc, '1.2 기술 스택')
-    tbl = doc.add_table(rows=7, cols=3)
-    tbl.style = 'Light Shading Accent 1'
-    for ci, h in enumerate(['레이어', '기술', '버전']):
-        tbl.cell(0, ci).text = h
-        tbl.cell(0, ci).paragraphs[0].runs[0].font.bold = True
     rows_data = [
         ('Frontend', 'HTML5 / CSS3 / Vanilla JS', '-'),
         ('Backend', 'Node.js + Express', 'v22 / 4.18'),
@@ -254,10 +308,7 @@ def build_manual():
         ('Container', 'Docker + Docker Compose', '3.8'),
         ('Reverse Proxy', 'Nginx', '1.25-alpine'),
     ]
-    for ri, (layer, tech, ver) in enumerate(rows_data, 1):
-        for ci, val in enumerate([layer, tech, ver]):
-            tbl.cell(ri, ci).text = val
-            tbl.cell(ri, ci).paragraphs[0].runs[0].font.size = Pt(10)
+    add_bulk_table(doc, ['레이어', '기술', '버전'], rows_data, cell_style='Table Cell')
     doc.add_paragraph()
 
     h2(doc, '1.3 요청 흐름')
@@ -272,6 +323,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_setup(doc):
     # ╔═══════════════════════════════════╗
     # ║ 2장. 개발 환경 설정              ║
     # ╚═══════════════════════════════════╝
@@ -307,6 +360,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_structure(doc):
     # ╔═══════════════════════════════════╗
     # ║ 3장. 프로젝트 구조               ║
     # ╚═══════════════════════════════════╝
@@ -387,6 +442,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_database(doc):
     # ╔═══════════════════════════════════╗
     # ║ 4장. 데이터베이스 스키마          ║
     # ╚═══════════════════════════════════╝
@@ -474,6 +531,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_api(doc):
     # ╔═══════════════════════════════════╗
     # ║ 5장. Backend API 레퍼런스        ║
     # ╚═══════════════════════════════════╝
@@ -566,6 +625,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_auth(doc):
     # ╔═══════════════════════════════════╗
     # ║ 6장. 인증 (JWT)                  ║
     # ╚═══════════════════════════════════╝
@@ -592,6 +653,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_frontend(doc):
     # ╔═══════════════════════════════════╗
     # ║ 7장. 프론트엔드 구조             ║
     # ╚═══════════════════════════════════╝
@@ -625,26 +688,21 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_deploy(doc):
     # ╔═══════════════════════════════════╗
     # ║ 8장. 배포 (Docker / AWS)         ║
     # ╚═══════════════════════════════════╝
     h1(doc, '8장. 배포 (Docker / AWS)')
 
     h2(doc, '8.1 Docker Compose 서비스 구성')
-    tbl = doc.add_table(rows=4, cols=5)
-    tbl.style = 'Light Shading Accent 1'
-    for ci, h in enumerate(['서비스', '컨테이너명', '이미지', '포트', '역할']):
-        tbl.cell(0, ci).text = h
-        tbl.cell(0, ci).paragraphs[0].runs[0].font.bold = True
     svc_data = [
         ('postgres',  'graduate-network-db',       'postgres:15-alpine', '5432:5432', 'PostgreSQL DB'),
         ('backend',   'graduate-network-backend',  'custom(Dockerfile)',  '5000:5000', 'Express API'),
         ('frontend',  'graduate-network-frontend', 'nginx:1.25-alpine',  '80:80',     'Nginx + 정적파일'),
     ]
-    for ri, row in enumerate(svc_data, 1):
-        for ci, val in enumerate(row):
-            tbl.cell(ri, ci).text = val
-            tbl.cell(ri, ci).paragraphs[0].runs[0].font.size = Pt(9.5)
+    add_bulk_table(doc, ['서비스', '컨테이너명', '이미지', '포트', '역할'], svc_data,
+                   cell_style='Small Table Cell')
     doc.add_paragraph()
 
     h2(doc, '8.2 AWS EC2 최초 배포')
@@ -658,23 +716,13 @@ def build_manual():
         ('변경 유형',            '명령어',                                                        '', ''),
     ])
     # 별도 표로 처리
-    deploy_tbl = doc.add_table(rows=5, cols=2)
-    deploy_tbl.style = 'Light Shading Accent 1'
-    deploy_tbl.cell(0, 0).text = '변경 유형'
-    deploy_tbl.cell(0, 1).text = '명령어'
-    deploy_tbl.cell(0, 0).paragraphs[0].runs[0].font.bold = True
-    deploy_tbl.cell(0, 1).paragraphs[0].runs[0].font.bold = True
     deploy_rows = [
         ('HTML/CSS/JS 변경',    'git pull && docker-compose build --no-cache frontend && docker-compose up -d frontend'),
         ('백엔드 JS 변경',      'git pull && docker-compose build --no-cache backend && docker-compose up -d backend'),
         ('DB 스키마 변경',      'git pull && docker-compose exec postgres psql -U postgres graduate_network -f /migration.sql'),
         ('전체 재빌드',         'git pull && docker-compose build --no-cache && docker-compose up -d'),
     ]
-    for ri, (change, cmd) in enumerate(deploy_rows, 1):
-        deploy_tbl.cell(ri, 0).text = change
-        deploy_tbl.cell(ri, 1).text = cmd
-        for ci in range(2):
-            deploy_tbl.cell(ri, ci).paragraphs[0].runs[0].font.size = Pt(9.5)
+    add_bulk_table(doc, ['변경 유형', '명령어'], deploy_rows, cell_style='Small Table Cell')
     doc.add_paragraph()
 
     add_note(doc, 'HTML/CSS/JS 파일 변경 후 git pull만으로는 반영되지 않습니다. 반드시 docker-compose build --no-cache frontend 실행 후 up -d 해야 합니다.', 'warning')
@@ -688,6 +736,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_env(doc):
     # ╔═══════════════════════════════════╗
     # ║ 9장. 환경 변수                   ║
     # ╚═══════════════════════════════════╝
@@ -703,6 +753,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_nginx(doc):
     # ╔═══════════════════════════════════╗
     # ║ 10장. Nginx 설정                 ║
     # ╚═══════════════════════════════════╝
@@ -715,6 +767,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_appendix(doc):
     # ╔═══════════════════════════════════╗
     # ║ 부록. 마이그레이션/트러블슈팅    ║
     # ╚═══════════════════════════════════╝
@@ -757,20 +811,12 @@ def build_manual():
     code_block(doc, '# 서버 상태 확인\ncurl http://localhost:5001/api/health\n\n# DB 직접 접속 (로컬)\nexport PATH="/Applications/Postgres.app/Contents/Versions/latest/bin:$PATH"\npsql -U <user> -d graduate_network\n\n# 테이블 목록\n\\dt\n\n# 컬럼 확인\n\\d users\n\n# 사용자 확인\nSELECT id, email, user_type, is_active FROM users LIMIT 10;\n\n# Docker 로그\ndocker-compose logs -f --tail=100 backend\n\n# 컨테이너 상태\ndocker-compose ps')
 
     h2(doc, 'D. 테스트 계정 (로컬 개발)')
-    tbl2 = doc.add_table(rows=4, cols=3)
-    tbl2.style = 'Light Shading Accent 1'
-    for ci, h in enumerate(['역할', '이메일', '비밀번호']):
-        tbl2.cell(0, ci).text = h
-        tbl2.cell(0, ci).paragraphs[0].runs[0].font.bold = True
     test_accounts = [
         ('관리자 (admin)',  'admin@jeonjutech.edu',   'manual123'),
         ('교사 (teacher)', 'teacher.kim@example.com', 'manual123'),
         ('학생 (student)', 'jung.yuna@example.com',  'manual123'),
     ]
-    for ri, (role, email, pw) in enumerate(test_accounts, 1):
-        for ci, val in enumerate([role, email, pw]):
-            tbl2.cell(ri, ci).text = val
-            tbl2.cell(ri, ci).paragraphs[0].runs[0].font.size = Pt(10)
+    add_bulk_table(doc, ['역할', '이메일', '비밀번호'], test_accounts, cell_style='Table Cell')
     doc.add_paragraph()
 
     add_note(doc, '위 계정들은 로컬 개발/테스트 전용입니다. 운영 서버(jjobb.kr)에서는 실제 비밀번호로 변경하세요.', 'warning')
@@ -782,9 +828,41 @@ def build_manual():
     footer.runs[0].font.color.rgb = GRAY
     footer.runs[0].font.size = Pt(9)
 
-    doc.save(OUTPUT_FILE)
-    print(f'✅ 개발자 매뉴얼 저장 완료: {OUTPUT_FILE}')
+
+# 문서 순서대로 나열한 섹션. 캐시 단위이므로 함수 이름이 캐시 파일 이름이 된다
+SECTIONS = [
+    section_cover,
+    section_toc,
+    section_architecture,
+    section_setup,
+    section_structure,
+    section_database,
+    section_api,
+    section_auth,
+    section_frontend,
+    section_deploy,
+    section_env,
+    section_nginx,
+    section_appendix,
+]
 
 
 if __name__ == '__main__':
-    build_manual()
+    parser = argparse.ArgumentParser(description='개발자 매뉴얼 DOCX 생성')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='섹션 캐시를 쓰지 않고 모든 섹션을 다시 렌더링')
+    parser.add_argument('--stream', action='store_true',
+                        help='섹션 단위로 DOCX 에 흘려 써서 문서 크기와 무관하게 메모리 사용을 일정하게 유지')
+    parser.add_argument('--profile', action='store_true',
+                        help='섹션·헬퍼별 시간과 DOCX 파트별 크기 보고')
+    parser.add_argument('--max-size', type=manual_profile.parse_size, default=SIZE_BUDGET,
+                        help='DOCX 용량 예산 (예: 512KB, 1MB). 넘으면 종료 코드 1 (0 이면 검사 안 함)')
+    parser.add_argument('--zip-level', type=int, choices=range(10), default=manual_pack.DEFAULT_LEVEL,
+                        help=f'XML 파트 deflate 수준 0-9 (기본값: {manual_pack.DEFAULT_LEVEL})')
+    parser.add_argument('--no-repack', action='store_true',
+                        help='저장 후 재압축·불필요 파트 정리를 하지 않고 python-docx 출력 그대로 둠')
+    args = parser.parse_args()
+    ok = build_manual(use_cache=not args.no_cache, stream=args.stream,
+                      profile=args.profile, max_size=args.max_size,
+                      zip_level=None if args.no_repack else args.zip_level)
+    raise SystemExit(0 if ok else 1)
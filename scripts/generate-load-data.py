@@ -0,0 +1,629 @@
+"""
+부하 테스트용 합성 데이터 생성기 (COPY 형식)
+schema.sql 의 테이블에 맞춰 참조 무결성이 맞는 한국어 데이터를 규모 배수(--scale)만큼 만들고,
+psql 로 바로 넣을 수 있는 COPY ... FROM stdin 스크립트로 쓴다. INSERT 를 한 줄씩 넣는 대신
+COPY 로 넣으므로 --scale 10 (사용자 10만, 메시지 100만) 도 수십 초 안에 들어간다.
+
+- 같은 --seed / --scale 이면 워커 수와 관계없이 바이트 단위로 같은 결과
+  (청크 크기를 고정하고 청크마다 시드에서 파생한 난수 생성기를 쓴다)
+- 테이블·청크 단위로 프로세스 풀에서 병렬 생성. 사용자 유형·게시글 댓글 수처럼 다른 테이블이
+  참조하는 값은 id 만으로 계산되는 순수 함수라 워커끼리 상태를 나누지 않는다
+- 참조 무결성: 공고는 기업 회원만, 지원·게시글·댓글은 학생/졸업생/교사 등 역할에 맞는 회원만,
+  jobs.applications_count / posts.comments_count 는 실제 생성한 지원·댓글 수와 일치
+- 모든 계정 비밀번호는 seed.sql 과 같은 password123 (accounts.json 에 역할별 계정 목록)
+- id 는 1 부터 명시적으로 넣으므로 seed.sql 등으로 이미 데이터가 있는 DB 에는 --truncate 가 필요하다.
+  빠뜨리면 load.sql 이 COPY 전에 중복 키 오류 대신 --truncate 를 안내하는 오류로 멈춘다
+
+실행: python3 scripts/generate-load-data.py --scale 10 --truncate    # .load-data/load.sql + accounts.json
+      psql "$DATABASE_URL" -f .load-data/load.sql
+      python3 scripts/generate-load-data.py --scale 1 --stdout --truncate | psql "$DATABASE_URL"
+      python3 scripts/generate-load-data.py --tables messages,notifications   # 일부 테이블만
+"""
+
+import argparse
+import datetime
+import functools
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import db_schema
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(BASE_DIR, '.load-data')
+
+CHUNK_ROWS = 20000          # 바꾸면 같은 시드라도 결과가 달라진다
+PASSWORD = 'password123'
+PASSWORD_HASH = '$2b$10$rZ0HwKnIbZpYWzJQ/gWotuXp8kCVmH/k7dCLJW/RA7gx1i5YvYLVm'   # seed.sql 과 동일
+EMAIL_DOMAIN = 'loadtest.jjob.test'
+END = datetime.datetime(2026, 1, 1)
+START = END - datetime.timedelta(days=3 * 365)
+SPAN = (END - START).total_seconds()
+
+# --scale 1 기준 행 수 (job_applications / comments / connections 는 평균 개수로 정한다)
+BASE_ROWS = {
+    'users': 10000,
+    'jobs': 1000,
+    'posts': 5000,
+    'messages': 100000,
+    'notifications': 50000,
+}
+APPS_PER_JOB = 15
+COMMENTS_PER_POST = 4
+CONNECTIONS_PER_USER = 4
+
+# 사용자 유형 비율 (1000 분율)
+USER_TYPES = [('student', 450), ('graduate', 390), ('teacher', 50), ('company', 100), ('admin', 10)]
+
+# 적재 순서 (외래 키 순서)
+TABLES = ['users', 'company_profiles', 'graduate_profiles', 'jobs', 'job_applications',
+          'connections', 'posts', 'comments', 'messages', 'notifications']
+COLUMNS = {
+    'users': ['id', 'email', 'password_hash', 'name', 'user_type', 'phone', 'school_name', 'major',
+              'desired_job', 'graduation_year', 'is_active', 'last_login', 'created_at', 'updated_at'],
+    'company_profiles': ['user_id', 'company_name', 'industry', 'company_size', 'website', 'address',
+                         'description', 'founded_year', 'created_at', 'updated_at'],
+    'graduate_profiles': ['user_id', 'graduation_year', 'major', 'current_company', 'current_position',
+                          'career_start_date', 'bio', 'skills', 'is_mentor', 'mentor_capacity',
+                          'created_at', 'updated_at'],
+    'jobs': ['id', 'company_id', 'title', 'description', 'requirements', 'location', 'job_type',
+             'salary_range', 'experience_level', 'headcount', 'deadline', 'status', 'views_count',
+             'applications_count', 'created_at', 'updated_at'],
+    'job_applications': ['job_id', 'user_id', 'cover_letter', 'status', 'applied_at', 'updated_at'],
+    'connections': ['requester_id', 'receiver_id', 'status', 'message', 'created_at', 'updated_at'],
+    'posts': ['id', 'user_id', 'category', 'title', 'content', 'views_count', 'likes_count',
+              'comments_count', 'is_pinned', 'created_at', 'updated_at'],
+    'comments': ['id', 'post_id', 'user_id', 'parent_id', 'content', 'likes_count', 'created_at', 'updated_at'],
+    'messages': ['from_user_id', 'to_user_id', 'message', 'is_read', 'sent_at'],
+    'notifications': ['user_id', 'type', 'title', 'message', 'link', 'is_read', 'created_at'],
+}
+# id 를 직접 넣는 테이블은 적재 뒤 시퀀스를 맞춘다
+EXPLICIT_IDS = [t for t in TABLES if COLUMNS[t][0] == 'id']
+
+
+# ── 한국어 어휘 ─────────────────────────────────────────────────
+
+SURNAMES = ['김'] * 21 + ['이'] * 15 + ['박'] * 8 + ['최'] * 5 + ['정'] * 5 + \
+    ['강', '조', '윤', '장', '임', '한', '오', '서', '신', '권', '황', '안', '송', '류', '전', '홍', '고', '문']
+GIVEN = ['민', '서', '지', '현', '수', '준', '우', '영', '도', '하', '윤', '은', '재', '예', '성', '진',
+         '호', '유', '연', '태', '승', '동', '혜', '경', '주', '원', '채', '시', '건', '다']
+SCHOOLS = ['전주공업고등학교', '군산기계공업고등학교', '익산마이스터고등학교', '정읍제일고등학교',
+           '남원용성고등학교', '김제자영업고등학교', '완주공업고등학교', '전북기계공업고등학교']
+MAJORS = ['전기과', '전자과', '기계과', '컴퓨터과', '건축과', '토목과']
+ROLES = {
+    '전기과': ['전기설비 유지보수', '전기기사', '배전반 조립', '태양광 설비 시공'],
+    '전자과': ['전자부품 검사', 'PCB 조립', '반도체 장비 오퍼레이터', '품질관리'],
+    '기계과': ['CNC 가공', '설비 보전', '자동차 부품 생산', '금형 제작'],
+    '컴퓨터과': ['웹 개발', '전산 지원', '데이터 입력 및 관리', '네트워크 관리'],
+    '건축과': ['건축 현장 관리', 'CAD 설계 보조', '인테리어 시공', '건축 적산'],
+    '토목과': ['측량 보조', '토목 현장 관리', '도로 설계 보조', '안전 관리'],
+}
+SKILLS = {
+    '전기과': ['전기기능사', 'PLC', '배선', '시퀀스 제어'],
+    '전자과': ['회로 설계', '납땜', '오실로스코프', 'C'],
+    '기계과': ['CNC', 'AutoCAD', '용접', '밀링'],
+    '컴퓨터과': ['Python', 'JavaScript', 'SQL', 'Linux'],
+    '건축과': ['AutoCAD', 'Revit', '스케치업', '건축도장'],
+    '토목과': ['측량', 'Civil 3D', '토목 CAD', '안전관리'],
+}
+COMPANY_HEAD = ['한빛', '새만금', '전북', '호남', '대한', '미래', '동양', '신성', '우진', '태성',
+                '삼호', '한울', '청명', '금강', '모악']
+COMPANY_TAIL = ['정밀', '전자', '기계', '산업', '건설', '테크', '에너지', '모터스', '소재', '엔지니어링']
+INDUSTRIES = ['제조', '전기/전자', '건설', 'IT/서비스', '자동차 부품', '에너지']
+SIZES = ['스타트업', '중소기업', '중견기업', '대기업']
+LOCATIONS = ['전주시 완산구', '전주시 덕진구', '군산시', '익산시', '정읍시', '남원시', '김제시',
+             '완주군', '부안군', '고창군']
+POSITIONS = ['사원', '주임', '대리', '기사', '생산직', '연구원']
+JOB_TYPES = [('full-time', 70), ('contract', 15), ('internship', 10), ('part-time', 5)]
+EXPERIENCE = ['신입', '경력무관', '경력 1~3년', '경력 3년 이상']
+POST_CATEGORIES = [('자유게시판', 45), ('취업정보', 30), ('멘토링', 15), ('질문답변', 10)]
+POST_TOPICS = ['면접 후기', '자격증 준비', '첫 출근 후기', '이력서 질문', '현장실습 후기', '선배님께 질문',
+               '연봉 협상', '기숙사 생활', '야간 대학 병행', '졸업생 모임']
+SENTENCES = [
+    '최근 {company} {role} 직무로 지원했는데 준비 과정을 공유합니다.',
+    '{major} 졸업하고 {location}에서 일하고 있습니다.',
+    '{skill} 자격증은 실기 위주로 준비하는 게 좋았습니다.',
+    '면접에서는 현장실습 경험을 많이 물어봤습니다.',
+    '궁금한 점 있으시면 댓글이나 메시지 주세요.',
+    '후배님들께 조금이라도 도움이 되었으면 좋겠습니다.',
+    '출퇴근 시간과 근무 형태도 꼭 확인하세요.',
+    '선배님들의 조언 덕분에 많이 배웠습니다.',
+]
+COMMENTS = ['좋은 정보 감사합니다!', '저도 같은 고민이었는데 도움이 됐어요.', '혹시 면접 준비는 어떻게 하셨나요?',
+            '축하드립니다!', '메시지 드려도 될까요?', '자세한 후기 감사합니다.', '저도 지원해 보겠습니다.',
+            '실기 시험 팁도 알려주실 수 있나요?']
+MESSAGES = ['안녕하세요, {name}님. 멘토링 관련해서 여쭤보고 싶은 게 있습니다.', '지원하신 공고 관련해서 연락드립니다.',
+            '다음 주 모임 시간 확인 부탁드립니다.', '이력서 검토해 주셔서 감사합니다.', '면접 일정 조율 가능할까요?',
+            '자료 공유해 주셔서 감사합니다!', '{name}님, 연결 요청 수락해 주셔서 감사합니다.']
+NOTIFICATIONS = [
+    ('job', '새로운 채용 공고', '{company}에서 신규 채용 공고가 등록되었습니다.', '/jobs/{ref}'),
+    ('connection', '새로운 연결 요청', '{name}님이 연결을 요청했습니다.', '/networking/connections'),
+    ('message', '새 메시지', '{name}님이 메시지를 보냈습니다.', '/messages'),
+    ('comment', '새 댓글', '내 게시글에 새 댓글이 달렸습니다.', '/posts/{ref}'),
+    ('mentorship', '멘토링 매칭 완료', '{name} 선배님과 멘토링이 매칭되었습니다.', '/networking'),
+]
+
+
+# ── 결정적 함수 (워커마다 같은 값을 계산) ───────────────────────────
+
+def _mix(*values):
+    """정수 여러 개 -> 0..2^32-1 해시 (splitmix 계열, 프로세스와 무관하게 같은 값)"""
+    h = 0x9E3779B9
+    for v in values:
+        h = (h ^ (v & 0xFFFFFFFFFFFF)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 31
+    return h & 0xFFFFFFFF
+
+
+def counts(scale):
+    return {table: max(1, int(n * scale)) for table, n in BASE_ROWS.items()}
+
+
+def user_type(uid, seed):
+    bucket = _mix(seed, 1, uid) % 1000
+    for name, share in USER_TYPES:
+        if bucket < share:
+            return name
+        bucket -= share
+    return USER_TYPES[0][0]
+
+
+@functools.lru_cache(maxsize=None)
+def users_by_type(n_users, seed):
+    groups = {name: [] for name, _ in USER_TYPES}
+    for uid in range(1, n_users + 1):
+        groups[user_type(uid, seed)].append(uid)
+    # 어떤 규모에서도 역할마다 최소 한 명은 있도록
+    for name, members in groups.items():
+        if not members:
+            members.append(1)
+    return groups
+
+
+def user_created(uid, n_users, seed):
+    """가입 시각: id 순서대로 앞 80% 기간에 퍼뜨린다 (나중 id 일수록 최근)"""
+    base = (uid - 1) / max(1, n_users) * 0.8 * SPAN
+    jitter = _mix(seed, 2, uid) % 86400
+    return START + datetime.timedelta(seconds=base + jitter)
+
+
+def user_name(uid, seed):
+    h = _mix(seed, 3, uid)
+    return SURNAMES[h % len(SURNAMES)] + GIVEN[(h >> 8) % len(GIVEN)] + GIVEN[(h >> 16) % len(GIVEN)]
+
+
+def user_email(uid, seed):
+    return f'{user_type(uid, seed)}{uid}@{EMAIL_DOMAIN}'
+
+
+def user_active(uid, seed):
+    return _mix(seed, 13, uid) % 50 != 0          # 2% 는 비활성 계정
+
+
+def graduation_year(uid, seed):
+    """졸업생은 2016~2025, 재학생은 졸업 예정 연도 2026~2028"""
+    h = _mix(seed, 14, uid)
+    return 2016 + h % 10 if user_type(uid, seed) == 'graduate' else 2026 + h % 3
+
+
+def user_major(uid, seed):
+    return MAJORS[_mix(seed, 4, uid) % len(MAJORS)]
+
+
+def company_name(uid, seed):
+    h = _mix(seed, 5, uid)
+    name = COMPANY_HEAD[h % len(COMPANY_HEAD)] + COMPANY_TAIL[(h >> 8) % len(COMPANY_TAIL)]
+    return f'(주){name}' if h & 0x10000 else name
+
+
+def apps_for_job(job_id, seed):
+    return _mix(seed, 6, job_id) % (2 * APPS_PER_JOB + 1)
+
+
+def comments_for_post(post_id, seed):
+    h = _mix(seed, 7, post_id)
+    return h % (2 * COMMENTS_PER_POST + 1) if h >> 24 & 3 else 0     # 1/4 은 댓글 없음
+
+
+@functools.lru_cache(maxsize=None)
+def comment_offsets(n_posts, seed):
+    """게시글별 첫 댓글 id - 1 (누적합). comments 청크가 자기 id 범위를 계산하는 데 쓴다"""
+    return [0, *itertools.accumulate(comments_for_post(p, seed) for p in range(1, n_posts + 1))]
+
+
+def distinct_picks(pool, n, h):
+    """pool 에서 서로 다른 n 개를 h 로 결정적으로 고른다 (pool 크기와 서로소인 보폭)"""
+    size = len(pool)
+    n = min(n, size)
+    step = 7919 if size % 7919 else 104729
+    while size > 1 and _gcd(step, size) != 1:
+        step += 2
+    return [pool[(h + k * step) % size] for k in range(n)]
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _between(rng, start, end=END):
+    if start >= end:
+        return end
+    return start + datetime.timedelta(seconds=rng.random() * (end - start).total_seconds())
+
+
+def _weighted(rng, items):
+    return rng.choices([v for v, _ in items], weights=[w for _, w in items])[0]
+
+
+# ── COPY 텍스트 형식 ─────────────────────────────────────────────
+
+def copy_value(value):
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, datetime.datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, list):
+        value = '{' + ','.join('"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"' for v in value) + '}'
+    text = str(value)
+    if any(c in text for c in '\\\t\n\r'):
+        text = text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return text
+
+
+def copy_line(row):
+    return '\t'.join(map(copy_value, row)) + '\n'
+
+
+# ── 테이블별 행 생성 ─────────────────────────────────────────────
+# gen_<table>(chunk, rng, ctx) -> 행 반복자. ctx: scale/seed 에서 계산한 공통 값
+
+class Context:
+    def __init__(self, scale, seed):
+        self.scale = scale
+        self.seed = seed
+        self.n = counts(scale)
+        self.types = users_by_type(self.n['users'], seed)
+        self.members = sorted(self.types['student'] + self.types['graduate'])
+        self.writers = sorted(self.members + self.types['teacher'])
+        self.active = sorted(self.writers + self.types['company'])
+
+    def created(self, uid):
+        return user_created(uid, self.n['users'], self.seed)
+
+    def chunks(self, table):
+        """table 의 청크 수 (청크마다 CHUNK_ROWS 개의 '기준' 항목)"""
+        driver = {
+            'users': self.n['users'], 'company_profiles': len(self.types['company']),
+            'graduate_profiles': len(self.types['graduate']), 'jobs': self.n['jobs'],
+            'job_applications': self.n['jobs'], 'connections': self.n['users'],
+            'posts': self.n['posts'], 'comments': self.n['posts'],
+            'messages': self.n['messages'], 'notifications': self.n['notifications'],
+        }[table]
+        return max(1, -(-driver // CHUNK_ROWS))
+
+    def span(self, chunk, total):
+        return range(chunk * CHUNK_ROWS + 1, min(total, (chunk + 1) * CHUNK_ROWS) + 1)
+
+
+def gen_users(chunk, rng, ctx):
+    for uid in ctx.span(chunk, ctx.n['users']):
+        kind = user_type(uid, ctx.seed)
+        created = ctx.created(uid)
+        name = company_name(uid, ctx.seed) if kind == 'company' else user_name(uid, ctx.seed)
+        member = kind in ('student', 'graduate')
+        major = user_major(uid, ctx.seed) if member else None
+        year = graduation_year(uid, ctx.seed) if member else None
+        last_login = _between(rng, created) if rng.random() < 0.9 else None
+        yield (uid, user_email(uid, ctx.seed), PASSWORD_HASH, name, kind,
+               f'010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}',
+               rng.choice(SCHOOLS) if member or kind == 'teacher' else None, major,
+               rng.choice(ROLES[major]) if member else None, year,
+               user_active(uid, ctx.seed), last_login, created, last_login or created)
+
+
+def gen_company_profiles(chunk, rng, ctx):
+    companies = ctx.types['company']
+    for k in ctx.span(chunk, len(companies)):
+        uid = companies[k - 1]
+        created = ctx.created(uid)
+        name = company_name(uid, ctx.seed)
+        industry = rng.choice(INDUSTRIES)
+        yield (uid, name, industry, rng.choice(SIZES), f'https://www.company{uid}.example.com',
+               f'전라북도 {rng.choice(LOCATIONS)} 산단로 {rng.randrange(1, 300)}',
+               f'{name}은(는) {industry} 분야 전북 지역 기업입니다.', 1970 + rng.randrange(55),
+               created, created)
+
+
+def gen_graduate_profiles(chunk, rng, ctx):
+    graduates = ctx.types['graduate']
+    for k in ctx.span(chunk, len(graduates)):
+        uid = graduates[k - 1]
+        created = ctx.created(uid)
+        major = user_major(uid, ctx.seed)
+        year = graduation_year(uid, ctx.seed)
+        employed = rng.random() < 0.75
+        company = company_name(rng.choice(ctx.types['company']), ctx.seed) if employed else None
+        mentor = employed and rng.random() < 0.2
+        yield (uid, year, major, company, rng.choice(POSITIONS) if employed else None,
+               datetime.date(year, rng.randrange(1, 13), 1) if employed else None,
+               f'{major} {year}년 졸업. {rng.choice(ROLES[major])} 분야에서 일하고 있습니다.' if employed
+               else f'{major} {year}년 졸업, 취업 준비 중입니다.',
+               rng.sample(SKILLS[major], rng.randrange(1, 4)), mentor, rng.randrange(1, 6) if mentor else 0,
+               created, created)
+
+
+def gen_jobs(chunk, rng, ctx):
+    companies = ctx.types['company']
+    for jid in ctx.span(chunk, ctx.n['jobs']):
+        company = companies[_mix(ctx.seed, 8, jid) % len(companies)]
+        created = _between(rng, ctx.created(company))
+        major = rng.choice(MAJORS)
+        role = rng.choice(ROLES[major])
+        kind = _weighted(rng, JOB_TYPES)
+        status = 'active' if created > END - datetime.timedelta(days=120) or rng.random() < 0.3 else 'closed'
+        salary = 2600 + rng.randrange(0, 1600, 100)
+        yield (jid, company, f'[{company_name(company, ctx.seed)}] {role} {"신입" if rng.random() < 0.6 else "경력"} 채용',
+               f'{role} 업무를 담당할 인재를 모집합니다. {major} 전공자 우대.\n'
+               f'근무지: 전라북도 {rng.choice(LOCATIONS)}\n주 5일 근무, 4대 보험, 중식 제공',
+               f'{major} 졸업(예정)자\n관련 자격증 소지자 우대', f'전라북도 {rng.choice(LOCATIONS)}',
+               kind, f'{salary:,}~{salary + 400:,}만원', rng.choice(EXPERIENCE), rng.randrange(1, 6),
+               (created + datetime.timedelta(days=rng.randrange(14, 60))).date(), status,
+               rng.randrange(0, 2000), apps_for_job(jid, ctx.seed), created, created)
+
+
+def gen_job_applications(chunk, rng, ctx):
+    companies = ctx.types['company']
+    for jid in ctx.span(chunk, ctx.n['jobs']):
+        company = companies[_mix(ctx.seed, 8, jid) % len(companies)]
+        posted = ctx.created(company)
+        for uid in distinct_picks(ctx.members, apps_for_job(jid, ctx.seed), _mix(ctx.seed, 9, jid)):
+            applied = _between(rng, max(posted, ctx.created(uid)))
+            status = rng.choices(['pending', 'reviewed', 'interviewed', 'accepted', 'rejected'],
+                                 weights=[50, 20, 10, 5, 15])[0]
+            yield (jid, uid, '성실하게 배우며 일하겠습니다. 현장실습 경험을 살려 기여하고 싶습니다.',
+                   status, applied, applied)
+
+
+def gen_connections(chunk, rng, ctx):
+    n = ctx.n['users']
+    half = max(2, n // 2)
+    for uid in ctx.span(chunk, n):
+        degree = _mix(ctx.seed, 10, uid) % (2 * CONNECTIONS_PER_USER + 1)
+        # 상대 = uid + 오프셋 (1..n/2-1 안에서 서로 다른 값) -> (요청, 수신) 쌍이 겹치지 않는다
+        for offset in distinct_picks(range(1, half), degree, _mix(ctx.seed, 11, uid)):
+            other = (uid - 1 + offset) % n + 1
+            if other == uid:
+                continue
+            created = _between(rng, max(ctx.created(uid), ctx.created(other)))
+            status = rng.choices(['accepted', 'pending', 'rejected'], weights=[70, 20, 10])[0]
+            yield (uid, other, status, '안녕하세요, 같은 학교 출신이라 연락드립니다.', created,
+                   created if status == 'pending' else _between(rng, created))
+
+
+def gen_posts(chunk, rng, ctx):
+    for pid in ctx.span(chunk, ctx.n['posts']):
+        author = ctx.writers[_mix(ctx.seed, 12, pid) % len(ctx.writers)]
+        created = _between(rng, ctx.created(author))
+        major = user_major(author, ctx.seed)
+        words = {'company': company_name(rng.choice(ctx.types['company']), ctx.seed),
+                 'role': rng.choice(ROLES[major]), 'major': major, 'skill': rng.choice(SKILLS[major]),
+                 'location': rng.choice(LOCATIONS)}
+        content = ' '.join(s.format(**words) for s in rng.sample(SENTENCES, rng.randrange(2, 6)))
+        likes = int(rng.paretovariate(1.5)) - 1
+        yield (pid, author, _weighted(rng, POST_CATEGORIES), f'{rng.choice(POST_TOPICS)} - {words["role"]}',
+               content, likes * 8 + rng.randrange(0, 50), likes, comments_for_post(pid, ctx.seed),
+               rng.random() < 0.002, created, created)
+
+
+def gen_comments(chunk, rng, ctx):
+    offsets = comment_offsets(ctx.n['posts'], ctx.seed)
+    for pid in ctx.span(chunk, ctx.n['posts']):
+        first = offsets[pid - 1] + 1
+        author = ctx.writers[_mix(ctx.seed, 12, pid) % len(ctx.writers)]
+        posted = ctx.created(author)
+        for k in range(comments_for_post(pid, ctx.seed)):
+            uid = ctx.writers[rng.randrange(len(ctx.writers))]
+            created = _between(rng, max(posted, ctx.created(uid)))
+            parent = first + rng.randrange(k) if k and rng.random() < 0.3 else None
+            yield (first + k, pid, uid, parent, rng.choice(COMMENTS), rng.randrange(0, 5), created, created)
+
+
+def gen_messages(chunk, rng, ctx):
+    active = ctx.active
+    for mid in ctx.span(chunk, ctx.n['messages']):
+        # 일부 사용자에게 몰리는 분포 (받은 편지함이 큰 사용자 재현)
+        sender = active[int(len(active) * rng.random() ** 2)]
+        receiver = active[rng.randrange(len(active))]
+        if receiver == sender:
+            receiver = active[(active.index(sender) + 1) % len(active)]
+        sent = _between(rng, max(ctx.created(sender), ctx.created(receiver)))
+        yield (sender, receiver, rng.choice(MESSAGES).format(name=user_name(receiver, ctx.seed)),
+               rng.random() < 0.6, sent)
+
+
+def gen_notifications(chunk, rng, ctx):
+    active = ctx.active
+    for nid in ctx.span(chunk, ctx.n['notifications']):
+        uid = active[rng.randrange(len(active))]
+        kind, title, message, link = rng.choice(NOTIFICATIONS)
+        ref = rng.randrange(1, ctx.n['jobs' if kind == 'job' else 'posts'] + 1)
+        other = active[rng.randrange(len(active))]
+        yield (uid, kind, title,
+               message.format(company=company_name(rng.choice(ctx.types['company']), ctx.seed),
+                              name=user_name(other, ctx.seed)),
+               link.format(ref=ref), rng.random() < 0.5, _between(rng, ctx.created(uid)))
+
+
+GENERATORS = {name: globals()[f'gen_{name}'] for name in TABLES}
+
+
+def generate_chunk(table, chunk, scale, seed, out_dir):
+    """청크 하나를 COPY 텍스트로 파일에 쓴다 (프로세스 풀에서 실행). (행 수, 바이트) 반환"""
+    ctx = Context(scale, seed)
+    rng = random.Random(f'{seed}:{table}:{chunk}')
+    path = os.path.join(out_dir, f'{table}.{chunk:05d}.copy')
+    rows = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        buf = []
+        for row in GENERATORS[table](chunk, rng, ctx):
+            buf.append(copy_line(row))
+            rows += 1
+            if len(buf) >= 5000:
+                f.write(''.join(buf))
+                buf.clear()
+        f.write(''.join(buf))
+    return rows, os.path.getsize(path)
+
+
+# ── 스크립트 조립 ─────────────────────────────────────────────────
+
+def check_schema(tables):
+    """생성할 컬럼이 schema.sql (+ 마이그레이션) 에 모두 있는지 확인"""
+    schema = db_schema.load()
+    problems = []
+    for table in tables:
+        if table not in schema.tables:
+            problems.append(f'{table}: 스키마에 테이블 없음')
+            continue
+        missing = [c for c in COLUMNS[table] if c not in schema.tables[table].columns]
+        if missing:
+            problems.append(f'{table}: 스키마에 없는 컬럼 {", ".join(missing)}')
+    return problems
+
+
+def empty_guard(tables):
+    """id 를 직접 넣는 테이블에 이미 행이 있으면 COPY 전에 멈추는 DO 블록 (--truncate 안내)"""
+    if not tables:
+        return ''
+    checks = ' OR '.join(f'EXISTS (SELECT 1 FROM {t})' for t in tables)
+    return ("DO $$\nBEGIN\n"
+            f"    IF {checks} THEN\n"
+            f"        RAISE EXCEPTION '{', '.join(tables)} 에 이미 데이터가 있습니다 (생성 데이터의 id 는 1 부터 시작)'\n"
+            "            USING HINT = 'seed.sql 등으로 채워진 DB 에는 generate-load-data.py --truncate 로 "
+            "다시 생성하세요 (기존 데이터 삭제)';\n"
+            "    END IF;\nEND $$;\n")
+
+
+def write_script(out, tables, parts_dir, chunks, args):
+    out.write(f'-- generate-load-data.py --scale {args.scale} --seed {args.seed}\n')
+    out.write('-- 생성 데이터 적재: psql "$DATABASE_URL" -f load.sql\n')
+    out.write('\\set ON_ERROR_STOP on\nBEGIN;\n')
+    if args.truncate:
+        out.write(f'TRUNCATE {", ".join(reversed(tables))} RESTART IDENTITY CASCADE;\n')
+    else:
+        out.write(empty_guard([t for t in tables if t in EXPLICIT_IDS]))
+    for table in tables:
+        out.write(f'COPY {table} ({", ".join(COLUMNS[table])}) FROM stdin;\n')
+        out.flush()
+        for chunk in range(chunks[table]):
+            path = os.path.join(parts_dir, f'{table}.{chunk:05d}.copy')
+            with open(path, 'r', encoding='utf-8') as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+            os.remove(path)
+        out.write('\\.\n')
+    for table in tables:
+        if table in EXPLICIT_IDS:
+            out.write(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                      f"(SELECT COALESCE(MAX(id), 1) FROM {table}));\n")
+    out.write('COMMIT;\n')
+    for table in tables:
+        out.write(f'ANALYZE {table};\n')
+
+
+def write_accounts(path, ctx, per_role=200):
+    """부하 테스트가 로그인할 계정 목록 (역할별 앞에서부터 활성 계정만)"""
+    accounts = {}
+    for role, members in ctx.types.items():
+        active = (user_email(uid, ctx.seed) for uid in members if user_active(uid, ctx.seed))
+        accounts[role] = list(itertools.islice(active, per_role))
+    data = {'password': PASSWORD, 'scale': ctx.scale, 'seed': ctx.seed, 'accounts': accounts}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부하 테스트용 합성 데이터 생성 (COPY 형식 psql 스크립트)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help=f'규모 배수 (1 = 사용자 {BASE_ROWS["users"]:,} / 메시지 {BASE_ROWS["messages"]:,})')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (같으면 같은 데이터)')
+    parser.add_argument('--tables', help=f'생성할 테이블 (쉼표 구분, 기본값: 전체). 가능: {",".join(TABLES)}')
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help='출력 디렉터리 (load.sql, accounts.json)')
+    parser.add_argument('--stdout', action='store_true', help='load.sql 대신 표준 출력으로 스트리밍 (psql 에 파이프)')
+    parser.add_argument('--truncate', action='store_true',
+                        help='적재 전에 대상 테이블을 TRUNCATE ... RESTART IDENTITY CASCADE (기존 데이터 삭제). '
+                             'id 가 1 부터이므로 seed.sql 로 채워진 DB 에는 필요')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='워커 프로세스 수 (기본값: CPU 코어 수)')
+    args = parser.parse_args()
+
+    tables = TABLES if not args.tables else [t.strip() for t in args.tables.split(',') if t.strip()]
+    unknown = [t for t in tables if t not in TABLES]
+    if unknown:
+        parser.error(f'알 수 없는 테이블: {", ".join(unknown)}')
+    tables = [t for t in TABLES if t in tables]       # 외래 키 순서로
+    problems = check_schema(tables)
+    if problems:
+        for p in problems:
+            print(f'❌ {p}', file=sys.stderr)
+        print('   schema.sql 이 바뀌었으면 COLUMNS / gen_<table> 을 함께 고치세요.', file=sys.stderr)
+        return 2
+
+    log = sys.stderr if args.stdout else sys.stdout
+    ctx = Context(args.scale, args.seed)
+    chunks = {t: ctx.chunks(t) for t in tables}
+    tasks = [(t, c) for t in tables for c in range(chunks[t])]
+    os.makedirs(args.output, exist_ok=True)
+    start = time.perf_counter()
+    totals = {t: [0, 0] for t in tables}
+    with tempfile.TemporaryDirectory(dir=args.output) as parts_dir:
+        workers = min(args.jobs or os.cpu_count() or 1, len(tasks))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(generate_chunk, t, c, args.scale, args.seed, parts_dir): t
+                           for t, c in tasks}
+                for future, table in futures.items():
+                    rows, size = future.result()
+                    totals[table][0] += rows
+                    totals[table][1] += size
+        else:
+            for t, c in tasks:
+                rows, size = generate_chunk(t, c, args.scale, args.seed, parts_dir)
+                totals[t][0] += rows
+                totals[t][1] += size
+        elapsed = time.perf_counter() - start
+
+        if args.stdout:
+            write_script(sys.stdout, tables, parts_dir, chunks, args)
+            script = '(표준 출력)'
+        else:
+            script = os.path.join(args.output, 'load.sql')
+            with open(script, 'w', encoding='utf-8', newline='\n') as f:
+                write_script(f, tables, parts_dir, chunks, args)
+
+    accounts = os.path.join(args.output, 'accounts.json')
+    write_accounts(accounts, ctx)
+    for table in tables:
+        rows, size = totals[table]
+        print(f'  {table:20s} {rows:>10,} 행 {size / 1024 ** 2:8.1f} MB', file=log)
+    rows = sum(r for r, _ in totals.values())
+    print(f'✅ {rows:,} 행 생성 {elapsed:.1f}초 ({rows / max(elapsed, 1e-9):,.0f} 행/초, 워커 {workers}개)'
+          f' → {script}, 계정 목록 {accounts}', file=log)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
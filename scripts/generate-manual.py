@@ -1,11 +1,16 @@
 """
 전북지역 졸업생 네트워크 - 사용자 매뉴얼 DOCX 생성
 실행: python3 scripts/generate-manual.py
+      python3 scripts/generate-manual.py --variants   # 통합본 + 학생/교사/관리자용을 동시에 생성
 전제조건: manual-screenshots/ 폴더에 스크린샷이 있어야 함
 """
 
+import argparse
+import inspect
 import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -13,15 +18,44 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+import manual_cache
+import manual_images
+import manual_pack
+import manual_profile
+import manual_screenshots
+import manual_stream
+from manual_styles import register_styles
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCREENSHOT_DIR = os.path.join(BASE_DIR, 'manual-screenshots')
+SCREENSHOT_LIST = os.path.join(SCREENSHOT_DIR, 'screenshot-list.json')
 OUTPUT_FILE = os.path.join(BASE_DIR, '전북지역_졸업생네트워크_사용자매뉴얼.docx')
 
+# 역할별 매뉴얼: screenshot-list.json 의 auth 값 -> 표시 이름 (파일 이름에도 사용)
+ROLE_LABELS = {'student': '학생', 'teacher': '교사', 'admin': '관리자'}
+IMG_CALL_RE = re.compile(r"\bimg\('([^']+)'\)")
+
 BRAND_BLUE  = RGBColor(0x1e, 0x40, 0xaf)   # #1e40af
 BRAND_LIGHT = RGBColor(0xdb, 0xe9, 0xfe)   # #dbe9fe
 GRAY        = RGBColor(0x6b, 0x72, 0x80)   # #6b7280
 WHITE       = RGBColor(0xFF, 0xFF, 0xFF)
 
+SIZE_BUDGET = 2 * 1024 * 1024   # 결과 DOCX 용량 예산 (--max-size 로 변경, 0 이면 검사 안 함)
+
+# 본문 헬퍼가 참조하는 스타일 (build_document 시작 시 한 번 등록)
+MANUAL_STYLES = {
+    'Heading 1':          {'color': BRAND_BLUE, 'size': Pt(16), 'space_before': Pt(16)},
+    'Heading 2':          {'color': RGBColor(0x1f, 0x29, 0x37), 'size': Pt(13), 'space_before': Pt(10)},
+    'Manual Body':        {'size': Pt(10.5)},
+    'List Number':        {'size': Pt(10.5), 'left_indent': Cm(0.5)},
+    'List Bullet':        {'size': Pt(10.5), 'left_indent': Cm(0.5)},
+    'Info Box':           {'size': Pt(10), 'color': RGBColor(0x1e, 0x56, 0xa0), 'left_indent': Cm(1),
+                           'space_before': Pt(4), 'space_after': Pt(4)},
+    'Warning Box':        {'base': 'Info Box', 'color': RGBColor(0x92, 0x40, 0x0e)},
+    'Screenshot':         {'alignment': WD_ALIGN_PARAGRAPH.CENTER},
+    'Screenshot Caption': {'base': 'Screenshot', 'size': Pt(9), 'italic': True, 'color': GRAY},
+}
+
 
 def add_page_break(doc):
     doc.add_page_break()
@@ -43,92 +77,178 @@ def set_heading_style(paragraph, level, text, color=None):
     paragraph.paragraph_format.space_after = Pt(6)
 
 
+# 스크린샷 준비 단계 (build_manual 에서 생성). add_screenshot 은 준비 작업을 풀에 넘기고
+# 자리만 잡아 두며, 실제 삽입은 저장 직전 embed_pictures() 에서 한다
+images = None
+pending_pictures = []
+
+# 섹션 단위 빌드 캐시 (build_manual 에서 생성). 바뀐 섹션만 렌더링하고 나머지는 캐시 조각을 붙인다
+sections = None
+
+# 빌드 중인 역할별 매뉴얼의 역할 (None = 통합본). 표지·목차가 참조한다
+manual_role = None
+
+
 def add_screenshot(doc, img_path, caption, width=Inches(5.5)):
     """스크린샷 이미지 + 캡션 삽입"""
     if img_path and os.path.exists(img_path):
-        try:
-            para = doc.add_paragraph()
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            run = para.add_run()
-            run.add_picture(img_path, width=width)
-        except Exception as e:
-            p = doc.add_paragraph(f'[이미지 로드 실패: {e}]')
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        para = doc.add_paragraph(style='Screenshot')
+        run = para.add_run()
+        pending_pictures.append((run, images.submit(img_path, width), width))
     else:
-        p = doc.add_paragraph(f'[스크린샷 없음: {os.path.basename(img_path) if img_path else ""}]')
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        p = doc.add_paragraph(f'[스크린샷 없음: {os.path.basename(img_path) if img_path else ""}]',
+                              style='Screenshot')
         p.runs[0].font.color.rgb = GRAY
 
-    cap = doc.add_paragraph(caption)
-    cap.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    cap.runs[0].font.size = Pt(9)
-    cap.runs[0].font.italic = True
-    cap.runs[0].font.color.rgb = GRAY
+    doc.add_paragraph(caption, style='Screenshot Caption')
     doc.add_paragraph()  # 여백
 
 
+def embed_pictures():
+    """준비가 끝난 이미지를 자리 잡아 둔 run 에 문서 순서대로 삽입"""
+    for run, key, width in pending_pictures:
+        try:
+            shape = run.add_picture(images.result(key), width=width)
+            # 대체 텍스트 = 원본 스크린샷 파일명 (--profile 이미지 목록에도 사용)
+            shape._inline.docPr.set('descr', os.path.basename(key[0]))
+        except Exception as e:
+            run.text = f'[이미지 로드 실패: {e}]'
+    pending_pictures.clear()
+
+
 def add_info_box(doc, text, bg_type='info'):
     """안내 박스 텍스트 삽입"""
     prefix = '💡 ' if bg_type == 'info' else '⚠️ '
-    p = doc.add_paragraph()
-    run = p.add_run(f'{prefix}{text}')
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(0x1e, 0x56, 0xa0) if bg_type == 'info' else RGBColor(0x92, 0x40, 0x0e)
-    p.paragraph_format.left_indent = Cm(1)
-    p.paragraph_format.space_before = Pt(4)
-    p.paragraph_format.space_after = Pt(4)
+    doc.add_paragraph(f'{prefix}{text}', style='Info Box' if bg_type == 'info' else 'Warning Box')
 
 
 def add_steps(doc, steps):
     """순서 있는 단계 목록"""
     for i, step in enumerate(steps, 1):
-        p = doc.add_paragraph(f'{i}. {step}', style='List Number')
-        p.paragraph_format.left_indent = Cm(0.5)
-        p.runs[0].font.size = Pt(10.5)
+        doc.add_paragraph(f'{i}. {step}', style='List Number')
 
 
 def add_bullets(doc, items):
     """글머리 기호 목록"""
     for item in items:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Cm(0.5)
-        p.runs[0].font.size = Pt(10.5)
+        doc.add_paragraph(item, style='List Bullet')
 
 
 def img(name):
     """스크린샷 파일 경로 반환"""
     path = os.path.join(SCREENSHOT_DIR, f'{name}.png')
+    sections.track_image(path)
     return path if os.path.exists(path) else None
 
 
 def h1(doc, text):
-    p = doc.add_heading(text, level=1)
-    p.runs[0].font.color.rgb = BRAND_BLUE
-    p.runs[0].font.size = Pt(16)
-    p.paragraph_format.space_before = Pt(16)
-    return p
+    return doc.add_heading(text, level=1)
 
 
 def h2(doc, text):
-    p = doc.add_heading(text, level=2)
-    p.runs[0].font.color.rgb = RGBColor(0x1f, 0x29, 0x37)
-    p.runs[0].font.size = Pt(13)
-    p.paragraph_format.space_before = Pt(10)
-    return p
+    return doc.add_heading(text, level=2)
 
 
 def body(doc, text):
-    p = doc.add_paragraph(text)
-    p.runs[0].font.size = Pt(10.5)
-    return p
+    return doc.add_paragraph(text, style='Manual Body')
 
 
 # ──────────────────────────────────────────────────────────────────
 # 메인
 # ──────────────────────────────────────────────────────────────────
 
-def build_manual():
+def output_path(role=None):
+    if role is None:
+        return OUTPUT_FILE
+    return os.path.join(BASE_DIR, f'전북지역_졸업생네트워크_사용자매뉴얼_{ROLE_LABELS[role]}.docx')
+
+
+def roles_by_section():
+    """섹션 함수 이름 -> 그 섹션이 쓰는 스크린샷의 auth 역할 집합.
+    섹션 소스의 img('...') 호출을 screenshot-list.json 과 맞춰 본다. 로그인 없이 찍은
+    스크린샷만 쓰거나 스크린샷이 없는 섹션은 빈 집합 (모든 역할에 공통)."""
+    with open(SCREENSHOT_LIST, 'r', encoding='utf-8') as f:
+        auth = {shot['id']: shot.get('auth') for shot in json.load(f)}
+    return {fn.__name__: {auth[name] for name in IMG_CALL_RE.findall(inspect.getsource(fn)) if auth.get(name)}
+            for fn in SECTIONS}
+
+
+def role_sections(role):
+    """role 매뉴얼에 넣을 섹션 (None 이면 전체): 공통 섹션 + 그 역할의 스크린샷을 쓰는 섹션"""
+    if role is None:
+        return SECTIONS
+    roles = roles_by_section()
+    return [fn for fn in SECTIONS if not roles[fn.__name__] or role in roles[fn.__name__]]
+
+
+def build_manual(jobs=None, use_cache=True, stream=False, profile=False, max_size=SIZE_BUDGET,
+                 zip_level=manual_pack.DEFAULT_LEVEL, role=None):
+    """매뉴얼을 생성하고 용량 예산 안이면 True 를 반환. zip_level=None 이면 재압축 생략,
+    role 을 주면 공통 섹션과 그 역할의 섹션만 담은 역할별 매뉴얼을 만든다"""
+    global images, sections, manual_role
+    manual_role = role
+    output = output_path(role)
+    profiler = manual_profile.Profiler(profile)
+    profiler.instrument(globals())
+    if not manual_images.available():
+        print('⚠️  Pillow 미설치: 스크린샷을 최적화하지 않고 원본 그대로 삽입합니다 (pip install Pillow)')
+    # 다시 캡처만 하고 화면이 그대로인 스크린샷은 digest 가 유지되어 캐시가 그대로 맞는다
+    with profiler.phase('스크린샷 변경 감지'):
+        screenshots = manual_screenshots.ScreenshotIndex().refresh(jobs)
+    print(screenshots.summary())
+    images = manual_images.ImagePreparer(jobs, digest=screenshots.digest)
+    # 표지·목차가 역할에 따라 달라지므로 캐시도 역할별로 따로 둔다 (이미지 캐시는 공유)
+    sections = manual_cache.SectionCache('user' if role is None else f'user-{role}', __file__,
+                                         role_sections(role), enabled=use_cache,
+                                         salt=f'pillow={manual_images.available()}',
+                                         digest=screenshots.digest)
+    try:
+        doc = new_document()
+        if stream:
+            # 섹션마다 이미지를 삽입하고 곧바로 파일로 흘려 써서 메모리를 일정하게 유지
+            with profiler.phase('섹션 조립 + 스트리밍 저장'):
+                with manual_stream.StreamingDocx(doc, output) as writer:
+                    sections.render(doc, finish=embed_pictures, flush=writer.write)
+        else:
+            with profiler.phase('섹션 조립'):
+                sections.render(doc)
+            with profiler.phase('이미지 삽입'):
+                embed_pictures()
+            with profiler.phase('섹션 캐시 저장'):
+                sections.store(doc)
+    finally:
+        images.close()
+    print(sections.summary())
+
+    # ── 저장 ──────────────────────────────────────────────────────
+    if not stream:
+        with profiler.phase('DOCX 저장'):
+            if zip_level is not None:
+                manual_pack.prune_document(doc)
+            doc.save(output)
+    if zip_level is not None:
+        with profiler.phase('ZIP 재압축'):
+            manual_pack.repack(output, zip_level, prune=stream)
+    print(f'✅ DOCX 저장 완료: {output}')
+    profiler.report(sections, output)
+    return manual_profile.check_budget(output, max_size)
+
+
+def build_variants(**options):
+    """통합본과 역할별 매뉴얼을 빌드마다 프로세스 하나씩 동시에 생성. 모두 예산 안이면 True.
+    준비한 스크린샷은 .manual-cache/images 를 함께 쓰므로 같은 이미지를 두 번 인코딩하지 않는다."""
+    roles = [None, *ROLE_LABELS]
+    # 스크린샷 인덱스는 먼저 한 번 갱신해 두어 각 빌드가 같은 해시를 다시 구하지 않게 한다
+    manual_screenshots.ScreenshotIndex().refresh(options.get('jobs'))
+    with ProcessPoolExecutor(max_workers=len(roles)) as pool:
+        futures = [pool.submit(build_manual, role=role, **options) for role in roles]
+        return all([f.result() for f in futures])
+
+
+def new_document():
+    """스타일과 여백만 설정된 빈 문서 (본문은 SECTIONS 가 채운다)"""
     doc = Document()
+    register_styles(doc, MANUAL_STYLES)
 
     # 페이지 여백 설정
     for section in doc.sections:
@@ -136,7 +256,10 @@ def build_manual():
         section.bottom_margin = Cm(2.5)
         section.left_margin   = Cm(3.0)
         section.right_margin  = Cm(2.5)
+    return doc
+
 
+def section_cover(doc):
     # ── 표지 ─────────────────────────────────────────────────────
     doc.add_paragraph()
     doc.add_paragraph()
@@ -156,6 +279,12 @@ def build_manual():
     desc.runs[0].font.color.rgb = RGBColor(0x1f, 0x29, 0x37)
     desc.runs[0].font.size = Pt(18)
 
+    if manual_role is not None:
+        role_p = doc.add_paragraph(f'( {ROLE_LABELS[manual_role]}용 )')
+        role_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        role_p.runs[0].font.color.rgb = BRAND_BLUE
+        role_p.runs[0].font.size = Pt(14)
+
     doc.add_paragraph()
     doc.add_paragraph()
 
@@ -169,15 +298,20 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_toc(doc):
     # ── 목차 ─────────────────────────────────────────────────────
     h1(doc, '목   차')
+    # 역할별 매뉴얼은 그 역할의 장만 싣는다 (장 번호는 통합본과 같게 유지)
     toc_items = [
-        ('1장', '시작하기', '로그인 · 회원가입'),
-        ('2장', '학생 기능', '대시보드 · 채용정보 · 취업박람회 · 산업체견학 · 자격증지원 · 진로상담 · 동문네트워킹 · 프로필 · 경력관리'),
-        ('3장', '교사 기능', '대시보드 · 채용공고관리 · 지원자관리 · 진로상담관리'),
-        ('4장', '관리자 기능', '회원관리 · 채용공고관리 · 게시판관리 · 공지사항관리 · 코드관리'),
+        ('1장', '시작하기', '로그인 · 회원가입', None),
+        ('2장', '학생 기능', '대시보드 · 채용정보 · 취업박람회 · 산업체견학 · 자격증지원 · 진로상담 · 동문네트워킹 · 프로필 · 경력관리', 'student'),
+        ('3장', '교사 기능', '대시보드 · 채용공고관리 · 지원자관리 · 진로상담관리', 'teacher'),
+        ('4장', '관리자 기능', '회원관리 · 채용공고관리 · 게시판관리 · 공지사항관리 · 코드관리', 'admin'),
     ]
-    for num, title_text, detail in toc_items:
+    for num, title_text, detail, role in toc_items:
+        if manual_role is not None and role not in (None, manual_role):
+            continue
         p = doc.add_paragraph()
         r1 = p.add_run(f'{num}  {title_text}')
         r1.font.bold = True
@@ -189,6 +323,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_getting_started(doc):
     # ╔═══════════════════════════════════════════╗
     # ║   1장: 시작하기                           ║
     # ╚═══════════════════════════════════════════╝
@@ -219,6 +355,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_student(doc):
     # ╔═══════════════════════════════════════════╗
     # ║   2장: 학생 기능                          ║
     # ╚═══════════════════════════════════════════╝
@@ -324,6 +462,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_teacher(doc):
     # ╔═══════════════════════════════════════════╗
     # ║   3장: 교사 기능                          ║
     # ╚═══════════════════════════════════════════╝
@@ -362,6 +502,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_admin(doc):
     # ╔═══════════════════════════════════════════╗
     # ║   4장: 관리자 기능                        ║
     # ╚═══════════════════════════════════════════╝
@@ -446,6 +588,8 @@ def build_manual():
 
     add_page_break(doc)
 
+
+def section_appendix(doc):
     # ── 문제 해결 ──────────────────────────────────────────────────
     h1(doc, '부록. 문제 해결 및 문의')
 
@@ -485,10 +629,43 @@ def build_manual():
     footer.runs[0].font.color.rgb = GRAY
     footer.runs[0].font.size = Pt(9)
 
-    # ── 저장 ──────────────────────────────────────────────────────
-    doc.save(OUTPUT_FILE)
-    print(f'✅ DOCX 저장 완료: {OUTPUT_FILE}')
+
+# 문서 순서대로 나열한 섹션. 캐시 단위이므로 함수 이름이 캐시 파일 이름이 된다
+SECTIONS = [
+    section_cover,
+    section_toc,
+    section_getting_started,
+    section_student,
+    section_teacher,
+    section_admin,
+    section_appendix,
+]
 
 
 if __name__ == '__main__':
-    build_manual()
+    parser = argparse.ArgumentParser(description='사용자 매뉴얼 DOCX 생성')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='스크린샷 준비 워커 프로세스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='섹션 캐시를 쓰지 않고 모든 섹션을 다시 렌더링')
+    parser.add_argument('--stream', action='store_true',
+                        help='섹션 단위로 DOCX 에 흘려 써서 문서·이미지 크기와 무관하게 메모리 사용을 일정하게 유지')
+    parser.add_argument('--profile', action='store_true',
+                        help='섹션·헬퍼별 시간, 이미지별 크기, DOCX 파트별 크기 보고')
+    parser.add_argument('--max-size', type=manual_profile.parse_size, default=SIZE_BUDGET,
+                        help='DOCX 용량 예산 (예: 2MB, 700KB). 넘으면 종료 코드 1 (0 이면 검사 안 함)')
+    parser.add_argument('--zip-level', type=int, choices=range(10), default=manual_pack.DEFAULT_LEVEL,
+                        help=f'XML 파트 deflate 수준 0-9 (기본값: {manual_pack.DEFAULT_LEVEL}, 이미지는 항상 무압축)')
+    parser.add_argument('--no-repack', action='store_true',
+                        help='저장 후 재압축·불필요 파트 정리를 하지 않고 python-docx 출력 그대로 둠')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--role', choices=list(ROLE_LABELS),
+                        help='해당 역할의 장과 공통 장만 담은 역할별 매뉴얼 하나만 생성')
+    target.add_argument('--variants', action='store_true',
+                        help='통합본과 학생/교사/관리자용 매뉴얼을 병렬 프로세스로 함께 생성')
+    args = parser.parse_args()
+    options = dict(jobs=args.jobs, use_cache=not args.no_cache, stream=args.stream,
+                   profile=args.profile, max_size=args.max_size,
+                   zip_level=None if args.no_repack else args.zip_level)
+    ok = build_variants(**options) if args.variants else build_manual(role=args.role, **options)
+    raise SystemExit(0 if ok else 1)
@@ -0,0 +1,590 @@
+"""
+사용자 여정 재생 부하 테스트 (asyncio, 표준 라이브러리만 사용)
+scripts/capture-screenshots.js 의 PAGES / ACCOUNTS 에 정의된 학생·교사·관리자 여정을 그대로 읽어,
+각 페이지가 열릴 때 프런트엔드가 호출하는 API 순서(PAGE_REQUESTS)를 가상 사용자 수천 명으로 재생한다.
+엔드포인트별 p50/p95/p99 지연, 처리량, 오류율과 백엔드 동시 요청 수 추정치를 보고해
+backend/config/database.js 의 pg 풀(max 20)과 백엔드 컨테이너 크기를 정하는 데 쓴다.
+
+부하 모델 (개방형)
+  - 세션(가상 사용자)이 초당 --rate 개씩 포아송 과정으로 도착한다 (--ramp 초 동안 0 에서 선형 증가)
+  - 세션은 역할(--mix 비율)을 고르고, 캐시한 JWT 로 그 역할의 페이지를 PAGES 순서대로 방문한다
+  - 페이지 안의 요청 묶음은 브라우저처럼 동시에(세션당 연결 --connections 개), 묶음끼리는 순서대로 보낸다
+  - 페이지 사이에는 평균 --think 초(지수 분포)를 쉰다. 동시 세션이 --max-users 에 닿으면 도착을 버리고 센다
+  - 정적 파일(HTML/JS/CSS)은 nginx 가 서빙하므로 재생하지 않는다
+
+로그인: 계정마다 /api/auth/login 을 한 번만 호출하고 JWT 를 --token-cache 파일에 저장해 두었다가
+만료(exp) 전까지 다시 쓴다 (bcrypt 검증이 부하 결과를 덮지 않도록). 계정은 --accounts 의
+accounts.json (generate-load-data.py 가 만든 역할별 계정) 을 쓰고, 없으면 capture-screenshots.js 의 ACCOUNTS.
+
+실행: python3 scripts/load-test.py --dry-run                                  # 여정·요청 목록만 출력
+      python3 scripts/load-test.py --rate 20 --duration 120 --ramp 30
+      python3 scripts/load-test.py --rate 200 --max-users 5000 --mix student=85,teacher=10,admin=5
+      python3 scripts/load-test.py --base-url https://jjobb.kr/api --format json --output result.json
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import json
+import math
+import os
+import random
+import re
+import resource
+import ssl
+import sys
+import time
+import urllib.parse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNEY_FILE = os.path.join(BASE_DIR, 'scripts', 'capture-screenshots.js')
+DATABASE_JS = os.path.join(BASE_DIR, 'backend', 'config', 'database.js')
+DEFAULT_ACCOUNTS = os.path.join(BASE_DIR, '.load-data', 'accounts.json')
+DEFAULT_TOKEN_CACHE = os.path.join(BASE_DIR, '.load-data', 'tokens.json')
+DEFAULT_BASE_URL = 'http://localhost:5001/api'
+
+# ── 페이지별 API 호출 ───────────────────────────────────────────────
+# 페이지 URL -> 요청 묶음 목록 (묶음 안은 동시에, 묶음끼리는 await 순서대로).
+# 역할에 따라 다른 페이지는 {역할: 묶음 목록}. {user_id} 는 로그인한 사용자 id 로 바뀐다.
+# 프런트엔드 DOMContentLoaded 처리(js/*.js, 페이지 인라인 스크립트)를 바꾸면 여기도 맞춘다.
+PAGE_REQUESTS = {
+    '/index.html': [['/stats']],                                           # main.js updateStats
+    '/login.html': [['/stats']],
+    '/register.html': [['/majors']],                                       # register.js loadMajors
+    '/dashboard.html': {                                                   # dashboard.js show*Dashboard
+        'student': [['/jobs?status=active&limit=1', '/jobs/my/applications', '/networking/connections',
+                     '/messages/inbox', '/jobs?status=active&limit=3', '/posts?limit=3',
+                     '/education-programs?limit=3']],
+        'teacher': [['/education-programs?limit=200', '/jobs?status=all&limit=200', '/counseling',
+                     '/counseling', '/education-programs?limit=3', '/counseling-journals'], ['/counseling']],
+        'admin': [['/jobs?status=all&limit=1', '/jobs?status=active&limit=3', '/posts?limit=3',
+                   '/education-programs?limit=3'], ['/users?limit=1'], ['/counseling']],
+    },
+    '/jobs.html': [['/jobs']],
+    '/job-fair.html': [['/announcements/job-fair']],
+    '/industry-visit.html': [['/announcements/industry-visit']],
+    '/certification-support.html': [['/announcements/certification']],
+    '/counseling.html': [['/counseling/teachers', '/counseling']],
+    '/networking.html': {                                                  # networking.js: 순서대로 await
+        'student': [['/networking/connections'], ['/messages/inbox', '/messages/sent'], ['/majors']],
+        '*': [['/networking/connections'], ['/messages/inbox', '/messages/sent'],
+              ['/users?user_type=student,graduate&exclude_user_id={user_id}&limit=200'], ['/majors']],
+    },
+    '/profile.html': [['/majors', '/auth/me']],
+    '/career.html': [],
+    '/admin-users.html': [['/users?limit=1000', '/users?include_withdrawn=true&limit=1&page=1']],
+    '/admin-jobs.html': [['/jobs?status=all&limit=200']],
+    '/admin-board.html': [['/posts?limit=200']],
+    '/admin-announcements.html': [['/announcements/job-fair']],
+    '/admin-codes.html': [['/majors', '/stats']],
+}
+
+
+# ── 여정 읽기 ─────────────────────────────────────────────────────
+
+def _js_string(text):
+    return text[1:-1].replace("\\'", "'").replace('\\"', '"')
+
+
+def read_journeys(path=JOURNEY_FILE):
+    """capture-screenshots.js -> (PAGES 항목 목록, ACCOUNTS {역할: {email, password}})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    pages = []
+    block = re.search(r'const PAGES\s*=\s*\[(.*?)\n\];', text, re.S)
+    for item in re.finditer(r'\{([^{}]*)\}', block.group(1) if block else ''):
+        fields = dict((m.group(1), None if m.group(2) == 'null' else _js_string(m.group(2)))
+                      for m in re.finditer(r"(\w+)\s*:\s*('(?:[^'\\]|\\.)*'|null)", item.group(1)))
+        if 'url' in fields:
+            pages.append(fields)
+    accounts = {}
+    block = re.search(r'const ACCOUNTS\s*=\s*\{(.*?)\n\};', text, re.S)
+    for m in re.finditer(r"(\w+)\s*:\s*\{\s*email:\s*('[^']*')\s*,\s*password:\s*('[^']*')", block.group(1) if block else ''):
+        accounts[m.group(1)] = {'email': _js_string(m.group(2)), 'password': _js_string(m.group(3))}
+    return pages, accounts
+
+
+def page_requests(url, role):
+    spec = PAGE_REQUESTS.get(url)
+    if isinstance(spec, dict):
+        spec = spec.get(role, spec.get('*', []))
+    return spec
+
+
+def journey(pages, role):
+    """역할의 방문 순서: PAGES 중 공개 페이지와 그 역할 페이지 (capture-screenshots.js 순서)"""
+    return [p for p in pages if p.get('auth') in (None, role)]
+
+
+def load_accounts(path, fallback):
+    """{역할: [(email, password), ...]}"""
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {role: [(email, data['password']) for email in emails] for role, emails in data['accounts'].items()}
+    return {role: [(a['email'], a['password'])] for role, a in fallback.items()}
+
+
+def pool_size(path=DATABASE_JS):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            m = re.search(r'\bmax\s*:\s*(\d+)', f.read())
+        return int(m.group(1)) if m else None
+    except OSError:
+        return None
+
+
+# ── HTTP/1.1 클라이언트 ─────────────────────────────────────────────
+
+class HttpError(Exception):
+    pass
+
+
+class Connection:
+    """keep-alive 연결 하나. 응답은 Content-Length / chunked 를 읽는다"""
+
+    def __init__(self, host, port, tls):
+        self.host, self.port, self.tls = host, port, tls
+        self.reader = self.writer = None
+
+    async def open(self):
+        ctx = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=ctx, limit=1 << 20)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, method, target, headers, body=b''):
+        if self.writer is None:
+            await self.open()
+        head = [f'{method} {target} HTTP/1.1', f'Host: {self.host}:{self.port}', 'Connection: keep-alive',
+                'Accept: application/json', f'Content-Length: {len(body)}']
+        head += [f'{k}: {v}' for k, v in headers.items()]
+        self.writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise HttpError('connection closed')
+        status = int(line.split()[1])
+        fields = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            fields[name.strip().lower()] = value.strip()
+        if fields.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b''.join(chunks)
+        else:
+            data = await self.reader.readexactly(int(fields.get('content-length', 0)))
+        if fields.get('connection', '').lower() == 'close':
+            self.close()
+        return status, data
+
+
+class Client:
+    """가상 사용자 하나의 연결 풀 (브라우저처럼 호스트당 연결 수 제한)"""
+
+    def __init__(self, base_url, connections, timeout):
+        url = urllib.parse.urlsplit(base_url)
+        self.tls = url.scheme == 'https'
+        self.host = url.hostname
+        self.port = url.port or (443 if self.tls else 80)
+        self.prefix = url.path.rstrip('/')
+        self.timeout = timeout
+        self.idle = []
+        self.slots = asyncio.Semaphore(connections)
+
+    async def call(self, method, path, token=None, payload=None):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        body = b''
+        if payload is not None:
+            body = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        async with self.slots:
+            reused = bool(self.idle)
+            conn = self.idle.pop() if reused else Connection(self.host, self.port, self.tls)
+            for attempt in range(2):
+                try:
+                    status, data = await asyncio.wait_for(
+                        conn.request(method, self.prefix + path, headers, body), self.timeout)
+                    break
+                except (HttpError, EOFError, ConnectionError):
+                    conn.close()
+                    # 서버가 keep-alive 시간(Node 기본 5초)이 지나 닫은 연결: 브라우저처럼 새 연결로 한 번 더
+                    if not reused or attempt:
+                        raise
+                except BaseException:
+                    conn.close()
+                    raise
+            self.idle.append(conn)
+            return status, data
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+
+
+# ── 측정 ─────────────────────────────────────────────────────────
+
+class Stats:
+    def __init__(self):
+        self.latency = collections.defaultdict(list)      # 엔드포인트 -> 성공 응답 지연 (초)
+        self.errors = collections.defaultdict(collections.Counter)
+        self.pages = collections.defaultdict(list)        # 페이지 -> 페이지 API 전체 완료 시간
+        self.page_errors = collections.Counter()          # 페이지 -> 요청 하나라도 실패한 방문 수
+        self.sessions = collections.Counter()
+        self.inflight = 0
+        self.peak_inflight = 0
+        self.active = 0
+        self.peak_active = 0
+        self.max_lag = 0.0
+
+    def record(self, endpoint, elapsed, error=None):
+        if error is None:
+            self.latency[endpoint].append(elapsed)
+        else:
+            self.errors[endpoint][error] += 1
+
+    def summary(self, elapsed):
+        rows = []
+        for endpoint in sorted(set(self.latency) | set(self.errors)):
+            rows.append(_row(endpoint, self.latency.get(endpoint, []), sum(self.errors[endpoint].values()), elapsed,
+                             dict(self.errors[endpoint])))
+        # 모든 방문이 실패한 페이지는 self.pages 에 없으므로 오류 쪽 키도 합친다
+        pages = [_row(page, self.pages.get(page, []), self.page_errors[page], elapsed)
+                 for page in sorted(set(self.pages) | set(self.page_errors))]
+        everything = [t for v in self.latency.values() for t in v]
+        total = _row('전체', everything, sum(sum(c.values()) for c in self.errors.values()), elapsed)
+        return rows, pages, total
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    k = (len(values) - 1) * q
+    lo, hi = math.floor(k), math.ceil(k)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def _row(name, times, errors, elapsed, error_kinds=None):
+    times = sorted(times)
+    count = len(times) + errors
+    ms = lambda v: None if v is None else round(v * 1000, 1)
+    return {'name': name, 'requests': count, 'rps': round(count / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(errors / count, 4) if count else 0.0,
+            'p50_ms': ms(percentile(times, 0.50)), 'p95_ms': ms(percentile(times, 0.95)),
+            'p99_ms': ms(percentile(times, 0.99)), 'max_ms': ms(times[-1] if times else None),
+            'mean_ms': ms(sum(times) / len(times) if times else None), 'errors': error_kinds or {}}
+
+
+# ── 로그인·토큰 캐시 ─────────────────────────────────────────────
+
+def _token_exp(token):
+    try:
+        payload = token.split('.')[1]
+        return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))['exp']
+    except (IndexError, ValueError, KeyError):
+        return 0
+
+
+def load_token_cache(path, base_url):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f).get(base_url, {})
+    except (OSError, ValueError):
+        return {}
+    soon = time.time() + 3600
+    return {email: s for email, s in cached.items() if _token_exp(s['token']) > soon}
+
+
+def save_token_cache(path, base_url, sessions):
+    data = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        pass
+    data[base_url] = sessions
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+async def login_all(args, accounts, stats):
+    """역할별 계정으로 로그인해 {역할: [{token, user_id}, ...]} 반환 (캐시에 있으면 재사용)"""
+    cache = load_token_cache(args.token_cache, args.base_url) if args.token_cache else {}
+    limit = asyncio.Semaphore(args.login_concurrency)
+    failures = collections.Counter()
+
+    async def login(email, password):
+        if email in cache:
+            return cache[email]
+        async with limit:
+            client = Client(args.base_url, 1, args.timeout)
+            start = time.perf_counter()
+            try:
+                status, data = await client.call('POST', '/auth/login', payload={'email': email, 'password': password})
+                stats.record('POST /auth/login', time.perf_counter() - start, None if status < 400 else str(status))
+                body = json.loads(data or b'{}')
+            except (OSError, EOFError, asyncio.TimeoutError, HttpError, ValueError) as e:
+                stats.record('POST /auth/login', time.perf_counter() - start, type(e).__name__)
+                failures[type(e).__name__] += 1
+                return None
+            finally:
+                client.close()
+        if not body.get('token'):
+            failures[f'{status} {body.get("error", "")}'.strip()] += 1
+            return None
+        cache[email] = {'token': body['token'], 'user_id': (body.get('user') or {}).get('id')}
+        return cache[email]
+
+    sessions = {}
+    for role, creds in accounts.items():
+        results = await asyncio.gather(*(login(e, p) for e, p in creds))
+        sessions[role] = [s for s in results if s]
+    if args.token_cache:
+        save_token_cache(args.token_cache, args.base_url, cache)
+    for reason, n in failures.items():
+        print(f'⚠️  로그인 실패 {n}건: {reason}', file=sys.stderr)
+    return sessions
+
+
+# ── 가상 사용자 ───────────────────────────────────────────────────
+
+async def run_session(args, role, session, pages, stats, rng):
+    client = Client(args.base_url, args.connections, args.timeout)
+    try:
+        for k, page in enumerate(journey(pages, role)):
+            if k and args.think > 0:
+                await asyncio.sleep(rng.expovariate(1 / args.think))
+            groups = page_requests(page['url'], role) or []
+            name = f'{page["url"]} ({page.get("auth") or "공개"})'
+            start = time.perf_counter()
+            ok = True
+            for group in groups:
+                results = await asyncio.gather(*(_get(client, template, session, stats) for template in group))
+                ok = ok and all(results)
+            if not groups:
+                continue
+            if ok:
+                stats.pages[name].append(time.perf_counter() - start)
+            else:
+                stats.page_errors[name] += 1
+    finally:
+        client.close()
+        stats.active -= 1
+
+
+async def _get(client, template, session, stats):
+    endpoint = 'GET ' + template
+    path = template.format(user_id=session.get('user_id') or 0)
+    stats.inflight += 1
+    stats.peak_inflight = max(stats.peak_inflight, stats.inflight)
+    start = time.perf_counter()
+    error = None
+    try:
+        status, _ = await client.call('GET', path, token=session['token'])
+        error = None if status < 400 else str(status)
+    except asyncio.TimeoutError:
+        error = 'timeout'
+    except (OSError, EOFError, HttpError, ValueError) as e:
+        error = type(e).__name__
+    finally:
+        stats.inflight -= 1
+    stats.record(endpoint, time.perf_counter() - start, error)
+    return error is None
+
+
+async def generate(args, sessions, pages, stats):
+    """포아송 도착으로 세션을 띄우고, 시간이 끝나면 남은 세션을 --drain 초까지 기다린다"""
+    rng = random.Random(args.seed)
+    roles = [(role, w) for role, w in args.mix.items() if sessions.get(role)]
+    if not roles:
+        raise SystemExit('❌ 로그인에 성공한 역할이 없습니다 (--mix 와 계정 목록을 확인하세요)')
+    tasks = set()
+    dropped = 0
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    next_at = 0.0
+    while True:
+        # 비균질 포아송: ramp 동안 rate 를 선형으로 올린다
+        rate = args.rate * min(1.0, (next_at + 1e-9) / args.ramp) if args.ramp else args.rate
+        next_at += rng.expovariate(max(rate, args.rate / 100))
+        if next_at >= args.duration:
+            break
+        delay = start + next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            stats.max_lag = max(stats.max_lag, -delay)
+        if stats.active >= args.max_users:
+            dropped += 1
+            continue
+        role = rng.choices([r for r, _ in roles], weights=[w for _, w in roles])[0]
+        session = rng.choice(sessions[role])
+        stats.active += 1             # 세션이 실제로 시작되기 전에 세어야 --max-users 를 넘지 않는다
+        stats.peak_active = max(stats.peak_active, stats.active)
+        stats.sessions[role] += 1
+        task = asyncio.ensure_future(run_session(args, role, session, pages, stats, random.Random(rng.random())))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=args.drain)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return loop.time() - start, dropped
+
+
+# ── 보고서 ─────────────────────────────────────────────────────
+
+def print_table(title, rows):
+    print(f'\n{title}')
+    print(f'  {"":52s} {"요청":>7s} {"RPS":>8s} {"오류율":>7s} {"p50":>8s} {"p95":>8s} {"p99":>8s}')
+    fmt = lambda v: '-' if v is None else f'{v:.1f}'
+    for r in rows:
+        print(f'  {r["name"][:52]:52s} {r["requests"]:>7,} {r["rps"]:>8.1f} {r["error_rate"] * 100:>6.1f}% '
+              f'{fmt(r["p50_ms"]):>8s} {fmt(r["p95_ms"]):>8s} {fmt(r["p99_ms"]):>8s}')
+        if r['errors']:
+            print(f'  {"":52s} 오류: ' + ', '.join(f'{k} {v}건' for k, v in sorted(r['errors'].items())))
+
+
+def report(result):
+    print_table('엔드포인트별 지연 (ms)', result['endpoints'])
+    print_table('페이지별 API 완료 시간 (ms)', result['pages'])
+    login = result['login']
+    if login['requests']:
+        print(f'\n로그인 (측정 전 토큰 발급): {login["requests"]:,}건, 오류율 {login["error_rate"] * 100:.1f}%'
+              + (f', p50 {login["p50_ms"]}ms / p95 {login["p95_ms"]}ms' if login['p50_ms'] is not None else ''))
+    total = result['total']
+    print(f'\n전체: 요청 {total["requests"]:,}건, {total["rps"]:.1f} req/s, 오류율 {total["error_rate"] * 100:.2f}%, '
+          f'p50 {total["p50_ms"]}ms / p95 {total["p95_ms"]}ms / p99 {total["p99_ms"]}ms')
+    run = result['run']
+    print(f'세션 {sum(run["sessions"].values()):,}개 ({", ".join(f"{k} {v}" for k, v in run["sessions"].items())}), '
+          f'최대 동시 세션 {run["peak_users"]:,}, 버린 도착 {run["dropped"]:,}, {run["elapsed_s"]:.1f}초')
+    concurrency = run['mean_inflight']
+    pool = run['pg_pool']
+    print(f'동시 요청: 평균 {concurrency:.1f} (처리량 × 평균 지연), 최대 {run["peak_inflight"]:,}'
+          + (f' / pg 풀 max {pool}' if pool else ''))
+    if pool and concurrency > pool:
+        print(f'⚠️  평균 동시 요청이 pg 풀({pool})보다 많습니다. 요청마다 쿼리를 하나 이상 쓰므로 '
+              f'풀 대기 시간이 지연에 섞여 있을 가능성이 큽니다.')
+    if run['max_lag_s'] > 0.1:
+        print(f'⚠️  도착 일정이 최대 {run["max_lag_s"]:.2f}초 밀렸습니다. 부하 생성기가 포화됐으니 '
+              f'--rate 를 낮추거나 여러 프로세스로 나눠 실행하세요.')
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        role, _, weight = part.partition('=')
+        if role.strip():
+            mix[role.strip()] = float(weight or 1)
+    return mix
+
+
+def raise_fd_limit():
+    """수천 개 연결을 열 수 있도록 열린 파일 수 제한을 hard 한도까지 올린다"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard if hard != resource.RLIM_INFINITY else 65536, hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사용자 여정 재생 HTTP 부하 테스트 (asyncio)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f'API 주소 (기본값: {DEFAULT_BASE_URL})')
+    parser.add_argument('--rate', type=float, default=10.0, help='초당 새 세션 수 (기본값: 10)')
+    parser.add_argument('--duration', type=float, default=60.0, help='세션 도착 시간 (초, 기본값: 60)')
+    parser.add_argument('--ramp', type=float, default=0.0, help='도착률을 0 에서 --rate 까지 올리는 시간 (초)')
+    parser.add_argument('--max-users', type=int, default=2000, help='최대 동시 세션 수 (넘치면 도착을 버림)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('student=85,teacher=10,admin=5'),
+                        help='역할 비율 (기본값: student=85,teacher=10,admin=5)')
+    parser.add_argument('--think', type=float, default=2.0, help='페이지 사이 평균 대기 (초, 0 이면 바로 이동)')
+    parser.add_argument('--connections', type=int, default=6, help='세션당 동시 연결 수 (브라우저 기본 6)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='요청 시간 제한 (초)')
+    parser.add_argument('--drain', type=float, default=60.0, help='도착이 끝난 뒤 남은 세션을 기다리는 시간 (초)')
+    parser.add_argument('--accounts', default=DEFAULT_ACCOUNTS,
+                        help='generate-load-data.py 의 accounts.json (없으면 capture-screenshots.js ACCOUNTS)')
+    parser.add_argument('--token-cache', default=DEFAULT_TOKEN_CACHE, help='JWT 캐시 파일 ("" 이면 저장 안 함)')
+    parser.add_argument('--login-concurrency', type=int, default=8, help='동시 로그인 수 (bcrypt 부담 조절)')
+    parser.add_argument('--seed', type=int, default=1, help='도착·역할 선택 난수 시드')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='출력 형식')
+    parser.add_argument('--output', metavar='FILE', help='결과 JSON 을 파일로도 저장')
+    parser.add_argument('--dry-run', action='store_true', help='역할별 여정과 요청 목록만 출력')
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error('--rate 는 0 보다 커야 합니다')
+    if args.think < 0:
+        parser.error('--think 는 0 이상이어야 합니다')
+
+    pages, fallback = read_journeys()
+    missing = sorted({p['url'] for p in pages if p['url'] not in PAGE_REQUESTS})
+    if missing:
+        print(f'⚠️  PAGE_REQUESTS 에 없는 페이지 (요청 없이 지나감): {", ".join(missing)}', file=sys.stderr)
+    if args.dry_run:
+        for role in args.mix:
+            print(f'[{role}]')
+            for page in journey(pages, role):
+                groups = page_requests(page['url'], role) or []
+                print(f'  {page["url"]:32s} ' + ' → '.join(' + '.join(g) for g in groups))
+        return 0
+
+    accounts = load_accounts(args.accounts, fallback)
+    accounts = {role: accounts.get(role, []) for role in args.mix}
+    fds = raise_fd_limit()
+    if args.max_users * args.connections > fds - 64:
+        print(f'⚠️  열린 파일 수 제한 {fds} 이 --max-users × --connections 보다 작습니다', file=sys.stderr)
+
+    stats = Stats()
+
+    async def run():
+        sessions = await login_all(args, accounts, stats)
+        counts = ', '.join(f'{role} {len(s)}' for role, s in sessions.items())
+        print(f'🔑 로그인 계정: {counts}', file=sys.stderr)
+        # 로그인 지연은 따로 남기고 본 측정에서는 뺀다
+        login = (stats.latency.pop('POST /auth/login', []), stats.errors.pop('POST /auth/login', None))
+        print(f'🚀 {args.rate}세션/초 × {args.duration:.0f}초 (ramp {args.ramp:.0f}초) → {args.base_url}', file=sys.stderr)
+        elapsed, dropped = await generate(args, sessions, pages, stats)
+        return elapsed, dropped, login
+
+    elapsed, dropped, login = asyncio.run(run())
+    endpoints, page_rows, total = stats.summary(elapsed)
+    result = {
+        'endpoints': endpoints, 'pages': page_rows, 'total': total,
+        'login': _row('POST /auth/login', login[0], sum(login[1].values()) if login[1] else 0, elapsed,
+                      dict(login[1] or {})),
+        'run': {'base_url': args.base_url, 'rate': args.rate, 'duration_s': args.duration, 'ramp_s': args.ramp,
+                'mix': args.mix, 'think_s': args.think, 'elapsed_s': round(elapsed, 2),
+                'sessions': dict(stats.sessions), 'dropped': dropped, 'peak_users': stats.peak_active,
+                'peak_inflight': stats.peak_inflight,
+                'mean_inflight': round(total['rps'] * (total['mean_ms'] or 0) / 1000, 2),
+                'max_lag_s': round(stats.max_lag, 3), 'pg_pool': pool_size()},
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+    if args.format == 'json':
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        report(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
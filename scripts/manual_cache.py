@@ -0,0 +1,183 @@
+"""
+매뉴얼 섹션 단위 증분 빌드 캐시
+각 섹션(표지, 목차, 장 단위)을 렌더링한 OOXML 조각을 저장해 두고, 다음 빌드에서
+섹션 코드와 사용한 스크린샷이 그대로면 렌더링 없이 조각을 문서에 다시 붙인다.
+
+캐시 키 = 공통 코드 해시(섹션 함수를 뺀 생성 스크립트 + manual_*.py)
+        + 섹션 함수 소스 해시 + 섹션이 사용한 이미지 해시 (digest, 기본값은 파일 sha256)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from manual_images import file_sha256
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+CACHE_DIR = os.path.join(BASE_DIR, '.manual-cache', 'sections')
+MEDIA_DIR = os.path.join(CACHE_DIR, 'media')
+CACHE_VERSION = 1   # 조각 저장 형식을 바꾸면 올려서 기존 캐시를 무효화
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class SectionCache:
+    """섹션 함수 목록을 받아 캐시된 조각은 붙이고, 바뀐 섹션만 렌더링한다.
+
+    사용 순서:
+        sections = SectionCache('user', __file__, SECTIONS)
+        sections.render(doc)     # 섹션마다 캐시 조각을 붙이거나 fn(doc) 실행
+        ...                      # 지연 삽입(이미지 등) 마무리
+        sections.store(doc)      # 새로 렌더링한 섹션을 조각으로 저장
+    스트리밍 저장에서는 render(doc, finish, flush) 로 섹션마다 finish() 로 지연 삽입을
+    마치고 조각을 저장한 뒤 flush(본문 요소) 로 넘긴다.
+    섹션 함수 안에서 스크린샷 경로를 정하면 track_image() 로 알려야 이미지 변경이
+    해당 섹션만 무효화한다 (없는 파일도 기록해 두어 나중에 생기면 다시 렌더링).
+    digest(경로) 는 이미지 변경 판정에 쓸 해시 (기본값: 파일 바이트 sha256).
+    """
+
+    def __init__(self, name, generator_file, sections, enabled=True, salt='', digest=file_sha256):
+        self.dir = os.path.join(CACHE_DIR, name)
+        self.digest = digest
+        self.sections = list(sections)
+        self.enabled = enabled
+        self.tracking = None
+        self.pending = []
+        self.reused = []
+        self.rendered = []
+        self.timings = []    # (섹션 이름, 초, 캐시 재사용 여부) - --profile 보고서용
+
+        with open(generator_file, 'r', encoding='utf-8') as f:
+            shared = f.read()
+        self.sources = {}
+        for fn in self.sections:
+            src = inspect.getsource(fn)
+            self.sources[fn.__name__] = _sha256(src)
+            shared = shared.replace(src, '')
+        for lib in sorted(os.listdir(SCRIPTS_DIR)):
+            if lib.startswith('manual_') and lib.endswith('.py'):
+                with open(os.path.join(SCRIPTS_DIR, lib), 'r', encoding='utf-8') as f:
+                    shared += f.read()
+        self.shared = _sha256(f'{CACHE_VERSION}\n{salt}\n{shared}')
+
+    # ── 렌더링 ────────────────────────────────────────────────
+
+    def track_image(self, path):
+        """현재 렌더링 중인 섹션이 path 의 이미지를 사용함을 기록"""
+        if self.tracking is not None:
+            self.tracking.add(path)
+
+    def render(self, doc, finish=None, flush=None):
+        body = doc.element.body
+        for fn in self.sections:
+            name = fn.__name__
+            key = _sha256(self.shared + self.sources[name])
+            start_time = time.perf_counter()
+            entry = self._load(name, key) if self.enabled else None
+            if entry is not None:
+                elements = self._splice(doc, entry)
+                self.reused.append(name)
+            else:
+                start = len(body) - 1           # 마지막 자식은 w:sectPr
+                self.tracking = set()
+                fn(doc)
+                images, self.tracking = self.tracking, None
+                elements = list(body)[start:len(body) - 1]
+                self.pending.append((name, key, images, elements))
+                self.rendered.append(name)
+
+            if flush is not None:
+                if finish is not None:
+                    finish()
+                self.store(doc)
+                flush(elements)
+            self.timings.append((name, time.perf_counter() - start_time, entry is not None))
+
+    def store(self, doc):
+        """render() 에서 새로 만든 섹션 조각을 저장하고 그림 ID 를 문서 전체에서 다시 매긴다"""
+        for name, key, images, elements in self.pending:
+            if self.enabled:
+                self._save(doc, name, key, images, elements)
+        self.pending.clear()
+        # 캐시 조각과 새 조각의 wp:docPr id 가 겹치지 않도록 문서 순서대로 재부여
+        for i, pr in enumerate(doc.element.body.iter(qn('wp:docPr')), 1):
+            pr.set('id', str(i))
+
+    def summary(self):
+        return f'섹션 캐시: 재사용 {len(self.reused)}개 / 렌더링 {len(self.rendered)}개'
+
+    # ── 저장소 ────────────────────────────────────────────────
+
+    def _path(self, name):
+        return os.path.join(self.dir, f'{name}.json')
+
+    def _load(self, name, key):
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key:
+            return None
+        for path, digest in entry['images'].items():
+            current = self.digest(path) if os.path.exists(path) else None
+            if current != digest:
+                return None
+        if not all(os.path.exists(os.path.join(MEDIA_DIR, m)) for m in entry['media'].values()):
+            return None
+        return entry
+
+    def _save(self, doc, name, key, images, elements):
+        media = {}
+        for el in elements:
+            for blip in el.iter(qn('a:blip')):
+                rid = blip.get(qn('r:embed'))
+                if rid in media:
+                    continue
+                part = doc.part.related_parts[rid]
+                filename = f'{part.sha1}{os.path.splitext(part.partname)[1]}'
+                target = os.path.join(MEDIA_DIR, filename)
+                if not os.path.exists(target):
+                    _write_atomic(target, part.blob)
+                media[rid] = filename
+        entry = {
+            'key': key,
+            'images': {p: self.digest(p) if os.path.exists(p) else None for p in sorted(images)},
+            'media': media,
+            'xml': [etree.tostring(el, encoding='unicode') for el in elements],
+        }
+        _write_atomic(self._path(name), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def _splice(self, doc, entry):
+        """저장된 조각을 문서 끝(w:sectPr 앞)에 붙이고 이미지 관계 ID 를 새 문서 기준으로 바꾼다"""
+        rids = {old: doc.part.get_or_add_image(os.path.join(MEDIA_DIR, filename))[0]
+                for old, filename in entry['media'].items()}
+        sect_pr = doc.element.body.find(qn('w:sectPr'))
+        elements = []
+        for xml in entry['xml']:
+            el = parse_xml(xml)
+            for blip in el.iter(qn('a:blip')):
+                blip.set(qn('r:embed'), rids[blip.get(qn('r:embed'))])
+            if sect_pr is not None:
+                sect_pr.addprevious(el)
+            else:
+                doc.element.body.append(el)
+            elements.append(el)
+        return elements
@@ -0,0 +1,175 @@
+"""
+매뉴얼 스크린샷 최적화 - DOCX 삽입 전 인쇄 해상도로 축소 + 재인코딩 + 캐시
+generate-manual.py 에서 사용 (Pillow 필요, 없으면 원본 PNG를 그대로 삽입)
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import time
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 최적화 단계를 건너뛴다
+    Image = None
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, '.manual-cache', 'images')
+
+PRINT_DPI = 150          # 표시 폭 1인치당 픽셀 수
+JPEG_QUALITY = 85
+JPEG_PREFERENCE = 0.8    # JPEG가 팔레트 PNG의 80% 이하일 때만 JPEG 선택 (글자 선명도 우선)
+PIPELINE_VERSION = 1     # 인코딩 설정을 바꾸면 올려서 캐시를 무효화
+LOCK_TIMEOUT = 120       # 이보다 오래된 잠금 파일은 중단된 빌드가 남긴 것으로 보고 무시 (초)
+EMU_PER_INCH = 914400
+
+
+def available():
+    """Pillow가 설치되어 최적화가 가능한지"""
+    return Image is not None
+
+
+def file_sha256(path):
+    """원본 파일 내용의 sha256"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def target_width_px(width_emu, dpi=PRINT_DPI):
+    """문서상 표시 폭(EMU)에 필요한 픽셀 폭"""
+    return max(1, round(width_emu / EMU_PER_INCH * dpi))
+
+
+def optimize_image(src_path, width_px):
+    """width_px 로 축소한 뒤 팔레트 PNG와 JPEG 중 작은 쪽을 (bytes, 확장자)로 반환"""
+    with Image.open(src_path) as im:
+        im = im.convert('RGB')
+        if im.width > width_px:
+            height = round(im.height * width_px / im.width)
+            im = im.resize((width_px, height), Image.Resampling.LANCZOS)
+
+    png = io.BytesIO()
+    im.quantize(colors=256).save(png, 'PNG', optimize=True)
+    jpg = io.BytesIO()
+    im.save(jpg, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+    if jpg.tell() <= png.tell() * JPEG_PREFERENCE:
+        return jpg.getvalue(), '.jpg'
+    return png.getvalue(), '.png'
+
+
+def cache_key(src_path, width_px, digest=None):
+    """digest 를 주면 파일 바이트 대신 그 값으로 원본을 식별 (manual_screenshots 의 화면 digest)"""
+    return f'{(digest or file_sha256(src_path))[:24]}-{width_px}px-v{PIPELINE_VERSION}'
+
+
+def _cached(key):
+    for ext in ('.png', '.jpg'):
+        cached = os.path.join(CACHE_DIR, key + ext)
+        if os.path.exists(cached):
+            return cached
+    return None
+
+
+def _lock(key):
+    """캐시 항목 하나를 준비할 잠금을 얻으면 True. 다른 프로세스가 이미 준비 중이면 끝날 때까지
+    기다린 뒤 False 를 반환한다 (역할별 매뉴얼을 동시에 빌드할 때 같은 스크린샷을 한 번만 인코딩하기 위함)."""
+    path = os.path.join(CACHE_DIR, key + '.lock')
+    while True:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            pass
+        try:
+            if time.time() - os.path.getmtime(path) > LOCK_TIMEOUT:
+                os.remove(path)
+                continue
+        except FileNotFoundError:
+            return False
+        time.sleep(0.05)
+
+
+def prepare_image(src_path, width_emu, dpi=PRINT_DPI, digest=None):
+    """삽입할 이미지 경로 반환. 원본 해시 + 목표 폭으로 캐시하므로 재빌드 시 재인코딩하지 않는다"""
+    if Image is None:
+        return src_path
+    width_px = target_width_px(width_emu, dpi)
+    key = cache_key(src_path, width_px, digest)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cached = _cached(key)
+    if cached:
+        return cached
+    while not _lock(key):
+        pass    # 기다린 상대가 끝났으면 잠금을 얻은 뒤 결과를 확인 (실패했으면 직접 준비)
+
+    try:
+        cached = _cached(key)   # 기다리는 동안 다른 프로세스가 준비했을 수 있다
+        if cached:
+            return cached
+        data, ext = optimize_image(src_path, width_px)
+        out = os.path.join(CACHE_DIR, key + ext)
+        tmp = f'{out}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, out)
+        return out
+    finally:
+        # 오래 걸려 다른 프로세스가 오래된 잠금으로 보고 지웠을 수 있다
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(CACHE_DIR, key + '.lock'))
+
+
+class ImagePreparer:
+    """스크린샷 준비(디코딩/축소/재인코딩)를 프로세스 풀에서 병렬로 돌린다.
+
+    문서 조립 중 이미지가 필요해지는 즉시 submit() 으로 작업을 넘기고, 조립은 계속
+    진행한다. 저장 직전에 result() 로 준비된 파일을 받아 삽입한다.
+    같은 (원본, 폭) 요청은 한 번만 처리한다. digest(경로) 를 주면 그 값을 캐시 키로 쓴다.
+    """
+
+    def __init__(self, jobs=None, dpi=PRINT_DPI, digest=None):
+        self.dpi = dpi
+        self.digest = digest
+        self.futures = {}
+        self.pool = None
+        if available() and (jobs or os.cpu_count() or 1) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(max_workers=jobs or os.cpu_count())
+
+    def submit(self, src_path, width_emu):
+        key = (src_path, int(width_emu))
+        if key not in self.futures:
+            digest = self.digest(src_path) if self.digest else None
+            if self.pool is not None:
+                self.futures[key] = self.pool.submit(prepare_image, *key, self.dpi, digest)
+            else:
+                self.futures[key] = _Done(prepare_image, *key, self.dpi, digest)
+        return key
+
+    def result(self, key):
+        return self.futures[key].result()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+class _Done:
+    """풀 없이 실행할 때 Future 와 같은 인터페이스 (호출 시점에 바로 실행)"""
+
+    def __init__(self, fn, *args):
+        try:
+            self.value, self.error = fn(*args), None
+        except Exception as e:
+            self.value, self.error = None, e
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
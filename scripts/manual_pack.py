@@ -0,0 +1,172 @@
+"""
+매뉴얼 DOCX 재압축 (저장 직후 단계)
+python-docx 는 모든 파트를 deflate 하므로, 이미 압축된 PNG/JPEG 는 무압축(STORED)으로 다시 담고
+XML 파트는 지정한 수준으로 deflate 한다. 기본 템플릿에서 따라온 쓰지 않는 파트
+(stylesWithEffects.xml, 참조가 없으면 theme)와 문서에서 참조하지 않는 스타일 정의도 걷어 낸다.
+
+일반 저장은 prune_document(doc) 로 저장 전에 DOM 에서 정리해 doc.save() 가 쓸 양 자체를 줄이고
+repack(path, prune=False) 로 압축만 다시 한다. 스트리밍 저장은 본문이 이미 DOM 에 없으므로
+repack(path) 가 ZIP 안의 XML 을 읽어 정리한다.
+"""
+
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+
+from lxml import etree
+
+DEFAULT_LEVEL = 6                       # zlib 기본값. 9 는 느리고 이득이 거의 없다
+STORED_EXTS = {'.png', '.jpg', '.jpeg', '.gif'}
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+RT_STYLES_WITH_EFFECTS = 'http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects'
+RT_THEME = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme'
+
+STYLE_REF_RE = re.compile(rb'<w:(?:pStyle|rStyle|tblStyle|numStyleLink|styleLink) w:val="([^"]+)"')
+STYLE_REF_XPATH = ' | '.join(f'//w:{tag}/@w:val' for tag in
+                            ('pStyle', 'rStyle', 'tblStyle', 'numStyleLink', 'styleLink'))
+THEME_REF_RE = re.compile(rb' w:\w*[Tt]heme\w*="')
+
+
+def _w(tag):
+    return f'{{{W_NS}}}{tag}'
+
+
+def _rels_source_dir(rels_name):
+    """'word/_rels/document.xml.rels' -> 'word'"""
+    return posixpath.dirname(posixpath.dirname(rels_name))
+
+
+def _rel_targets(zin, rels_name):
+    """rels 파일의 (Relationship 요소, 대상 파트 이름) 목록"""
+    root = etree.fromstring(zin.read(rels_name))
+    base = _rels_source_dir(rels_name)
+    return root, [(rel, posixpath.normpath(posixpath.join(base, rel.get('Target'))))
+                  for rel in root.iter(f'{{{RELS_NS}}}Relationship')
+                  if rel.get('TargetMode') != 'External']
+
+
+def unused_parts(zin, styles_xml):
+    """걷어 낼 파트 이름 집합. styles_xml 은 정리한 뒤의 스타일 XML (테마 참조 검사용)"""
+    drop = set()
+    _, rels = _rel_targets(zin, 'word/_rels/document.xml.rels')
+    for rel, target in rels:
+        if rel.get('Type') == RT_STYLES_WITH_EFFECTS:
+            drop.add(target)
+    themes = {target for rel, target in rels if rel.get('Type') == RT_THEME}
+    if themes:
+        # settings.xml 의 themeFontLang 은 언어 설정일 뿐이라 제외하고, 글꼴/색 참조가 하나라도 있으면 유지
+        used = THEME_REF_RE.search(styles_xml) or any(
+            THEME_REF_RE.search(zin.read(name)) for name in zin.namelist()
+            if name.startswith('word/') and name.endswith('.xml')
+            and name not in themes | drop | {'word/styles.xml', 'word/settings.xml'})
+        if not used:
+            drop |= themes
+    return drop
+
+
+def _prune_style_element(root, referenced):
+    """w:styles 요소에서 referenced 에 없는 스타일 정의를 뺀다.
+    기본 스타일(w:default="1")과 basedOn / link / next 로 이어지는 스타일은 남긴다."""
+    styles = {s.get(_w('styleId')): s for s in root.iter(_w('style'))}
+    keep = {sid for sid, s in styles.items() if s.get(_w('default')) in ('1', 'true')}
+    todo = list(referenced | keep)
+    while todo:
+        sid = todo.pop()
+        style = styles.get(sid)
+        if style is None:
+            continue
+        keep.add(sid)
+        for tag in ('basedOn', 'link', 'next'):
+            ref = style.find(_w(tag))
+            if ref is not None and ref.get(_w('val')) not in keep:
+                todo.append(ref.get(_w('val')))
+
+    for sid, style in styles.items():
+        if sid not in keep:
+            root.remove(style)
+
+
+def prune_styles(zin):
+    """문서·번호 매기기에서 참조하지 않는 스타일 정의를 뺀 styles.xml 바이트"""
+    referenced = set()
+    for name in zin.namelist():
+        if name.startswith('word/') and name.endswith('.xml') and name != 'word/styles.xml':
+            referenced.update(m.decode() for m in STYLE_REF_RE.findall(zin.read(name)))
+    root = etree.fromstring(zin.read('word/styles.xml'))
+    _prune_style_element(root, referenced)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def prune_document(doc):
+    """doc.save() 전에 DOM 에서 쓰지 않는 스타일과 stylesWithEffects 관계를 걷어 낸다.
+    theme 은 스타일 정의가 글꼴을 참조하는지 저장 뒤에야 싸게 알 수 있으므로 repack() 에 맡긴다."""
+    styles = doc.styles.element
+    referenced = set()
+    for part in doc.part.package.iter_parts():
+        element = getattr(part, 'element', None)
+        if element is not None and element is not styles:
+            referenced.update(element.xpath(STYLE_REF_XPATH))
+    _prune_style_element(styles, referenced)
+    for rid, rel in list(doc.part.rels.items()):
+        if rel.reltype == RT_STYLES_WITH_EFFECTS:
+            doc.part.drop_rel(rid)
+
+
+def _drop_rels(data, rels_name, drop):
+    root = etree.fromstring(data)
+    base = _rels_source_dir(rels_name)
+    for rel in list(root.iter(f'{{{RELS_NS}}}Relationship')):
+        target = posixpath.normpath(posixpath.join(base, rel.get('Target')))
+        if rel.get('TargetMode') != 'External' and target in drop:
+            root.remove(rel)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _drop_overrides(data, drop):
+    root = etree.fromstring(data)
+    for override in list(root.iter(f'{{{CT_NS}}}Override')):
+        if override.get('PartName').lstrip('/') in drop:
+            root.remove(override)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def repack(path, level=DEFAULT_LEVEL, prune=True):
+    """path 의 DOCX 를 제자리에서 다시 압축. (원래 크기, 새 크기) 반환.
+    prune=False 면 스타일 정리는 건너뛴다 (prune_document() 로 이미 정리한 경우)."""
+    before = os.path.getsize(path)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with zipfile.ZipFile(path) as zin, zipfile.ZipFile(tmp, 'w') as zout:
+            styles_xml = prune_styles(zin) if prune else zin.read('word/styles.xml')
+            drop = unused_parts(zin, styles_xml)
+            for info in zin.infolist():
+                name = info.filename
+                if name in drop:
+                    continue
+                out = zipfile.ZipInfo(name, date_time=info.date_time)
+                out.external_attr = info.external_attr
+                if os.path.splitext(name)[1].lower() in STORED_EXTS:
+                    # 이미 압축된 미디어는 메모리에 올리지 않고 그대로 흘려 복사
+                    out.compress_type = zipfile.ZIP_STORED
+                    with zin.open(info) as src, zout.open(out, 'w') as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                    continue
+                if name == 'word/styles.xml':
+                    data = styles_xml
+                elif name.endswith('.rels'):
+                    data = _drop_rels(zin.read(name), name, drop)
+                elif name == '[Content_Types].xml':
+                    data = _drop_overrides(zin.read(name), drop)
+                else:
+                    data = zin.read(name)
+                zout.writestr(out, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=level)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return before, os.path.getsize(path)
@@ -0,0 +1,147 @@
+"""
+매뉴얼 빌드 프로파일링 + 용량 예산 검사
+--profile: 섹션(장)별 시간, 헬퍼 함수별 호출 수·누적 시간, 삽입 이미지별 바이트,
+           결과 DOCX 의 파트별 압축/원본 크기를 출력
+용량 예산: 결과 DOCX 가 예산을 넘으면 빌드를 실패 처리 (--profile 여부와 무관하게 항상 검사)
+"""
+
+import contextlib
+import functools
+import inspect
+import os
+import posixpath
+import re
+import time
+import zipfile
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*$', re.IGNORECASE)
+UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def parse_size(text):
+    """'2MB', '700KB', '1.5M', '123456' -> 바이트 수 (argparse type 으로 사용)"""
+    m = SIZE_RE.match(str(text))
+    if not m:
+        raise ValueError(f'크기 형식 오류: {text!r} (예: 2MB, 700KB)')
+    return int(float(m.group(1)) * UNITS[m.group(2).upper()])
+
+
+def format_size(n):
+    for unit, factor in (('MB', 1024 ** 2), ('KB', 1024)):
+        if n >= factor:
+            return f'{n / factor:.1f} {unit}'
+    return f'{n} B'
+
+
+class Profiler:
+    """헬퍼 함수 호출 시간과 빌드 단계 시간을 모은다. enabled=False 면 단계 시간만 잰다."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.calls = {}      # 함수 이름 -> [호출 수, 누적 초]
+        self.phases = []     # (단계 이름, 초)
+
+    def instrument(self, namespace):
+        """생성 스크립트 전역의 헬퍼 함수를 시간 측정 래퍼로 바꾼다.
+        그 모듈에서 정의한 함수 중 section_* / build_* / new_document 는 제외
+        (섹션 시간은 SectionCache 가 따로 잰다). 헬퍼 안에서 다른 헬퍼를 부르면 양쪽에 모두 포함된다.
+        """
+        if not self.enabled:
+            return
+        module = namespace['__name__']
+        for name, fn in list(namespace.items()):
+            if (inspect.isfunction(fn) and fn.__module__ == module
+                    and not name.startswith(('section_', 'build_')) and name != 'new_document'):
+                namespace[name] = self._wrap(name, fn)
+
+    def _wrap(self, name, fn):
+        stat = self.calls.setdefault(name, [0, 0.0])
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stat[0] += 1
+                stat[1] += time.perf_counter() - start
+        return timed
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    # ── 보고서 ────────────────────────────────────────────────
+
+    def report(self, sections, docx_path):
+        if not self.enabled:
+            return
+        print('\n── 빌드 단계 ──')
+        for name, seconds in self.phases:
+            print(f'  {name:24s} {seconds * 1000:9.1f} ms')
+
+        print('\n── 섹션별 시간 ──')
+        for name, seconds, reused in sections.timings:
+            print(f'  {name:24s} {seconds * 1000:9.1f} ms  {"캐시" if reused else "렌더링"}')
+
+        if self.calls:
+            print('\n── 헬퍼 함수 (호출 수 / 누적 시간, 중첩 호출 포함) ──')
+            for name, (count, seconds) in sorted(self.calls.items(), key=lambda kv: -kv[1][1]):
+                if count:
+                    print(f'  {name:24s} {count:5d}회 {seconds * 1000:9.1f} ms')
+
+        with zipfile.ZipFile(docx_path) as z:
+            infos = z.infolist()
+            images = embedded_images(z)
+        if images:
+            print('\n── 삽입 이미지 (문서 순서, ZIP 안에서 차지하는 크기) ──')
+            for descr, part, info in images:
+                print(f'  {descr:32s} {part:24s} {format_size(info.compress_size):>10s}')
+
+        print('\n── DOCX 파트 (압축 / 원본) ──')
+        for info in sorted(infos, key=lambda i: -i.compress_size):
+            print(f'  {info.filename:40s} {format_size(info.compress_size):>10s} / {format_size(info.file_size):>10s}')
+        print(f'  {"합계":40s} {format_size(sum(i.compress_size for i in infos)):>10s}'
+              f' / {format_size(sum(i.file_size for i in infos)):>10s}')
+
+
+def embedded_images(z):
+    """DOCX ZIP 에서 본문이 참조하는 이미지를 문서 순서대로 (설명, 파트 이름, ZipInfo) 로 반환.
+    같은 이미지를 여러 번 참조하면 처음 한 번만 센다 (두 번째부터는 용량이 늘지 않으므로)."""
+    rels = etree.fromstring(z.read('word/_rels/document.xml.rels'))
+    targets = {rel.get('Id'): posixpath.normpath(posixpath.join('word', rel.get('Target')))
+               for rel in rels.iter(f'{{{RELS_NS}}}Relationship')}
+    seen = set()
+    images = []
+    descr = None
+    with z.open('word/document.xml') as f:
+        for _, el in etree.iterparse(f, tag=(qn('wp:docPr'), qn('a:blip'))):
+            if el.tag == qn('wp:docPr'):
+                descr = el.get('descr') or el.get('name')
+                continue
+            part = targets.get(el.get(qn('r:embed')))
+            if part and part not in seen:
+                seen.add(part)
+                images.append((descr, part, z.getinfo(part)))
+    return images
+
+
+def check_budget(docx_path, budget):
+    """결과 DOCX 크기가 budget 바이트 이하인지 확인하고 결과를 출력. budget 이 0/None 이면 검사하지 않음"""
+    size = os.path.getsize(docx_path)
+    if not budget:
+        return True
+    if size > budget:
+        print(f'❌ 용량 예산 초과: {format_size(size)} > {format_size(budget)} ({docx_path})')
+        print('   --profile 로 큰 파트/이미지를 확인하세요. 예산을 바꾸려면 --max-size 를 지정하세요.')
+        return False
+    print(f'📦 DOCX 크기 {format_size(size)} (예산 {format_size(budget)})')
+    return True
@@ -0,0 +1,179 @@
+"""
+매뉴얼 스크린샷 변경 감지 - 픽셀 해시 인덱스
+capture-screenshots.js 는 매번 PNG 를 새로 쓰므로 화면이 같아도 파일 바이트가 달라진다.
+screenshot-list.json 의 스크린샷마다 디코딩한 픽셀의 sha256 을 구해 저장된 인덱스와 비교하고,
+픽셀이 하나라도 달라진 경우에만 새 내용 해시(digest)를 받아들인다.
+이미지 최적화 캐시와 섹션 캐시는 파일 바이트 대신 이 digest 를 키로 쓰므로,
+다시 캡처만 하고 화면이 그대로면 재인코딩·재렌더링이 일어나지 않는다.
+
+실행: python3 scripts/manual_screenshots.py   # 변경된 스크린샷 목록만 출력 (인덱스 갱신)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+from manual_images import Image, available, file_sha256
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCREENSHOT_LIST = os.path.join(BASE_DIR, 'manual-screenshots', 'screenshot-list.json')
+INDEX_PATH = os.path.join(BASE_DIR, '.manual-cache', 'screenshot-index.json')
+
+HASH_SIZE = 16       # dHash 격자 (16x16 = 256비트). 보고용 힌트일 뿐 변경 판정에는 쓰지 않는다
+INDEX_VERSION = 2    # 해시 방식을 바꾸면 올려서 인덱스를 다시 만든다
+
+
+def pixel_hash(im):
+    """디코딩한 RGBA 픽셀과 크기의 sha256. PNG 압축·메타데이터가 달라도 화면이 같으면 같은 값"""
+    h = hashlib.sha256(f'{im.size[0]}x{im.size[1]}:'.encode())
+    h.update(im.convert('RGBA').tobytes())
+    return h.hexdigest()
+
+
+def dhash(im, size=HASH_SIZE):
+    """dHash 16진 문자열. 흑백 (size+1)xsize 로 줄인 뒤 좌우 이웃 밝기 비교.
+    글자 단위 변경은 잡지 못하므로 변경 규모를 가늠하는 보고용으로만 쓴다."""
+    small = im.convert('L').resize((size + 1, size), Image.Resampling.LANCZOS)
+    px = small.tobytes()
+    bits = 0
+    for y in range(size):
+        row = px[y * (size + 1):(y + 1) * (size + 1)]
+        for x in range(size):
+            bits = (bits << 1) | (row[x] < row[x + 1])
+    return f'{bits:0{size * size // 4}x}'
+
+
+def distance(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+def _fingerprint(path):
+    """(파일 sha256, 픽셀 sha256, dHash) - 프로세스 풀에서 실행"""
+    with Image.open(path) as im:
+        return file_sha256(path), pixel_hash(im), dhash(im)
+
+
+class ScreenshotIndex:
+    """스크린샷 경로 -> 화면 내용 digest.
+
+    index = ScreenshotIndex()
+    index.refresh()          # 바뀐 스크린샷만 해시를 다시 구하고 인덱스 저장
+    index.digest(path)       # 캐시 키로 쓸 digest (목록에 없는 파일은 바이트 sha256)
+    index.changed            # 이번 refresh 에서 화면이 달라진 스크린샷 파일 이름
+    index.reencoded          # 바이트만 바뀌고 픽셀은 같은 스크린샷 파일 이름
+    index.hints              # 변경된 스크린샷의 dHash 비트 차이 (보고용, 이전 해시가 없으면 None)
+
+    digest 는 픽셀이 달라졌다고 판정한 시점의 파일 sha256 이다. 디코딩한 픽셀이 완전히
+    같은 재캡처만 이 값을 유지하므로 글자 하나만 바뀌어도 새 digest 가 되어 캐시가 갱신된다.
+    Pillow 가 없으면 바이트가 바뀐 파일은 모두 변경으로 본다.
+    """
+
+    def __init__(self, list_path=SCREENSHOT_LIST, index_path=INDEX_PATH):
+        self.list_path = list_path
+        self.dir = os.path.dirname(list_path)
+        self.index_path = index_path
+        self.entries = {}
+        self.changed = []
+        self.reencoded = []
+        self.hints = {}
+
+    def _listed(self):
+        """screenshot-list.json 의 스크린샷 파일 이름 (캡처한 기기의 절대 경로는 무시)"""
+        try:
+            with open(self.list_path, 'r', encoding='utf-8') as f:
+                shots = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return [os.path.basename(s.get('file') or f"{s['id']}.png") for s in shots]
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION or data.get('hash_size') != HASH_SIZE:
+            return {}
+        return data['screenshots']
+
+    def _save(self):
+        data = {'version': INDEX_VERSION, 'hash_size': HASH_SIZE, 'screenshots': self.entries}
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp = f'{self.index_path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.index_path)
+
+    def refresh(self, jobs=None):
+        """목록의 스크린샷을 인덱스와 비교해 갱신. 크기·수정 시각이 같으면 파일을 읽지 않고,
+        바이트가 바뀐 파일만 디코딩해 픽셀 해시를 구한다 (여러 개면 프로세스 풀에서 병렬)."""
+        old = self._load()
+        self.entries, self.changed, self.reencoded, self.hints = {}, [], [], {}
+        stale = []
+        for name in self._listed():
+            path = os.path.join(self.dir, name)
+            if not os.path.exists(path):
+                continue
+            st = os.stat(path)
+            stat = [st.st_size, st.st_mtime_ns]
+            entry = old.get(name)
+            if entry is not None and entry['stat'] == stat:
+                self.entries[name] = entry
+            else:
+                stale.append((name, path, stat))
+
+        if stale and available():
+            paths = [path for _, path, _ in stale]
+            if len(paths) > 1 and (jobs or os.cpu_count() or 1) > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+                    prints = list(pool.map(_fingerprint, paths))
+            else:
+                prints = [_fingerprint(p) for p in paths]
+        else:
+            prints = [(file_sha256(path), None, None) for _, path, _ in stale]
+
+        for (name, path, stat), (sha, pixels, hint) in zip(stale, prints):
+            entry = old.get(name)
+            if entry is not None and entry['bytes'] == sha:
+                entry = {**entry, 'stat': stat}                     # touch 만 됨
+            elif entry is not None and pixels is not None and entry['pixels'] == pixels:
+                entry = {**entry, 'bytes': sha, 'stat': stat, 'dhash': hint}   # 재인코딩: digest 유지
+                self.reencoded.append(name)
+            else:
+                if entry is not None and hint is not None and entry.get('dhash'):
+                    self.hints[name] = distance(entry['dhash'], hint)
+                else:
+                    self.hints[name] = None
+                entry = {'bytes': sha, 'stat': stat, 'pixels': pixels, 'dhash': hint, 'digest': sha}
+                self.changed.append(name)
+            self.entries[name] = entry
+        if stale or set(old) != set(self.entries):
+            self._save()
+        return self
+
+    def digest(self, path):
+        entry = self.entries.get(os.path.basename(path))
+        if entry is not None and os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.dir):
+            return entry['digest']
+        return file_sha256(path)
+
+    def summary(self):
+        same = len(self.entries) - len(self.changed) - len(self.reencoded)
+        return (f'스크린샷: 변경 {len(self.changed)}개 / 재캡처만 {len(self.reencoded)}개'
+                f' / 그대로 {same}개')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='스크린샷 픽셀 해시 인덱스 갱신 및 변경 목록 출력')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='해시 계산 워커 프로세스 수 (기본값: CPU 코어 수)')
+    args = parser.parse_args()
+    if not available():
+        print('⚠️  Pillow 미설치: 픽셀 해시 없이 파일 바이트로만 비교합니다 (pip install Pillow)')
+    index = ScreenshotIndex().refresh(args.jobs)
+    for name in index.changed:
+        hint = index.hints.get(name)
+        print(f'  변경: {name}' + (f' (dHash 차이 {hint}/{HASH_SIZE ** 2}비트)' if hint is not None else ''))
+    print(index.summary())
@@ -0,0 +1,150 @@
+"""
+매뉴얼 DOCX 스트리밍 저장
+python-docx 는 doc.save() 때까지 문서 DOM 전체와 모든 이미지 파트를 메모리에 들고 있으므로,
+섹션이 완성될 때마다 본문 요소를 word/document.xml 임시 파일에 이어 쓰고 DOM 에서 떼어 내며,
+이미지 파트는 곧바로 ZIP 에 기록한 뒤 패키지에서 놓아준다.
+문서 크기·이미지 수와 관계없이 메모리에는 현재 섹션 하나만 남는다.
+
+lxml.etree.xmlfile 은 떼어 낸 요소를 쓸 때마다 루트의 네임스페이스 선언을 전부 반복하고
+(단락 하나에 1 KB 가량) xml:space 를 ns0 접두사로 잘못 기록하므로, 요소를 직렬화한 뒤
+루트에서 이미 선언한 xmlns 만 첫 태그에서 걷어 내고 파일에 직접 이어 쓴다.
+"""
+
+import os
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PACKAGE_URI
+from docx.oxml.ns import qn
+from lxml import etree
+
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+XMLNS_RE = re.compile(rb' xmlns:(\w+)="([^"]*)"')
+
+
+class StreamingDocx:
+    """섹션 단위로 본문을 흘려 쓰는 DOCX 저장기.
+
+    with StreamingDocx(doc, path) as writer:
+        writer.write(elements)   # 완성된 본문 요소 (이미지 삽입까지 끝난 상태)
+    블록을 정상적으로 빠져나오면 나머지 파트(styles, settings 등)와 관계·콘텐츠 형식을
+    기록하고 path 로 옮긴다. 예외가 나면 임시 파일만 지운다.
+    """
+
+    def __init__(self, doc, path):
+        self.doc = doc
+        self.path = path
+        self.tmp_path = f'{path}.{os.getpid()}.tmp'
+        self.zip = zipfile.ZipFile(self.tmp_path, 'w', zipfile.ZIP_DEFLATED)
+        self.media = {}          # 이미지 sha1 -> (rId, ZIP 내부 이름)
+        self.media_types = {}    # 확장자 -> content type
+        self.next_pic_id = 1
+
+        root = doc.element
+        self.root_ns = {p.encode(): uri.encode() for p, uri in root.nsmap.items() if p}
+        start = etree.tostring(etree.Element(root.tag, dict(root.attrib), nsmap=root.nsmap),
+                               encoding='UTF-8', xml_declaration=False)
+        self.closing = f'</{root.prefix}:body></{root.prefix}:document>'.encode()
+
+        fd, self.xml_path = tempfile.mkstemp(prefix='manual-document-', suffix='.xml')
+        self.out = os.fdopen(fd, 'wb')
+        self.out.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        self.out.write(start[:-2] + f'><{root.prefix}:body>'.encode())
+
+    def write(self, elements):
+        """본문 요소를 document.xml 에 쓰고 DOM 과 패키지에서 떼어 낸다"""
+        part = self.doc.part
+        body = self.doc.element.body
+        dropped = set()
+        for el in elements:
+            for pr in el.iter(qn('wp:docPr')):
+                pr.set('id', str(self.next_pic_id))
+                pr.set('name', f'Picture {self.next_pic_id}')
+                self.next_pic_id += 1
+            for blip in el.iter(qn('a:blip')):
+                rid = blip.get(qn('r:embed'))
+                blip.set(qn('r:embed'), self._add_media(part.related_parts[rid]))
+                dropped.add(rid)
+            self._write_element(el)
+            body.remove(el)
+
+        image_parts = part.package.image_parts
+        for rid in dropped:
+            image_part = part.related_parts[rid]
+            part.drop_rel(rid)
+            # get_or_add_image() 의 sha1 중복 검사 목록도 파트를 잡고 있으므로 함께 뺀다
+            if image_part in image_parts:
+                image_parts._image_parts.remove(image_part)
+
+    def _write_element(self, el):
+        data = etree.tostring(el, encoding='UTF-8', xml_declaration=False)
+        end = data.index(b'>')
+        head = XMLNS_RE.sub(lambda m: b'' if self.root_ns.get(m[1]) == m[2] else m[0], data[:end])
+        self.out.write(head + data[end:])
+
+    def _add_media(self, image_part):
+        if image_part.sha1 not in self.media:
+            n = len(self.media) + 1
+            ext = image_part.partname.ext
+            name = f'media/image{n}.{ext}'
+            # 이미지는 이미 압축돼 있으므로 deflate 하지 않는다
+            self.zip.writestr(f'word/{name}', image_part.blob, compress_type=zipfile.ZIP_STORED)
+            self.media[image_part.sha1] = (f'rIdStream{n}', name)
+            self.media_types[ext] = image_part.content_type
+        return self.media[image_part.sha1][0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write_element(self.doc.element.body.sectPr)
+                self.out.write(self.closing)
+                self.out.close()
+                self._write_package()
+                self.zip.close()
+                os.replace(self.tmp_path, self.path)
+        finally:
+            self.out.close()
+            self.zip.close()
+            os.remove(self.xml_path)
+            if os.path.exists(self.tmp_path):
+                os.remove(self.tmp_path)
+
+    def _write_package(self):
+        package = self.doc.part.package
+        main = self.doc.part
+        self.zip.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+        overrides = []
+        for part in package.iter_parts():
+            overrides.append((part.partname, part.content_type))
+            if part is main:
+                self.zip.write(self.xml_path, part.partname.membername)
+                self.zip.writestr(part.partname.rels_uri.membername, self._main_rels_xml())
+                continue
+            self.zip.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                self.zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        self.zip.writestr('[Content_Types].xml', self._content_types_xml(overrides))
+
+    def _main_rels_xml(self):
+        """document.xml.rels: 남은 관계 + 스트리밍으로 기록한 이미지 관계"""
+        root = etree.fromstring(self.doc.part.rels.xml)
+        for rid, name in self.media.values():
+            etree.SubElement(root, f'{{{RELS_NS}}}Relationship', Id=rid, Type=RT.IMAGE, Target=name)
+        return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    def _content_types_xml(self, overrides):
+        defaults = {'rels': CT.OPC_RELATIONSHIPS, 'xml': CT.XML, **self.media_types}
+        items = [f'<Default Extension={quoteattr(ext)} ContentType={quoteattr(ct)}/>'
+                 for ext, ct in defaults.items()]
+        items += [f'<Override PartName={quoteattr(name)} ContentType={quoteattr(ct)}/>'
+                  for name, ct in overrides]
+        return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<Types xmlns="{CT_NS}">{"".join(items)}</Types>')
@@ -0,0 +1,74 @@
+"""
+매뉴얼 DOCX 공용 스타일 레지스트리
+각 생성 스크립트가 스타일 정의를 넘기면 문서 시작 시 한 번만 만들고,
+헬퍼 함수는 run 마다 서식을 지정하는 대신 스타일 이름만 참조한다.
+"""
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+# w:pPr 안에서 w:shd 뒤에 와야 하는 요소들 (스키마 순서)
+_SHD_SUCCESSORS = (
+    'w:tabs', 'w:suppressAutoHyphens', 'w:kinsoku', 'w:wordWrap', 'w:overflowPunct',
+    'w:topLinePunct', 'w:autoSpaceDE', 'w:autoSpaceDN', 'w:bidi', 'w:adjustRightInd',
+    'w:snapToGrid', 'w:spacing', 'w:ind', 'w:contextualSpacing', 'w:mirrorIndents',
+    'w:suppressOverlap', 'w:jc', 'w:textDirection', 'w:textAlignment',
+    'w:textboxTightWrap', 'w:outlineLvl', 'w:divId', 'w:cnfStyle', 'w:rPr',
+    'w:sectPr', 'w:pPrChange',
+)
+
+
+def register_styles(doc, specs):
+    """
+    specs = {스타일 이름: 속성 dict, ...}
+    이미 있는 스타일(Heading 1 등)은 지정한 속성만 덮어쓰고, 없으면 새로 만든다.
+    속성: type ('paragraph' | 'character', 기본 paragraph), base, font, size, bold,
+          italic, color, alignment, left_indent, space_before, space_after,
+          shading (배경색 hex)
+    """
+    styles = doc.styles
+    for name, spec in specs.items():
+        character = spec.get('type') == 'character'
+        try:
+            style = styles[name]
+        except KeyError:
+            kind = WD_STYLE_TYPE.CHARACTER if character else WD_STYLE_TYPE.PARAGRAPH
+            style = styles.add_style(name, kind)
+            default_base = 'Default Paragraph Font' if character else 'Normal'
+            style.base_style = styles[spec.get('base', default_base)]
+
+        font = style.font
+        if 'font' in spec:
+            font.name = spec['font']
+        if 'size' in spec:
+            font.size = spec['size']
+        if 'bold' in spec:
+            font.bold = spec['bold']
+        if 'italic' in spec:
+            font.italic = spec['italic']
+        if 'color' in spec:
+            font.color.rgb = spec['color']
+
+        if character:
+            continue
+        fmt = style.paragraph_format
+        if 'alignment' in spec:
+            fmt.alignment = spec['alignment']
+        if 'left_indent' in spec:
+            fmt.left_indent = spec['left_indent']
+        if 'space_before' in spec:
+            fmt.space_before = spec['space_before']
+        if 'space_after' in spec:
+            fmt.space_after = spec['space_after']
+        if 'shading' in spec:
+            shd = OxmlElement('w:shd')
+            shd.set(qn('w:val'), 'clear')
+            shd.set(qn('w:color'), 'auto')
+            shd.set(qn('w:fill'), spec['shading'])
+            style.element.get_or_add_pPr().insert_element_before(shd, *_SHD_SUCCESSORS)
+
+
+def style_id(doc, name):
+    """XML 에서 w:pStyle / w:rStyle 로 참조할 스타일 ID"""
+    return doc.styles[name].style_id